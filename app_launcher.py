@@ -0,0 +1,381 @@
+import os
+import sys
+import time
+import subprocess
+import ctypes
+from PySide6.QtCore import QObject, QTimer, Signal
+import job_pool
+
+# How often running processes are polled for their exit code.
+POLL_INTERVAL_MS = 1000
+# While an app is starting it is checked this often for going idle...
+SETTLE_POLL_MS = 100
+# ...and given up on after this long.
+SETTLE_TIMEOUT_MS = 30000
+# Finished launches kept around for running_records()/history().
+MAX_HISTORY = 50
+
+ERROR_ELEVATION_REQUIRED = 740
+WAIT_TIMEOUT = 0x102
+# A process using less CPU than this (percent of one core) counts as idle.
+IDLE_CPU_PERCENT = 5.0
+
+
+class ElevationRequired(OSError):
+    """The exe needs admin rights and the caller asked not to elevate."""
+
+
+def _path_key(exe_path):
+    return os.path.normcase(os.path.normpath(exe_path or ""))
+
+
+class ProcessBackend:
+    """
+    How LauncherService starts and inspects processes. spawn() runs on a
+    job-pool thread and focus() on the GUI thread. poll() and is_idle() are
+    called on the GUI thread by LauncherService and on a job-pool thread by
+    the startup orchestrator, so they must not block and must not keep
+    shared per-process state. Swap in another backend (e.g. a fake in
+    tests, or on a platform without the Win32 calls) with
+    LauncherService.set_backend().
+    """
+
+    name = "base"
+
+    def spawn(self, exe_path, cwd, elevate=True):
+        """
+        Start exe_path; return a handle, or None if it started but cannot be
+        tracked. With elevate False, raise ElevationRequired instead of
+        starting an app that needs admin rights untracked.
+        """
+        raise OSError(f"The {self.name} process backend cannot start {exe_path}")
+
+    def pid(self, handle):
+        return None
+
+    def poll(self, handle):
+        """Exit code, or None while the process runs."""
+        return None
+
+    def focus(self, pid):
+        """Bring a window of process pid (or its children) to the front. True if one was found."""
+        return False
+
+    def is_idle(self, handle, samples):
+        """
+        True once a started process has settled, False while busy, None if
+        it cannot tell. samples is a dict owned by the caller for readings
+        that span calls (CPU use over time), so each caller measures its own
+        window.
+        """
+        return None
+
+
+class SubprocessBackend(ProcessBackend):
+    """subprocess.Popen, with a UAC re-launch and Win32 window focusing on Windows."""
+
+    name = "subprocess"
+
+    def spawn(self, exe_path, cwd, elevate=True):
+        try:
+            return subprocess.Popen(exe_path, cwd=cwd)
+        except OSError as e:
+            # The app requires elevation: re-run with the UAC prompt. The
+            # elevated process is not ours to wait on, so it goes untracked.
+            if getattr(e, "winerror", None) != ERROR_ELEVATION_REQUIRED:
+                raise
+            if not elevate:
+                raise ElevationRequired(f"{exe_path} requires administrator rights") from e
+            ctypes.windll.shell32.ShellExecuteW(None, "runas", exe_path, None, cwd, 1)
+            return None
+
+    def pid(self, handle):
+        return handle.pid
+
+    def poll(self, handle):
+        return handle.poll()
+
+    def is_idle(self, handle, samples):
+        if sys.platform == "win32":
+            try:
+                # 0 once the app waits for input; WAIT_TIMEOUT while it is still starting.
+                # Console apps have no input queue and fail, so fall through to CPU use.
+                result = ctypes.windll.user32.WaitForInputIdle(int(handle._handle), 0)
+                if result == 0:
+                    return True
+                if result == WAIT_TIMEOUT:
+                    return False
+            except Exception:
+                pass
+        return self._cpu_idle(handle.pid, samples)
+
+    @staticmethod
+    def _cpu_idle(pid, samplers):
+        try:
+            import psutil  # type: ignore
+        except Exception:
+            return None
+        try:
+            process = samplers.get(pid)
+            if process is None:
+                # The first reading only starts the measurement.
+                process = samplers[pid] = psutil.Process(pid)
+                process.cpu_percent(None)
+                return False
+            return process.cpu_percent(None) < IDLE_CPU_PERCENT
+        except Exception:
+            samplers.pop(pid, None)
+            return None
+
+    def focus(self, pid):
+        if sys.platform != "win32" or not pid:
+            return False
+        pids = {pid}
+        try:
+            import psutil  # type: ignore
+            # PortableApps launchers stay alive but the window belongs to the app they started.
+            pids.update(child.pid for child in psutil.Process(pid).children(recursive=True))
+        except Exception:
+            pass
+        user32 = ctypes.windll.user32
+        found = []
+
+        @ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+        def _enum(hwnd, _lparam):
+            if not user32.IsWindowVisible(hwnd) or user32.GetWindow(hwnd, 4):  # GW_OWNER
+                return True
+            owner = ctypes.c_ulong()
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner))
+            if owner.value in pids and user32.GetWindowTextLengthW(hwnd) > 0:
+                found.append(hwnd)
+                return False
+            return True
+
+        try:
+            user32.EnumWindows(_enum, 0)
+            if not found:
+                return False
+            hwnd = found[0]
+            if user32.IsIconic(hwnd):
+                user32.ShowWindow(hwnd, 9)  # SW_RESTORE
+            user32.SetForegroundWindow(hwnd)
+            return True
+        except Exception as e:
+            print(f"Error focusing process {pid}: {e}")
+            return False
+
+
+class LaunchRecord:
+    """
+    One launched process. app_path is the catalog exe it stands for, which
+    differs from exe_path when a copy was started (turbo mirrors).
+    exit_code and ended_at stay None while it runs; idle_ms is the time from
+    launch until the backend saw it go idle, if it could tell.
+    """
+
+    def __init__(self, exe_path, handle, pid, started_at, app_path=None):
+        self.exe_path = exe_path
+        self.app_path = app_path or exe_path
+        self.handle = handle
+        self.pid = pid
+        self.started_at = started_at
+        self.ended_at = None
+        self.exit_code = None
+        self.idle_ms = None
+        # Set instead of starting anything when launch(elevate=False) hit a UAC app.
+        self.needs_elevation = False
+
+    @property
+    def tracked(self):
+        return self.handle is not None
+
+    @property
+    def running(self):
+        return self.tracked and self.ended_at is None
+
+    def uptime(self):
+        end = self.ended_at if self.ended_at is not None else time.time()
+        return max(0.0, end - self.started_at)
+
+
+class LauncherService(QObject):
+    """
+    Starts apps off the GUI thread and keeps track of what it started.
+    launch() checks the path and creates the process on a job-pool thread;
+    running processes are polled for their exit code, and views listen to
+    running_changed to show which apps are open.
+    """
+
+    launched = Signal(object)
+    failed = Signal(str, str)
+    exited = Signal(object)
+    # A launched app finished starting up; record.idle_ms is set.
+    settled = Signal(object)
+    running_changed = Signal(str)
+    # launch(elevate=False) found the app needs admin rights; nothing was started.
+    elevation_required = Signal(object)
+
+    def __init__(self, parent=None, backend=None):
+        super().__init__(parent)
+        self.backend = backend or SubprocessBackend()
+        self._records = {}
+        self._history = []
+        self._launching = set()
+        # Bumped on every start/exit so menus can tell they are stale.
+        self.version = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_INTERVAL_MS)
+        self._timer.timeout.connect(self._poll)
+        self._settling = []
+        # is_idle() readings for the records in _settling, by pid.
+        self._idle_samples = {}
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setInterval(SETTLE_POLL_MS)
+        self._settle_timer.timeout.connect(self._check_settled)
+
+    def set_backend(self, backend):
+        self.backend = backend
+
+    def launch(self, exe_path, app_path=None, elevate=True):
+        """
+        Start exe_path, tracked as app_path (default: exe_path). Returns the
+        Job, or None if the same app is already being started. With elevate
+        False an app that needs admin rights is not started (it could not be
+        tracked); elevation_required is emitted instead.
+        """
+        app_path = app_path or exe_path
+        key = _path_key(app_path)
+        if key in self._launching:
+            return None
+        self._launching.add(key)
+        job = job_pool.submit(self._spawn, exe_path, self.backend, app_path, elevate, priority=job_pool.PRIORITY_UI, name="launch_app")
+        job.finished.connect(self._on_spawned)
+        job.failed.connect(lambda error, app_path=app_path: self._on_spawn_failed(app_path, error))
+        job.cancelled.connect(lambda key=key: self._launching.discard(key))
+        return job
+
+    @staticmethod
+    def _spawn(exe_path, backend, app_path=None, elevate=True):
+        # Runs on a pool thread: the stat and CreateProcess can both stall on a slow stick.
+        if not exe_path or not os.path.isfile(exe_path):
+            raise FileNotFoundError(f"{exe_path} does not exist")
+        started_at = time.time()
+        try:
+            handle = backend.spawn(exe_path, os.path.dirname(exe_path), elevate)
+        except ElevationRequired:
+            record = LaunchRecord(exe_path, None, None, started_at, app_path)
+            record.needs_elevation = True
+            return record
+        pid = backend.pid(handle) if handle is not None else None
+        return LaunchRecord(exe_path, handle, pid, started_at, app_path)
+
+    def _on_spawned(self, record):
+        if record.needs_elevation:
+            self._launching.discard(_path_key(record.app_path))
+            self.elevation_required.emit(record)
+            return
+        self.track(record)
+
+    def track(self, record):
+        """Take over a LaunchRecord spawned outside launch()."""
+        key = _path_key(record.app_path)
+        self._launching.discard(key)
+        if record.tracked:
+            self._records.setdefault(key, []).append(record)
+            if not self._timer.isActive():
+                self._timer.start()
+            self._settling.append(record)
+            if not self._settle_timer.isActive():
+                self._settle_timer.start()
+            self.version += 1
+            self.running_changed.emit(record.app_path)
+        else:
+            self._remember(record)
+        self.launched.emit(record)
+
+    def _on_spawn_failed(self, exe_path, error):
+        self._launching.discard(_path_key(exe_path))
+        self.failed.emit(exe_path, error)
+
+    def _poll(self):
+        ended = []
+        for key, records in list(self._records.items()):
+            still_running = []
+            for record in records:
+                try:
+                    code = self.backend.poll(record.handle)
+                except Exception as e:
+                    print(f"Error polling {record.exe_path}: {e}")
+                    code = -1
+                if code is None:
+                    still_running.append(record)
+                    continue
+                record.exit_code = code
+                record.ended_at = time.time()
+                record.handle = None
+                self._remember(record)
+                ended.append(record)
+            if len(still_running) != len(records):
+                if still_running:
+                    self._records[key] = still_running
+                else:
+                    del self._records[key]
+                self.version += 1
+                self.running_changed.emit(records[0].app_path)
+        if not self._records:
+            self._timer.stop()
+        # After the bookkeeping, so listeners see is_running() without them.
+        for record in ended:
+            self.exited.emit(record)
+
+    def _check_settled(self):
+        now = time.time()
+        for record in list(self._settling):
+            idle = None
+            if record.handle is not None:
+                try:
+                    idle = self.backend.is_idle(record.handle, self._idle_samples)
+                except Exception:
+                    idle = None
+            elapsed_ms = (now - record.started_at) * 1000.0
+            if idle:
+                record.idle_ms = elapsed_ms
+                self._settling.remove(record)
+                self._idle_samples.pop(record.pid, None)
+                self.settled.emit(record)
+            elif idle is None or elapsed_ms >= SETTLE_TIMEOUT_MS:
+                self._settling.remove(record)
+                self._idle_samples.pop(record.pid, None)
+        if not self._settling:
+            self._settle_timer.stop()
+
+    def _remember(self, record):
+        self._history.append(record)
+        del self._history[:-MAX_HISTORY]
+
+    def is_launching(self, exe_path):
+        return _path_key(exe_path) in self._launching
+
+    def is_settling(self, record):
+        """True while record's app is still being watched for going idle."""
+        return record in self._settling
+
+    def is_running(self, exe_path):
+        return bool(self._records.get(_path_key(exe_path)))
+
+    def running_records(self, exe_path=None):
+        """LaunchRecords still running, for one app or all of them."""
+        if exe_path is not None:
+            return list(self._records.get(_path_key(exe_path), []))
+        return [record for records in self._records.values() for record in records]
+
+    def history(self):
+        """Finished (and untracked) launches, oldest first."""
+        return list(self._history)
+
+    def focus(self, exe_path):
+        """Bring a running instance of exe_path to the front. True if one was focused."""
+        for record in reversed(self.running_records(exe_path)):
+            if self.backend.focus(record.pid):
+                return True
+        return False
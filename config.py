@@ -163,6 +163,10 @@ def get_category_icon_path(category):
         return fallback
     return ""
 
+def stats_enabled():
+    # --stats prints session statistics (settings writes, prefetch, startup apps) to the console.
+    return "--stats" in sys.argv
+
 def get_base_dir():
     # When frozen, assets live alongside the .exe.
     if getattr(sys, "frozen", False):
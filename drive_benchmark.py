@@ -0,0 +1,300 @@
+import os
+import sys
+import json
+import mmap
+import time
+import random
+import shutil
+import ctypes
+import tempfile
+from config import *
+import job_pool
+from host_cache import volume_id
+
+RESULTS_FILENAME = "drive_benchmarks.json"
+# Results kept per drive for trend comparison.
+MAX_RESULTS = 20
+
+# The launch targets NOTICE_BODY recommends.
+TARGET_READ_MBPS = 100.0
+TARGET_WRITE_MBPS = 50.0
+
+DEFAULT_SIZE_MB = 64
+BLOCK_BYTES = 1024 * 1024
+RANDOM_BLOCK_BYTES = 4096
+RANDOM_MAX_OPS = 4000
+RANDOM_MAX_SECONDS = 3.0
+SMALL_FILES = 200
+SMALL_FILE_BYTES = 4096
+
+GENERIC_READ = 0x80000000
+GENERIC_WRITE = 0x40000000
+FILE_SHARE_READ = 0x1
+OPEN_ALWAYS = 4
+FILE_FLAG_WRITE_THROUGH = 0x80000000
+FILE_FLAG_NO_BUFFERING = 0x20000000
+
+
+class _OVERLAPPED(ctypes.Structure):
+    _fields_ = [
+        ("Internal", ctypes.c_void_p),
+        ("InternalHigh", ctypes.c_void_p),
+        ("Offset", ctypes.c_ulong),
+        ("OffsetHigh", ctypes.c_ulong),
+        ("hEvent", ctypes.c_void_p),
+    ]
+
+
+class _BenchFile:
+    """
+    Positional reads/writes that bypass the OS cache where the platform
+    allows it (FILE_FLAG_NO_BUFFERING on Windows, O_DIRECT elsewhere).
+    direct says whether that worked; without it writes are synced and the
+    cache is dropped before reading, as far as the OS lets us.
+    Buffers must come from _aligned() when direct is on.
+    """
+
+    def __init__(self, path, direct=True):
+        self.path = path
+        self.direct = False
+        self._handle = None
+        self._fd = None
+        if sys.platform == "win32":
+            self._open_win(path, direct)
+        else:
+            self._open_posix(path, direct)
+
+    def _open_win(self, path, direct):
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateFileW.restype = ctypes.c_void_p
+        flags = FILE_FLAG_WRITE_THROUGH | (FILE_FLAG_NO_BUFFERING if direct else 0)
+        handle = kernel32.CreateFileW(path, GENERIC_READ | GENERIC_WRITE, FILE_SHARE_READ, None, OPEN_ALWAYS, flags, None)
+        if handle in (None, ctypes.c_void_p(-1).value):
+            raise OSError(f"Cannot open {path} (error {kernel32.GetLastError()})")
+        self._handle = handle
+        self.direct = direct
+
+    def _open_posix(self, path, direct):
+        flags = os.O_RDWR | os.O_CREAT
+        if direct and hasattr(os, "O_DIRECT"):
+            try:
+                self._fd = os.open(path, flags | os.O_DIRECT, 0o600)
+                self.direct = True
+                return
+            except OSError:
+                pass  # e.g. tmpfs; fall back to synced, cache-dropped I/O
+        self._fd = os.open(path, flags, 0o600)
+
+    def _win_io(self, write, buf, offset):
+        kernel32 = ctypes.windll.kernel32
+        overlapped = _OVERLAPPED()
+        overlapped.Offset = offset & 0xFFFFFFFF
+        overlapped.OffsetHigh = offset >> 32
+        done = ctypes.c_ulong()
+        address = ctypes.c_char.from_buffer(buf)
+        call = kernel32.WriteFile if write else kernel32.ReadFile
+        ok = call(ctypes.c_void_p(self._handle), ctypes.byref(address), len(buf), ctypes.byref(done), ctypes.byref(overlapped))
+        del address
+        if not ok:
+            raise OSError(f"{'Write' if write else 'Read'} failed on {self.path} (error {kernel32.GetLastError()})")
+        return done.value
+
+    def pwrite(self, buf, offset):
+        if self._handle is not None:
+            return self._win_io(True, buf, offset)
+        return os.pwrite(self._fd, buf, offset)
+
+    def pread(self, buf, offset):
+        if self._handle is not None:
+            return self._win_io(False, buf, offset)
+        return os.preadv(self._fd, [buf], offset)
+
+    def sync(self):
+        if self._handle is not None:
+            ctypes.windll.kernel32.FlushFileBuffers(ctypes.c_void_p(self._handle))
+        else:
+            os.fsync(self._fd)
+
+    def drop_cache(self):
+        if self.direct or self._fd is None or not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+    def close(self):
+        if self._handle is not None:
+            ctypes.windll.kernel32.CloseHandle(ctypes.c_void_p(self._handle))
+            self._handle = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _aligned(size):
+    """A page-aligned, writable buffer (anonymous mmap), as direct I/O needs."""
+    buf = mmap.mmap(-1, size)
+    buf.write(os.urandom(min(size, 65536)) * (size // min(size, 65536)))
+    return buf
+
+
+def run_benchmark(directory=None, size_mb=DEFAULT_SIZE_MB, token=None):
+    """
+    Measure the drive holding directory (default: the base dir) with a
+    temporary file and folder there: sequential write and read in 1 MiB
+    blocks, 4 KiB random reads at queue depth one, and creating, stat-ing
+    and deleting small files. Returns a result dict, or None if cancelled.
+    """
+    directory = directory or get_base_dir()
+    size = max(1, int(size_mb)) * BLOCK_BYTES
+    if shutil.disk_usage(directory).free < size * 2:
+        raise OSError("Not enough free space on the drive for the benchmark")
+    work_dir = tempfile.mkdtemp(prefix=".portablex-bench-", dir=directory)
+    result = {"at": int(time.time()), "volume": volume_id(directory), "size_mb": size // BLOCK_BYTES}
+
+    def _cancelled():
+        return token is not None and token.is_cancelled()
+
+    try:
+        path = os.path.join(work_dir, "seq.bin")
+        block = _aligned(BLOCK_BYTES)
+        bench = _BenchFile(path)
+        try:
+            result["direct"] = bench.direct
+            started = time.perf_counter()
+            for offset in range(0, size, BLOCK_BYTES):
+                if _cancelled():
+                    return None
+                bench.pwrite(block, offset)
+            bench.sync()
+            result["seq_write_mbps"] = size / BLOCK_BYTES / max(1e-6, time.perf_counter() - started)
+
+            bench.drop_cache()
+            started = time.perf_counter()
+            for offset in range(0, size, BLOCK_BYTES):
+                if _cancelled():
+                    return None
+                bench.pread(block, offset)
+            result["seq_read_mbps"] = size / BLOCK_BYTES / max(1e-6, time.perf_counter() - started)
+
+            bench.drop_cache()
+            small = _aligned(RANDOM_BLOCK_BYTES)
+            blocks = size // RANDOM_BLOCK_BYTES
+            ops = 0
+            started = time.perf_counter()
+            while ops < RANDOM_MAX_OPS and time.perf_counter() - started < RANDOM_MAX_SECONDS:
+                if _cancelled():
+                    return None
+                bench.pread(small, random.randrange(blocks) * RANDOM_BLOCK_BYTES)
+                ops += 1
+            elapsed = max(1e-6, time.perf_counter() - started)
+            result["rand_read_iops"] = ops / elapsed
+            result["rand_read_mbps"] = ops * RANDOM_BLOCK_BYTES / BLOCK_BYTES / elapsed
+        finally:
+            bench.close()
+
+        # Small files: what scanning AppInfo folders and app settings costs.
+        files_dir = os.path.join(work_dir, "files")
+        os.makedirs(files_dir)
+        payload = os.urandom(SMALL_FILE_BYTES)
+        started = time.perf_counter()
+        names = []
+        for index in range(SMALL_FILES):
+            if _cancelled():
+                return None
+            name = os.path.join(files_dir, f"f{index}.ini")
+            with open(name, "wb") as f:
+                f.write(payload)
+            names.append(name)
+        for name in names:
+            os.stat(name)
+        for name in names:
+            os.remove(name)
+        result["small_files_per_s"] = SMALL_FILES / max(1e-6, time.perf_counter() - started)
+        return result
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+_results = None
+
+
+def _results_path():
+    return os.path.join(get_data_dir(), RESULTS_FILENAME)
+
+
+def load_results():
+    """{volume id: [results, oldest first]} (read once, then kept in memory)."""
+    global _results
+    if _results is None:
+        try:
+            with open(_results_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _results = data.get("volumes", {}) if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            _results = {}
+    return _results
+
+
+def history(directory=None):
+    return list(load_results().get(volume_id(directory or get_base_dir()), []))
+
+
+def latest(directory=None):
+    results = history(directory)
+    return results[-1] if results else None
+
+
+def save_result(result):
+    """Add a result to its drive's history and write the file on the job pool."""
+    results = load_results()
+    entries = results.setdefault(result.get("volume", ""), [])
+    entries.append(result)
+    del entries[:-MAX_RESULTS]
+    payload = json.dumps({"version": 1, "volumes": results})
+    job_pool.submit(_write_results, _results_path(), payload, name="benchmark_save", key="benchmark_save")
+
+
+def _write_results(path, payload):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def parallelism(directory=None):
+    """
+    How many readers the drive handles well, from its last benchmark's
+    random-read rate, or None if it was never measured. Sticks that manage
+    a few hundred 4K reads a second gain nothing from parallel reads.
+    """
+    result = latest(directory)
+    if not result or "rand_read_iops" not in result:
+        return None
+    iops = result["rand_read_iops"]
+    if iops >= 2000:
+        return 8
+    if iops >= 500:
+        return 4
+    if iops >= 150:
+        return 2
+    return 1
+
+
+def summary(result, previous=None):
+    """One line for the Storage card, with the change since previous and a note below target."""
+    if not result:
+        return "Not measured yet"
+    text = (
+        f"Seq {result['seq_read_mbps']:.0f} MB/s read, {result['seq_write_mbps']:.0f} MB/s write · "
+        f"4K {result['rand_read_iops']:.0f} IOPS · {result['small_files_per_s']:.0f} files/s"
+    )
+    if previous and previous.get("seq_read_mbps"):
+        change = (result["seq_read_mbps"] / previous["seq_read_mbps"] - 1.0) * 100.0
+        text += f" ({change:+.0f}% read vs last)"
+    if result["seq_read_mbps"] < TARGET_READ_MBPS or result["seq_write_mbps"] < TARGET_WRITE_MBPS:
+        text += f"\nBelow the recommended {TARGET_READ_MBPS:.0f}/{TARGET_WRITE_MBPS:.0f} MB/s; apps will launch slowly."
+    if not result.get("direct", True):
+        text += "\nOS cache could not be bypassed; figures may be optimistic."
+    return text
@@ -1,114 +1,173 @@
 import os
 import sys
-import configparser
-import shutil
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import settings_store
+
+# Only keys that point at launchable files are case-fixed.
+FIX_EXTENSIONS = (".exe", ".bat")
+SKIP_DIRS = {"__pycache__", ".git", "videos", "pictures", "music", "downloads", "documents"}
+# Below this many keys the thread pool costs more than it saves.
+PARALLEL_THRESHOLD = 32
+MAX_WORKERS = 8
 
 def get_base_dir():
     if getattr(sys, "frozen", False):
         return os.path.dirname(sys.executable)
     return os.path.dirname(os.path.abspath(__file__))
 
-def fix_settings():
-    # Define the base directory relative to this script
+class PathResolver:
+    """
+    Resolve relative paths case-insensitively by listing only the directories
+    along each path. Listings are cached, so keys sharing a folder (every key
+    under PortableApps/, an app's bin/ folder...) cost one listdir in total.
+    """
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self._listings = {}
+        self._lock = threading.Lock()
+        self.listdir_count = 0
+
+    def _listing(self, directory):
+        with self._lock:
+            listing = self._listings.get(directory)
+        if listing is not None:
+            return listing
+        listing = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    listing.setdefault(entry.name.lower(), (entry.name, entry.is_dir()))
+        except OSError:
+            pass
+        with self._lock:
+            self.listdir_count += 1
+            self._listings[directory] = listing
+        return listing
+
+    def resolve(self, rel_path):
+        """Return the on-disk casing of rel_path (forward slashes), or None."""
+        parts = [p for p in rel_path.replace("\\", "/").split("/") if p and p != "."]
+        if not parts or ".." in parts:
+            return None
+        directory = self.base_dir
+        actual = []
+        for index, part in enumerate(parts):
+            match = self._listing(directory).get(part.lower())
+            if match is None:
+                return None
+            name, is_dir = match
+            is_last = index == len(parts) - 1
+            if is_last == is_dir:
+                return None
+            if not is_last and name.lower() in SKIP_DIRS:
+                return None
+            actual.append(name)
+            directory = os.path.join(directory, name)
+        return "/".join(actual)
+
+def _candidate_keys(config):
+    keys = set()
+    for section in config.sections():
+        for key in config[section]:
+            # Check if this key looks like a path to something launchable
+            if ("/" in key or "\\" in key) and key.lower().endswith(FIX_EXTENSIONS):
+                keys.add(key)
+    return keys
+
+def _format_diff(changes):
+    lines = []
+    for section, old_key, new_key in changes:
+        lines.append(f"[{section}]")
+        lines.append(f"- {old_key}")
+        lines.append(f"+ {new_key}")
+    return "\n".join(lines)
+
+def fix_settings(dry_run=False):
+    """
+    Fix the casing/slashes of path keys in settings.ini so they match the
+    files on disk. With dry_run nothing is written; the result's "changes"
+    lists (section, old_key, new_key) and "diff" renders them.
+    """
+    started = time.perf_counter()
     base_dir = get_base_dir()
     settings_path = os.path.join(base_dir, "PortableApps", "PortableX", "Data", "settings.ini")
-    
+
     if not os.path.exists(settings_path):
         msg = "settings.ini not found."
         print(msg)
-        return {"fixed": 0, "message": msg, "changed": False}
+        return {"fixed": 0, "message": msg, "changed": False, "changes": [], "diff": ""}
 
     print(f"Processing {settings_path}...")
 
-    # 1. Build a map of lowercase relative paths to actual relative paths
-    # We scan the base directory to find all executables and batch files
-    path_map = {} # lowercase_rel_path (forward slash) -> actual_rel_path (forward slash)
-
-    print("Scanning for applications...")
-    scan_roots = []
-    portableapps_dir = os.path.join(base_dir, "PortableApps")
-    if os.path.exists(portableapps_dir):
-        scan_roots.append(portableapps_dir)
-    else:
-        scan_roots.append(base_dir)
-
-    skip_dirs = {"__pycache__", ".git", "Videos", "Pictures", "Music", "Downloads", "documents"}
-
-    for scan_root in scan_roots:
-        for root, dirs, files in os.walk(scan_root):
-        # Skip some directories if needed
-            dirs[:] = [d for d in dirs if d not in skip_dirs]
-
-            for name in files:
-                # We are interested in .exe and .bat files as they are likely keys
-                if name.lower().endswith(".exe") or name.lower().endswith(".bat"):
-                    full_path = os.path.join(root, name)
-                    try:
-                        # Get relative path
-                        rel_path = os.path.relpath(full_path, base_dir)
-                        # Normalize to forward slashes for consistency
-                        rel_path_fwd = rel_path.replace("\\", "/")
-
-                        path_map[rel_path_fwd.lower()] = rel_path_fwd
-                    except ValueError:
-                        pass
-
-    # 2. Read existing settings
-    # We use a raw config parser to preserve existing casing (even if it is wrong/lowercase)
-    config = configparser.ConfigParser()
-    config.optionxform = str
+    # 1. Read existing settings
+    # We use a raw config parser to preserve existing casing (even if it is wrong/lowercase).
+    # Goes through settings_store so keys kept in settings.db are fixed too.
     try:
-        config.read(settings_path)
+        config = settings_store.load_settings(settings_path)
     except Exception as e:
         print(f"Error reading settings.ini: {e}")
         return
 
-    # 3. Fix keys
-    fixed_count = 0
-    
+    # 2. Resolve only the keys present in the settings, instead of walking
+    # the whole PortableApps tree
+    resolver = PathResolver(base_dir)
+    keys = sorted(_candidate_keys(config))
+    if len(keys) >= PARALLEL_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(keys))) as pool:
+            resolved = dict(zip(keys, pool.map(resolver.resolve, keys)))
+    else:
+        resolved = {key: resolver.resolve(key) for key in keys}
+
+    # 3. Collect fixes
+    changes = []
     for section in config.sections():
-        # We need to collect changes first to avoid modifying dictionary during iteration
-        replacements = {} # old_key -> new_key
-        
-        for key in config[section]:
-            # Check if this key looks like a path (contains slashes)
-            if "/" in key or "\\" in key:
-                # Normalize key to lowercase forward slash for lookup
-                key_norm = key.replace("\\", "/").lower()
-                
-                if key_norm in path_map:
-                    correct_path = path_map[key_norm]
-                    
-                    # If the current key is different from correct path (case mismatch or slash mismatch)
-                    if key != correct_path:
-                        replacements[key] = correct_path
-        
-        # Apply replacements
-        for old_key, new_key in replacements.items():
-            # Get value from old key
+        for key in list(config[section]):
+            correct_path = resolved.get(key)
+            # If the current key is different from correct path (case mismatch or slash mismatch)
+            if correct_path and key != correct_path:
+                changes.append((section, key, correct_path))
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"Resolved {len(keys)} keys with {resolver.listdir_count} directory listings in {elapsed_ms:.0f} ms.")
+    diff = _format_diff(changes)
+
+    if dry_run:
+        if changes:
+            msg = f"{len(changes)} entries in settings.ini can be fixed."
+        else:
+            msg = "No path casing issues found to fix."
+        print(msg)
+        return {"fixed": 0, "message": msg, "changed": False, "changes": changes, "diff": diff}
+
+    if changes:
+        for section, old_key, new_key in changes:
+            # Move the value from the old key to the new one
             value = config[section][old_key]
-            # Remove old key
             config.remove_option(section, old_key)
-            # Set new key with value
             config.set(section, new_key, value)
-            fixed_count += 1
 
-    if fixed_count > 0:
         # Backup
         backup_path = settings_path + ".bak"
-        shutil.copy2(settings_path, backup_path)
+        with open(backup_path, 'w') as f:
+            f.write(settings_store.export_text(settings_path))
         print(f"Backed up original settings to {backup_path}")
-        
+
         # Save
-        with open(settings_path, 'w') as f:
-            config.write(f)
-        msg = f"Fixed {fixed_count} entries in settings.ini."
+        writer = settings_store.get_settings_writer(settings_path)
+        writer.submit(config)
+        writer.flush()
+        msg = f"Fixed {len(changes)} entries in settings.ini."
         print(msg)
-        return {"fixed": fixed_count, "message": msg, "changed": True}
+        return {"fixed": len(changes), "message": msg, "changed": True, "changes": changes, "diff": diff}
     else:
         msg = "No path casing issues found to fix."
         print(msg)
-        return {"fixed": 0, "message": msg, "changed": False}
+        return {"fixed": 0, "message": msg, "changed": False, "changes": [], "diff": ""}
 
 if __name__ == "__main__":
-    fix_settings()
+    result = fix_settings(dry_run="--dry-run" in sys.argv[1:])
+    if result and result.get("diff"):
+        print(result["diff"])
@@ -0,0 +1,225 @@
+import os
+import sys
+import json
+import time
+import ctypes
+import hashlib
+from PySide6.QtCore import QObject, QTimer
+from config import *
+import job_pool
+
+# Stick writes for a tiered file are delayed this long after the last change.
+WRITE_BACK_DELAY_MS = 5000
+# Host-tier files nobody touched for this long are removed by prune().
+MAX_AGE_DAYS = 30
+ICONS_DIRNAME = "icons"
+
+
+def host_cache_root():
+    """Per-user cache directory on this machine (not on the stick)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+        return os.path.join(base, "PortableX", "Cache")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "portablex")
+
+
+def volume_id(path):
+    """Identifies the drive holding path across hosts and drive letters."""
+    if sys.platform == "win32":
+        try:
+            root = os.path.splitdrive(os.path.abspath(path))[0] + "\\"
+            serial = ctypes.c_ulong()
+            if ctypes.windll.kernel32.GetVolumeInformationW(root, None, 0, ctypes.byref(serial), None, None, None, 0):
+                return f"{serial.value:08X}"
+        except Exception:
+            pass
+    try:
+        return str(os.stat(path).st_dev)
+    except OSError:
+        return ""
+
+
+_tier_dir = None
+
+
+def tier_dir():
+    """
+    Host tier for this stick and install: keyed by the volume serial and a
+    stamp of the base dir (without its drive letter, which changes between
+    plug-ins), so two sticks or two copies on one stick never share it.
+    """
+    global _tier_dir
+    if _tier_dir is None:
+        base_dir = get_base_dir()
+        tail = os.path.splitdrive(os.path.normcase(os.path.abspath(base_dir)))[1]
+        stamp = hashlib.sha1(tail.encode("utf-8")).hexdigest()[:12]
+        _tier_dir = os.path.join(host_cache_root(), "Tier", f"{volume_id(base_dir) or 'local'}-{stamp}")
+    return _tier_dir
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class TieredFile(QObject):
+    """
+    A small file on the stick (portable tier) with a copy on the host
+    (host tier). Reads use the host copy when its fingerprint shows the
+    stick file is still the one it was made from; writes land on the host
+    at once and go to the stick WRITE_BACK_DELAY_MS later. A missing,
+    corrupt or stale host copy is ignored and rebuilt from the stick.
+    """
+
+    def __init__(self, portable_path, parent=None):
+        super().__init__(parent)
+        self.portable_path = portable_path
+        name = os.path.basename(portable_path)
+        self.host_path = os.path.join(tier_dir(), name)
+        self.meta_path = self.host_path + ".meta.json"
+        self.hits = 0
+        self.misses = 0
+        self._pending = None
+        # Last bytes known to be in both tiers (or about to be).
+        self._data = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(WRITE_BACK_DELAY_MS)
+        self._timer.timeout.connect(self._write_back)
+
+    def _load_meta(self):
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            return meta if isinstance(meta, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _save_meta(self, stamp, sha1, dirty):
+        try:
+            _write(self.meta_path, json.dumps({"stamp": stamp, "sha1": sha1, "dirty": dirty}).encode("utf-8"))
+        except OSError as e:
+            print(f"Error writing host cache {self.meta_path}: {e}")
+
+    def read(self):
+        """The file's bytes, or None if neither tier has it."""
+        if self._pending is not None:
+            return self._pending
+        stamp = _stat(self.portable_path)
+        meta = self._load_meta()
+        if meta and meta.get("stamp") == stamp and (stamp is not None or meta.get("dirty")):
+            try:
+                with open(self.host_path, "rb") as f:
+                    data = f.read()
+                if hashlib.sha1(data).hexdigest() == meta.get("sha1"):
+                    self.hits += 1
+                    self._data = data
+                    if meta.get("dirty"):
+                        # Written here last session but never reached the stick.
+                        self._pending = data
+                        self._timer.start()
+                    return data
+            except OSError:
+                pass
+        self.misses += 1
+        if stamp is None:
+            return None
+        try:
+            with open(self.portable_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            _write(self.host_path, data)
+            self._save_meta(stamp, hashlib.sha1(data).hexdigest(), False)
+        except OSError as e:
+            print(f"Error writing host cache {self.host_path}: {e}")
+        self._data = data
+        return data
+
+    def write(self, data):
+        """Store data on the host now and on the stick after WRITE_BACK_DELAY_MS."""
+        if data == self._data:
+            return
+        self._data = self._pending = data
+        try:
+            _write(self.host_path, data)
+            meta = self._load_meta() or {}
+            # Keep the stamp of the stick file this edit is based on.
+            self._save_meta(meta.get("stamp") or _stat(self.portable_path), hashlib.sha1(data).hexdigest(), True)
+        except OSError as e:
+            print(f"Error writing host cache {self.host_path}: {e}")
+        self._timer.start()
+
+    def _write_back(self):
+        if self._pending is None:
+            return
+        data = self._pending
+        job = job_pool.submit(self._write_portable, self.portable_path, data, name="host_cache_write_back", key="write_back:" + self.portable_path)
+        job.finished.connect(lambda stamp, data=data: self._on_written(data, stamp))
+
+    @staticmethod
+    def _write_portable(path, data):
+        _write(path, data)
+        return _stat(path)
+
+    def _on_written(self, data, stamp):
+        if self._pending is not data:
+            return
+        self._pending = None
+        self._save_meta(stamp, hashlib.sha1(data).hexdigest(), False)
+
+    def flush(self):
+        """Write a pending change to the stick now (at exit, when queued jobs are dropped)."""
+        self._timer.stop()
+        if self._pending is None:
+            return
+        try:
+            self._on_written(self._pending, self._write_portable(self.portable_path, self._pending))
+        except OSError as e:
+            print(f"Error writing {self.portable_path}: {e}")
+
+
+def icon_cache_path(source_path, size, stamp=None):
+    """
+    Host-tier PNG for the icon of source_path at size, fingerprinted by the
+    source's size and mtime so a changed exe or .ico gets a new entry.
+    Returns None if the source is missing.
+    """
+    stamp = stamp or _stat(source_path)
+    if stamp is None:
+        return None
+    tail = os.path.splitdrive(os.path.normcase(os.path.abspath(source_path)))[1]
+    key = f"{tail}|{int(size)}|{stamp[0]}|{stamp[1]}"
+    return os.path.join(tier_dir(), ICONS_DIRNAME, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png")
+
+
+def prune(max_age_days=MAX_AGE_DAYS):
+    """Remove cached icons older than max_age_days; returns how many went."""
+    cutoff = time.time() - max_age_days * 86400
+    icons_dir = os.path.join(tier_dir(), ICONS_DIRNAME)
+    count = 0
+    try:
+        entries = list(os.scandir(icons_dir))
+    except OSError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                count += 1
+        except OSError:
+            pass
+    return count
@@ -0,0 +1,281 @@
+import heapq
+import itertools
+import threading
+import time
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtWidgets import QApplication
+
+# Priority classes; lower runs first.
+PRIORITY_UI = 0          # the user is waiting on it (scan, About info, fix settings)
+PRIORITY_BACKGROUND = 1  # wanted soon but nobody is blocked (update check, sampling)
+PRIORITY_IDLE = 2        # only when nothing else is queued (read-ahead, warm-ups)
+
+PRIORITY_NAMES = {PRIORITY_UI: "ui", PRIORITY_BACKGROUND: "background", PRIORITY_IDLE: "idle"}
+
+MAX_THREADS = 4
+# Idle work never takes more than this many threads at once.
+MAX_IDLE_RUNNING = 1
+
+_job_pool = None
+
+
+def job_pool():
+    """The application-wide JobPool (created on first use)."""
+    global _job_pool
+    if _job_pool is None:
+        _job_pool = JobPool(QApplication.instance())
+    return _job_pool
+
+
+def submit(fn, *args, **kwargs):
+    """Shorthand for job_pool().submit(...)."""
+    return job_pool().submit(fn, *args, **kwargs)
+
+
+class CancelToken:
+    """
+    Cooperative cancellation flag shared by the submitter and a running job.
+    Long jobs poll is_cancelled(); on_cancel() hooks an existing stop()
+    method (workers with their own abort flag) onto the token.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Cancel callback failed: {e}")
+
+    def is_cancelled(self):
+        return self._event.is_set()
+
+    def on_cancel(self, callback):
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+class Job(QObject):
+    """
+    Handle for one submitted callable. Exactly one of finished(result),
+    failed(message) or cancelled() is emitted, on the GUI thread. A job
+    whose token is cancelled while it runs reports cancelled() and its
+    result is dropped.
+    """
+
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+    # Worker thread -> pool (queued onto the GUI thread): job, outcome, result.
+    _ran = Signal(object, str, object)
+
+    def __init__(self, fn, args, kwargs, priority, name, token, key, pass_token=False, parent=None):
+        super().__init__(parent)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.pass_token = pass_token
+        self.priority = priority
+        self.name = name or getattr(fn, "__qualname__", "job")
+        self.token = token or CancelToken()
+        self.key = key
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.ended_at = None
+        self.state = "queued"
+
+    def cancel(self):
+        self.token.cancel()
+
+    def is_cancelled(self):
+        return self.token.is_cancelled()
+
+    def is_done(self):
+        return self.state in ("finished", "failed", "cancelled")
+
+    def wait_ms(self):
+        """Time spent queued before a thread picked the job up."""
+        if self.started_at is None:
+            return (time.perf_counter() - self.submitted_at) * 1000.0
+        return (self.started_at - self.submitted_at) * 1000.0
+
+    def run_ms(self):
+        if self.started_at is None:
+            return 0.0
+        end = self.ended_at if self.ended_at is not None else time.perf_counter()
+        return (end - self.started_at) * 1000.0
+
+
+class _JobRunnable(QRunnable):
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        self.setAutoDelete(True)
+
+    def run(self):
+        job = self.job
+        job.started_at = time.perf_counter()
+        if job.token.is_cancelled():
+            job.ended_at = job.started_at
+            job._ran.emit(job, "cancelled", None)
+            return
+        kwargs = dict(job.kwargs)
+        if job.pass_token:
+            kwargs["token"] = job.token
+        try:
+            result = job.fn(*job.args, **kwargs)
+            outcome = "finished"
+        except Exception as e:
+            result = str(e)
+            outcome = "failed"
+        job.ended_at = time.perf_counter()
+        job._ran.emit(job, outcome, result)
+
+
+class JobPool(QObject):
+    """
+    Bounded executor for everything that used to start its own QThread.
+    Jobs wait in a priority queue and are started on a QThreadPool as
+    threads free up: UI work can always claim a thread, background work
+    leaves one free for it, and idle work runs one at a time and only when
+    nothing else is waiting. Jobs submitted with a key replace a queued
+    job with the same key and cancel a running one, so the latest request
+    wins instead of being dropped.
+    """
+
+    job_done = Signal(object)
+
+    def __init__(self, parent=None, max_threads=MAX_THREADS):
+        super().__init__(parent)
+        self._threads = QThreadPool(self)
+        self.max_threads = max(2, min(int(max_threads), QThreadPool.globalInstance().maxThreadCount()))
+        self._threads.setMaxThreadCount(self.max_threads)
+        self._queue = []
+        self._order = itertools.count()
+        self._running = set()
+        self._keyed = {}
+        self._stats = {}
+        self._closed = False
+
+    def submit(self, fn, *args, priority=PRIORITY_BACKGROUND, name=None, token=None, key=None, pass_token=False, **kwargs):
+        """
+        Queue fn(*args, **kwargs); returns its Job. Connect to the Job's
+        signals for the result. With pass_token the job's CancelToken is
+        handed to fn as token= so it can stop early.
+        """
+        job = Job(fn, args, kwargs, priority, name, token, key, pass_token, self)
+        job._ran.connect(self._on_ran)
+        if self._closed:
+            job.cancel()
+            self._finish(job, "cancelled", None)
+            return job
+        if key is not None:
+            previous = self._keyed.get(key)
+            if previous is not None and not previous.is_done():
+                previous.cancel()
+                if previous.state == "queued":
+                    self._finish(previous, "cancelled", None)
+            self._keyed[key] = job
+        heapq.heappush(self._queue, (priority, next(self._order), job))
+        self._dispatch()
+        return job
+
+    def cancel(self, key):
+        """Cancel the latest job submitted with key, queued or running."""
+        job = self._keyed.get(key)
+        if job is not None and not job.is_done():
+            job.cancel()
+            if job.state == "queued":
+                self._finish(job, "cancelled", None)
+
+    def is_busy(self, key):
+        job = self._keyed.get(key)
+        return job is not None and not job.is_done()
+
+    def stats(self):
+        """{name: {"count", "failed", "cancelled", "run_ms", "max_run_ms", "wait_ms"}} for finished jobs."""
+        return {name: dict(entry) for name, entry in self._stats.items()}
+
+    def shutdown(self, wait_ms=1500):
+        """Cancel everything and give running jobs wait_ms to notice."""
+        self._closed = True
+        for _, _, job in list(self._queue):
+            job.cancel()
+        for job in list(self._running):
+            job.cancel()
+        self._queue = []
+        return self._threads.waitForDone(wait_ms)
+
+    def _running_count(self, priority):
+        return sum(1 for job in self._running if job.priority == priority)
+
+    def _can_start(self, priority):
+        running = len(self._running)
+        if priority == PRIORITY_UI:
+            return running < self.max_threads
+        if priority == PRIORITY_BACKGROUND:
+            return running < self.max_threads - 1
+        busy_queue = any(entry[0] != PRIORITY_IDLE for entry in self._queue)
+        return not busy_queue and running < self.max_threads - 1 and self._running_count(PRIORITY_IDLE) < MAX_IDLE_RUNNING
+
+    def _dispatch(self):
+        while self._queue:
+            priority, _, job = self._queue[0]
+            if job.state != "queued":
+                heapq.heappop(self._queue)
+                continue
+            if job.is_cancelled():
+                heapq.heappop(self._queue)
+                self._finish(job, "cancelled", None)
+                continue
+            if not self._can_start(priority):
+                break
+            heapq.heappop(self._queue)
+            job.state = "running"
+            self._running.add(job)
+            self._threads.start(_JobRunnable(job))
+
+    def _on_ran(self, job, outcome, result):
+        self._running.discard(job)
+        if job.is_cancelled():
+            outcome, result = "cancelled", None
+        self._finish(job, outcome, result)
+        self._dispatch()
+
+    def _finish(self, job, outcome, result):
+        if job.is_done():
+            return
+        job.state = outcome
+        if self._keyed.get(job.key) is job:
+            del self._keyed[job.key]
+        entry = self._stats.setdefault(job.name, {"count": 0, "failed": 0, "cancelled": 0, "run_ms": 0.0, "max_run_ms": 0.0, "wait_ms": 0.0})
+        entry["count"] += 1
+        run_ms = job.run_ms()
+        entry["run_ms"] += run_ms
+        entry["max_run_ms"] = max(entry["max_run_ms"], run_ms)
+        entry["wait_ms"] += job.wait_ms()
+        try:
+            if outcome == "finished":
+                job.finished.emit(result)
+            elif outcome == "failed":
+                entry["failed"] += 1
+                print(f"Job {job.name} failed: {result}")
+                job.failed.emit(str(result))
+            else:
+                entry["cancelled"] += 1
+                job.cancelled.emit()
+        finally:
+            self.job_done.emit(job)
+            job.deleteLater()
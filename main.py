@@ -15,8 +15,23 @@ import getpass
 import platform
 import stat
 import json
+from concurrent.futures import ThreadPoolExecutor
 import update_checker
 import fix_settings
+import settings_store
+import ui_styles
+import ui_rainbow
+import ui_theme
+import ui_background
+import ui_chrome
+import ui_scheduler
+import job_pool
+import app_launcher
+import startup_orchestrator
+import prefetcher
+import turbo
+import host_cache
+import drive_benchmark
 from app_info import (
     DEFAULT_GITHUB_REPO,
     DEFAULT_UPDATE_CHECK_INTERVAL_HOURS,
@@ -26,8 +41,8 @@ from app_info import (
 from ctypes import wintypes
 from PySide6.QtCore import (
     Qt, QSize, QPoint, QPropertyAnimation, QEasingCurve,
-    QParallelAnimationGroup, QRect, Property, Signal, QObject, QStorageInfo, QFileInfo, QTimer, QEvent,
-    QAbstractNativeEventFilter, QThread
+    QParallelAnimationGroup, QRect, Property, Signal, QStorageInfo, QFileInfo, QTimer, QEvent,
+    QAbstractNativeEventFilter
 )
 from PySide6.QtGui import (
     QColor, QPainter, QPainterPath, QPen, QBrush, QFont, QKeySequence, QShortcut,
@@ -39,7 +54,7 @@ from PySide6.QtWidgets import (
     QLineEdit, QLabel, QScrollArea, QStackedWidget, QFrame, QGraphicsDropShadowEffect,
     QGraphicsBlurEffect, QGraphicsOpacityEffect, QSizePolicy, QStackedLayout, QPushButton, QFileIconProvider,
     QFileDialog, QMenu, QInputDialog, QDialog, QComboBox, QDialogButtonBox, QProgressBar, QProgressDialog, QCheckBox,
-    QListWidget, QListWidgetItem, QTreeWidget, QTreeWidgetItem, QToolButton, QHeaderView,
+    QListWidget, QListWidgetItem,
     QSystemTrayIcon, QStyle, QMessageBox
 )
 from config import *
@@ -48,6 +63,7 @@ from ui_search import SearchBar
 from ui_sidebar import QuickAccessButton, ProfilePicture
 from ui_app_item import AppListItem, AppGridItem
 from ui_category import CategoryItem, CategorySelectionDialog
+from ui_app_picker import AppPicker
 from ui_options import OptionsPanel
 
 NOTICE_TITLE = f"{get_app_display_name()} - Notice"
@@ -120,146 +136,182 @@ def _build_allowed_categories(settings_config, base_categories):
     return allowed
 
 
-def _scan_portable_apps_on_disk(base_dir, show_hidden):
-    apps = []
-    apps_dir = os.path.join(base_dir, "PortableApps")
+# Catalog field -> settings.ini section holding its per-app override.
+# Larger batches re-render the list from the catalog instead of moving rows.
+MAX_IN_PLACE_CHANGES = 16
 
-    if not os.path.exists(apps_dir):
-        return []
+APP_STATE_SECTIONS = {
+    "is_favorite": "Favorites",
+    "is_hidden": "Hidden",
+    "name": "Renames",
+    "category": "Categories",
+}
 
-    settings_config = configparser.ConfigParser()
-    settings_config.optionxform = str
-    settings_config.read(get_settings_path())
-    allowed_categories = _build_allowed_categories(settings_config, BASE_CATEGORIES)
+def _app_sort_key(app):
+    return (not app["is_favorite"], app["name"].lower())
 
-    def _get_app_key(exe_path):
-        try:
-            return os.path.relpath(exe_path, base_dir).replace("\\", "/")
-        except ValueError:
-            return exe_path.replace("\\", "/")
-
-    for entry in os.scandir(apps_dir):
-        if not entry.is_dir():
-            continue
-        potential_apps = []
-        ini_path = os.path.join(entry.path, "App", "AppInfo", "appinfo.ini")
-
-        if os.path.exists(ini_path):
-            try:
-                app_config = configparser.ConfigParser()
-                app_config.read(ini_path)
-
-                name = app_config.get("Details", "Name", fallback=entry.name)
-                name = name.replace("Portable", "").replace("  ", " ").strip()
-                category = app_config.get("Details", "Category", fallback="No Category")
-                start_exe = app_config.get("Control", "Start", fallback=None)
-                version = app_config.get("Version", "DisplayVersion", fallback="")
-                description = app_config.get("Details", "Description", fallback="")
-
-                if start_exe:
-                    exe_path = os.path.join(entry.path, start_exe)
-
-                    # Icon Logic
-                    icon_path = None
-                    ico_file = os.path.join(entry.path, "App", "AppInfo", "appicon.ico")
-                    if os.path.exists(ico_file):
-                        icon_path = ico_file
-                    else:
-                        icon_path = exe_path
 
-                    potential_apps.append((name, exe_path, icon_path, version, description, category))
-            except Exception:
-                pass
-        else:
-            try:
-                for file in os.scandir(entry.path):
-                    if file.is_file() and file.name.lower().endswith(".exe"):
-                        name = os.path.splitext(file.name)[0]
-                        name = name.replace("Portable", "").replace("  ", " ").strip()
-                        potential_apps.append((name, file.path, file.path, "", "", "No Category"))
-            except Exception:
-                pass
+# Per-app sections an app scan reads (besides the category list).
+_SCAN_SETTINGS_SECTIONS = ("Renames", "Categories", "Favorites", "Hidden")
 
-        for name, exe_path, icon_path, version, description, default_cat in potential_apps:
-            is_fav = False
-            is_hidden = False
-            category = default_cat
 
-            key = _get_app_key(exe_path)
+def _scan_inputs(settings_config):
+    """The parts of the settings a scan's result depends on."""
+    sections = tuple(
+        tuple(sorted(settings_config.items(section))) if settings_config.has_section(section) else ()
+        for section in _SCAN_SETTINGS_SECTIONS
+    )
+    return (tuple(_build_allowed_categories(settings_config, BASE_CATEGORIES)),) + sections
 
-            if settings_config.has_option("Renames", key):
-                name = settings_config.get("Renames", key)
-            if settings_config.has_option("Categories", key):
-                category = settings_config.get("Categories", key)
-            if settings_config.has_option("Favorites", key):
-                is_fav = settings_config.getboolean("Favorites", key, fallback=False)
-            if settings_config.has_option("Hidden", key):
-                is_hidden = settings_config.getboolean("Hidden", key, fallback=False)
 
-            category = resolve_category_name(category, allowed_categories)
+def _read_app_folder(entry):
+    """(name, exe, icon, version, description, category) for the apps in one PortableApps folder."""
+    potential_apps = []
+    if not entry.is_dir():
+        return potential_apps
+    ini_path = os.path.join(entry.path, "App", "AppInfo", "appinfo.ini")
 
-            if is_hidden and not show_hidden:
-                continue
+    if os.path.exists(ini_path):
+        try:
+            app_config = configparser.ConfigParser()
+            app_config.read(ini_path)
+
+            name = app_config.get("Details", "Name", fallback=entry.name)
+            name = name.replace("Portable", "").replace("  ", " ").strip()
+            category = app_config.get("Details", "Category", fallback="No Category")
+            start_exe = app_config.get("Control", "Start", fallback=None)
+            version = app_config.get("Version", "DisplayVersion", fallback="")
+            description = app_config.get("Details", "Description", fallback="")
+
+            if start_exe:
+                exe_path = os.path.join(entry.path, start_exe)
+
+                # Icon Logic
+                icon_path = None
+                ico_file = os.path.join(entry.path, "App", "AppInfo", "appicon.ico")
+                if os.path.exists(ico_file):
+                    icon_path = ico_file
+                else:
+                    icon_path = exe_path
 
-            apps.append({
-                "name": name,
-                "exe": exe_path,
-                "icon": icon_path,
-                "is_favorite": is_fav,
-                "is_hidden": is_hidden,
-                "category": category,
-                "version": version,
-                "description": description
-            })
+                potential_apps.append((name, exe_path, icon_path, version, description, category))
+        except Exception:
+            pass
+    else:
+        try:
+            for file in os.scandir(entry.path):
+                if file.is_file() and file.name.lower().endswith(".exe"):
+                    name = os.path.splitext(file.name)[0]
+                    name = name.replace("Portable", "").replace("  ", " ").strip()
+                    potential_apps.append((name, file.path, file.path, "", "", "No Category"))
+        except Exception:
+            pass
+    return potential_apps
 
-    return sorted(apps, key=lambda x: (not x["is_favorite"], x["name"].lower()))
 
+def _scan_portable_apps_on_disk(base_dir, show_hidden, settings_config=None, still_current=None):
+    """
+    Apps under base_dir/PortableApps with their settings applied. still_current
+    is polled before each app folder; the scan returns None once it says False.
+    """
+    apps = []
+    apps_dir = os.path.join(base_dir, "PortableApps")
 
-class AppScanWorker(QObject):
-    finished = Signal(list)
-    error = Signal(str)
+    if not os.path.exists(apps_dir):
+        return []
 
-    def __init__(self, base_dir, show_hidden):
-        super().__init__()
-        self.base_dir = base_dir
-        self.show_hidden = bool(show_hidden)
+    if settings_config is None:
+        settings_config = settings_store.load_settings()
+    allowed_categories = _build_allowed_categories(settings_config, BASE_CATEGORIES)
 
-    def run(self):
+    def _get_app_key(exe_path):
         try:
-            apps = _scan_portable_apps_on_disk(self.base_dir, self.show_hidden)
-            self.finished.emit(apps)
-        except Exception as e:
-            self.error.emit(str(e))
-
-
-class FixSettingsWorker(QObject):
-    finished = Signal(dict)
-    error = Signal(str)
+            return os.path.relpath(exe_path, base_dir).replace("\\", "/")
+        except ValueError:
+            return exe_path.replace("\\", "/")
 
-    def run(self):
-        try:
-            result = fix_settings.fix_settings()
-            if result is None:
-                result = {"fixed": 0, "message": "Fix settings completed.", "changed": False}
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+    entries = list(os.scandir(apps_dir))
+    # Parallel folder reads only where the drive benchmarked fast enough to gain from them.
+    workers = min(drive_benchmark.parallelism(base_dir) or 1, max(1, len(entries)))
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    folders = executor.map(_read_app_folder, entries) if executor else map(_read_app_folder, entries)
+    try:
+        for entry in entries:
+            if still_current is not None and not still_current():
+                return None
+            potential_apps = next(folders)
+            for name, exe_path, icon_path, version, description, default_cat in potential_apps:
+                is_fav = False
+                is_hidden = False
+                category = default_cat
+
+                key = _get_app_key(exe_path)
+
+                if settings_config.has_option("Renames", key):
+                    name = settings_config.get("Renames", key)
+                if settings_config.has_option("Categories", key):
+                    category = settings_config.get("Categories", key)
+                if settings_config.has_option("Favorites", key):
+                    is_fav = settings_config.getboolean("Favorites", key, fallback=False)
+                if settings_config.has_option("Hidden", key):
+                    is_hidden = settings_config.getboolean("Hidden", key, fallback=False)
+
+                category = resolve_category_name(category, allowed_categories)
+
+                if is_hidden and not show_hidden:
+                    continue
 
+                apps.append({
+                    "name": name,
+                    "exe": exe_path,
+                    "icon": icon_path,
+                    "is_favorite": is_fav,
+                    "is_hidden": is_hidden,
+                    "category": category,
+                    "version": version,
+                    "description": description
+                })
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return sorted(apps, key=_app_sort_key)
+
+
+def _scan_app_catalog(base_dir, show_hidden, token=None):
+    """
+    The app scan as a job: returns (settings generation, scan inputs, apps),
+    the apps reflecting that generation, or None if it was cancelled or the
+    settings it reads changed mid-scan (checked between app folders).
+    """
+    generation = settings_store.generation()
+    settings_config = settings_store.load_settings()
+    inputs = _scan_inputs(settings_config)
+    state = {"generation": generation}
+
+    def _still_current():
+        if token is not None and token.is_cancelled():
+            return False
+        current = settings_store.generation()
+        if current != state["generation"]:
+            # Unrelated keys (window position, update timestamps) don't void the scan.
+            if _scan_inputs(settings_store.load_settings()) != inputs:
+                return False
+            state["generation"] = current
+        return True
 
-class UpdateCheckWorker(QObject):
-    finished = Signal(dict)
-    error = Signal(str)
+    apps = _scan_portable_apps_on_disk(base_dir, show_hidden, settings_config, _still_current)
+    if apps is None or not _still_current():
+        return None
+    return state["generation"], inputs, apps
 
-    def __init__(self, repo):
-        super().__init__()
-        self.repo = repo
 
-    def run(self):
-        try:
-            result = update_checker.get_latest_github_release(self.repo)
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+def _run_fix_settings(dry_run=False):
+    result = fix_settings.fix_settings(dry_run=dry_run)
+    if result is None:
+        result = {"fixed": 0, "message": "Fix settings completed.", "changed": False}
+    result["dry_run"] = dry_run
+    return result
 
 # -----------------------------------------------------------------------------
 # GUI Scale (read before QApplication)
@@ -267,10 +319,7 @@ class UpdateCheckWorker(QObject):
 
 def read_gui_scale_setting():
     try:
-        config = configparser.ConfigParser()
-        config.optionxform = str
-        path = get_settings_path()
-        config.read(path)
+        config = settings_store.load_settings()
         return config.get("Settings", "GuiScale", fallback="1.0")
     except Exception:
         return "1.0"
@@ -305,6 +354,11 @@ class HotkeyFilter(QAbstractNativeEventFilter):
 
 class LauncherWindow(QMainWindow):
     CATEGORIES = list(BASE_CATEGORIES)
+    # Build-scheduler token for the jobs filling the app list/grid.
+    APP_VIEW_BUILD = "app_view"
+    APP_SCAN_JOB = "app_scan"
+    # Emitted whenever _last_scanned_apps is replaced or edited in place.
+    catalog_updated = Signal()
 
     def __init__(self):
         super().__init__()
@@ -327,6 +381,17 @@ class LauncherWindow(QMainWindow):
         self.app_session_unlock = self.settings.get("app_session_unlock", False)
         self.app_session_unlock = self.settings.get("app_session_unlock", False)
         self._app_unlocked_session = False
+        self.launcher = app_launcher.LauncherService(self)
+        self.launcher.running_changed.connect(self._on_app_running_changed)
+        self.launcher.launched.connect(self._on_app_launched)
+        self.launcher.failed.connect(self._on_app_launch_failed)
+        # Launches started from the UI; the window hides once one has started.
+        self._user_launches = set()
+        self.prefetcher = prefetcher.Prefetcher(self.launcher, self)
+        self.turbo = turbo.TurboManager(self.launcher, self)
+        self.turbo.status.connect(self._show_turbo_status)
+        self.startup = startup_orchestrator.StartupOrchestrator(self.launcher, self.turbo, self)
+        job_pool.submit(host_cache.prune, priority=job_pool.PRIORITY_IDLE, name="host_cache_prune")
         base_flags = Qt.FramelessWindowHint | Qt.WindowSystemMenuHint
         if not self.show_in_taskbar:
             base_flags |= Qt.Tool  # keep the window out of the taskbar (tray-only)
@@ -401,11 +466,9 @@ class LauncherWindow(QMainWindow):
             self.center_on_screen()
 
         # Theme (must be set before building UI)
+        self.theme_manager = ui_theme.ThemeManager(self)
+        self.theme_manager.system_theme_changed.connect(self._on_system_theme_changed)
         self.apply_theme_mode(self.theme_mode)
-        if self.accent_color:
-            apply_accent_color(self.accent_color)
-        if self.text_color:
-            apply_text_color(self.text_color)
 
         # Apply window flags
         self.apply_always_on_top(self.always_on_top, initial=True)
@@ -434,6 +497,9 @@ class LauncherWindow(QMainWindow):
 
         # Defer app loading until the window is visible
         self._refresh_pending = False
+        self._refresh_queued = False
+        # Settings generation of the scan in flight / of the apps on screen.
+        self._scan_generation = None
         self._initial_refresh_done = False
         self._cache_loaded = False
         self._last_scanned_apps = []
@@ -460,9 +526,16 @@ class LauncherWindow(QMainWindow):
         self._is_hiding = False
         self._target_rect = None
 
+        # Background image, decoded off-thread at the container's size
+        self._background_cache = ui_background.BackgroundImageCache(self)
+        # Window fill + border, pre-rendered per size/background/theme
+        self._window_chrome = ui_chrome.ChromeLayer()
+        self._background_cache.changed.connect(self.update)
+        self._background_import = None
+
         # Rainbow text
-        self._rainbow_timer = None
-        self._rainbow_hue = 0
+        self._rainbow = ui_rainbow.RainbowDriver(self)
+        self._rainbow.frame.connect(self._tick_rainbow)
         if self.text_color == "__rainbow__":
             self._start_rainbow()
 
@@ -549,18 +622,22 @@ class LauncherWindow(QMainWindow):
             self.raise_()
 
     def get_system_theme_mode(self):
-        palette = QApplication.palette()
-        window_color = palette.color(QPalette.Window)
-        return "dark" if window_color.lightness() < 128 else "light"
+        return ui_theme.system_theme_mode()
 
     def apply_theme_mode(self, mode):
-        effective = self.get_system_theme_mode() if mode == "system" else mode
-        apply_theme(effective)
+        """Apply theme mode plus the accent/text colour overrides to the live widgets."""
         self.theme_mode = mode
-        self.effective_theme = effective
+        self.effective_theme = self.theme_manager.apply(mode, self.accent_color, self.text_color)
         self.update_tray_icons()
         self.rebuild_tray_menu()
-        self.update()
+
+    def _on_system_theme_changed(self, mode):
+        if self.theme_mode != "system" or mode == self.effective_theme:
+            return
+        self.apply_theme_mode("system")
+        if self.main_stack.count() > 1 and self.main_stack.currentIndex() == 1:
+            # The options page is built per visit; rebuild it in the new colours.
+            self.show_options_menu()
 
     def rebuild_main_view(self):
         while self.main_stack.count():
@@ -617,7 +694,7 @@ class LauncherWindow(QMainWindow):
             if btn_name == "Search":
                 line = QFrame()
                 line.setFixedHeight(1)
-                line.setStyleSheet(f"background-color: {qcolor_to_rgba(COLOR_GLASS_BORDER)}; margin: 4px 5px;")
+                ui_theme.bind_style(line, lambda: f"background-color: {qcolor_to_rgba(COLOR_GLASS_BORDER)}; margin: 4px 5px;")
                 layout.addWidget(line)
 
             icon_file = icon_map.get(btn_name, "")
@@ -638,8 +715,12 @@ class LauncherWindow(QMainWindow):
         self.close_btn.setFixedSize(26, 26)
         self.close_btn.setCursor(Qt.PointingHandCursor)
         self.close_btn.clicked.connect(self.confirm_quit_app)
-        close_color = COLOR_TEXT_MAIN.name() if self.effective_theme == "dark" else COLOR_TEXT_SUB.name()
-        self.close_btn.setStyleSheet(f"""
+        ui_theme.bind_style(self.close_btn, self._close_button_style)
+        layout.addWidget(self.close_btn, 0, Qt.AlignRight)
+
+    def _close_button_style(self):
+        close_color = COLOR_TEXT_MAIN.name() if self.theme_manager.effective == "dark" else COLOR_TEXT_SUB.name()
+        return f"""
             QPushButton {{
                 background: transparent;
                 color: {close_color};
@@ -653,8 +734,7 @@ class LauncherWindow(QMainWindow):
             QPushButton:pressed {{
                 color: {COLOR_ACCENT.name()};
             }}
-        """)
-        layout.addWidget(self.close_btn, 0, Qt.AlignRight)
+        """
 
     def _add_custom_folder_button(self, layout):
         if not self.home_show_custom_folder:
@@ -769,9 +849,12 @@ class LauncherWindow(QMainWindow):
         # Separator
         line = QFrame()
         line.setFixedHeight(1)
-        line.setStyleSheet(f"background-color: {qcolor_to_rgba(COLOR_GLASS_BORDER)};")
+        ui_theme.bind_style(line, lambda: f"background-color: {qcolor_to_rgba(COLOR_GLASS_BORDER)};")
         panel_layout.addWidget(line)
 
+        # Bulk-edit bar (shown while multi-selecting apps)
+        panel_layout.addWidget(self._build_bulk_bar())
+
         # --- Content Section (Apps | Buttons) ---
         content_container = QWidget()
         content_layout = QHBoxLayout(content_container)
@@ -791,7 +874,7 @@ class LauncherWindow(QMainWindow):
         self.app_list_back_btn = QPushButton("Back")
         self.app_list_back_btn.setCursor(Qt.PointingHandCursor)
         self.app_list_back_btn.setFixedHeight(22)
-        self.app_list_back_btn.setStyleSheet(f"""
+        ui_theme.bind_style(self.app_list_back_btn, lambda: f"""
             QPushButton {{
                 background: transparent;
                 color: {COLOR_TEXT_SUB.name()};
@@ -814,12 +897,12 @@ class LauncherWindow(QMainWindow):
         loading_layout.setContentsMargins(6, 6, 6, 6)
         loading_layout.setSpacing(6)
         loading_label = QLabel("Loading apps...")
-        loading_label.setStyleSheet(f"color: {qcolor_to_rgba(COLOR_TEXT_SUB)};")
+        ui_theme.bind_style(loading_label, lambda: f"color: {qcolor_to_rgba(COLOR_TEXT_SUB)};")
         self.loading_bar = QProgressBar()
         self.loading_bar.setRange(0, 0)
         self.loading_bar.setFixedHeight(4)
         self.loading_bar.setTextVisible(False)
-        self.loading_bar.setStyleSheet(f"""
+        ui_theme.bind_style(self.loading_bar, lambda: f"""
             QProgressBar {{
                 background: rgba(255, 255, 255, 0.08);
                 border: none;
@@ -853,7 +936,7 @@ class LauncherWindow(QMainWindow):
         self.app_grid_all_btn = QPushButton("All >")
         self.app_grid_all_btn.setCursor(Qt.PointingHandCursor)
         self.app_grid_all_btn.setFixedHeight(22)
-        self.app_grid_all_btn.setStyleSheet(f"""
+        ui_theme.bind_style(self.app_grid_all_btn, lambda: f"""
             QPushButton {{
                 background: transparent;
                 color: {COLOR_TEXT_SUB.name()};
@@ -903,7 +986,7 @@ class LauncherWindow(QMainWindow):
         # --- Separator ---
         separator = QFrame()
         separator.setFixedWidth(1)
-        separator.setStyleSheet(f"background-color: {qcolor_to_rgba(COLOR_GLASS_BORDER)}; margin: 5px 0px;")
+        ui_theme.bind_style(separator, lambda: f"background-color: {qcolor_to_rgba(COLOR_GLASS_BORDER)}; margin: 5px 0px;")
         content_layout.addWidget(separator)
         
         # --- Right Side: Quick Buttons ---
@@ -923,6 +1006,64 @@ class LauncherWindow(QMainWindow):
         
         self.main_stack.addWidget(middle_frame)
 
+    def _build_bulk_bar(self):
+        self._bulk_select_mode = False
+        self._bulk_selected = set()
+        bar = QWidget()
+        bar_layout = QHBoxLayout(bar)
+        bar_layout.setContentsMargins(6, 0, 6, 0)
+        bar_layout.setSpacing(6)
+        self.bulk_count_label = QLabel("0 selected")
+        ui_theme.bind_style(self.bulk_count_label, lambda: f"color: {COLOR_TEXT_SUB.name()}; background: transparent;")
+        bar_layout.addWidget(self.bulk_count_label)
+        bar_layout.addStretch()
+
+        def button_style():
+            return f"""
+            QPushButton {{
+                background: transparent;
+                color: {COLOR_TEXT_SUB.name()};
+                border: 1px solid {qcolor_to_rgba(COLOR_GLASS_BORDER)};
+                border-radius: 6px;
+                padding: 2px 8px;
+            }}
+            QPushButton:hover {{
+                color: {COLOR_TEXT_MAIN.name()};
+                border-color: {COLOR_ACCENT.name()};
+            }}
+            QPushButton::menu-indicator {{
+                width: 0px;
+            }}
+        """
+        edit_btn = QPushButton("Edit")
+        edit_btn.setCursor(Qt.PointingHandCursor)
+        edit_btn.setFixedHeight(22)
+        ui_theme.bind_style(edit_btn, button_style)
+        edit_menu = QMenu(edit_btn)
+        edit_menu.addAction("Favourite").triggered.connect(lambda: self.bulk_set_field("is_favorite", True))
+        edit_menu.addAction("Unfavourite").triggered.connect(lambda: self.bulk_set_field("is_favorite", False))
+        edit_menu.addSeparator()
+        edit_menu.addAction("Hide").triggered.connect(lambda: self.bulk_set_field("is_hidden", True))
+        edit_menu.addAction("Unhide").triggered.connect(lambda: self.bulk_set_field("is_hidden", False))
+        edit_menu.addSeparator()
+        edit_menu.addAction("Change Category").triggered.connect(self.bulk_request_category)
+        edit_menu.addSeparator()
+        edit_menu.addAction("Select All").triggered.connect(self.bulk_select_all)
+        edit_menu.addAction("Clear Selection").triggered.connect(self.bulk_clear_selection)
+        edit_btn.setMenu(edit_menu)
+        bar_layout.addWidget(edit_btn)
+
+        done_btn = QPushButton("Done")
+        done_btn.setCursor(Qt.PointingHandCursor)
+        done_btn.setFixedHeight(22)
+        ui_theme.bind_style(done_btn, button_style)
+        done_btn.clicked.connect(lambda: self.set_bulk_select_mode(False))
+        bar_layout.addWidget(done_btn)
+
+        bar.hide()
+        self.bulk_bar = bar
+        return bar
+
     def setup_system_tray(self):
         self.tray_icon = QSystemTrayIcon(self)
         
@@ -961,28 +1102,54 @@ class LauncherWindow(QMainWindow):
         if hasattr(self, "quit_action") and self.quit_action:
             self.quit_action.setIcon(self._build_exit_icon(self._tray_exit_color()))
 
+    def _menu_icon(self, path):
+        # QIcon per path is shared by every tray/mini menu build.
+        cache = getattr(self, "_menu_icon_cache", None)
+        if cache is None:
+            cache = self._menu_icon_cache = {}
+        icon = cache.get(path)
+        if icon is None:
+            icon = QIcon(path) if path and os.path.exists(path) else QIcon()
+            cache[path] = icon
+        return icon
+
     def _add_tray_app_action(self, menu, app):
         icon_path = app.get("icon", "")
         if (not icon_path or not os.path.exists(icon_path)) and app.get("exe"):
             icon_path = app.get("exe")
-        icon = QIcon(icon_path) if icon_path and os.path.exists(icon_path) else QIcon()
-        action = menu.addAction(icon, app["name"])
+        action = menu.addAction(self._menu_icon(icon_path), self._app_menu_label(app))
         action.triggered.connect(lambda _=False, p=app["exe"]: self.launch_app(p))
 
+    def _app_menu_key(self):
+        return (getattr(self, "_catalog_version", 0), tuple(self.CATEGORIES), getattr(self, "_apps_scan_completed", False), self.launcher.version)
+
+    def _app_menu_is_current(self, menu):
+        """True if `menu` was filled for the current catalog; marks it filled otherwise."""
+        key = self._app_menu_key()
+        if getattr(menu, "_built_key", None) == key:
+            return True
+        menu._built_key = key
+        return False
+
+    def _add_apps_placeholder(self, menu):
+        if not getattr(self, "_apps_scan_completed", False):
+            if not getattr(self, "_refresh_pending", False):
+                try:
+                    self.refresh_apps()
+                except Exception:
+                    pass
+            empty = menu.addAction("Loading apps...")
+        else:
+            empty = menu.addAction("No apps found")
+        empty.setEnabled(False)
+
     def _populate_favorites_menu(self, menu):
+        if self._app_menu_is_current(menu):
+            return
         menu.clear()
         apps = self._get_apps_snapshot()
         if not apps:
-            if not getattr(self, "_apps_scan_completed", False):
-                if not getattr(self, "_refresh_pending", False):
-                    try:
-                        self.refresh_apps()
-                    except Exception:
-                        pass
-                empty = menu.addAction("Loading apps...")
-            else:
-                empty = menu.addAction("No apps found")
-            empty.setEnabled(False)
+            self._add_apps_placeholder(menu)
             return
         apps = [a for a in apps if a.get("is_favorite")]
         if not apps:
@@ -993,19 +1160,14 @@ class LauncherWindow(QMainWindow):
             self._add_tray_app_action(menu, app)
 
     def _populate_all_apps_menu(self, menu):
+        # Only the category submenus are created here; each one adds its app
+        # actions the first time it is opened.
+        if self._app_menu_is_current(menu):
+            return
         menu.clear()
         apps = self._get_apps_snapshot()
         if not apps:
-            if not getattr(self, "_apps_scan_completed", False):
-                if not getattr(self, "_refresh_pending", False):
-                    try:
-                        self.refresh_apps()
-                    except Exception:
-                        pass
-                empty = menu.addAction("Loading apps...")
-            else:
-                empty = menu.addAction("No apps found")
-            empty.setEnabled(False)
+            self._add_apps_placeholder(menu)
             return
 
         grouped = {}
@@ -1017,12 +1179,20 @@ class LauncherWindow(QMainWindow):
             if cat not in grouped:
                 continue
             cat_menu = QMenu(cat, menu)
-            for app in grouped[cat]:
-                self._add_tray_app_action(cat_menu, app)
+            self._apply_mini_menu_scale(cat_menu)
+            cat_menu._apps = grouped[cat]
+            cat_menu.aboutToShow.connect(lambda m=cat_menu: self._populate_category_menu(m))
             action = menu.addMenu(cat_menu)
             icon_path = get_category_icon_path(cat)
             if icon_path and os.path.exists(icon_path):
-                action.setIcon(QIcon(icon_path))
+                action.setIcon(self._menu_icon(icon_path))
+
+    def _populate_category_menu(self, menu):
+        if getattr(menu, "_built", False):
+            return
+        menu._built = True
+        for app in getattr(menu, "_apps", []):
+            self._add_tray_app_action(menu, app)
 
     def _populate_tray_favorites_menu(self):
         if not hasattr(self, "tray_favorites_menu"):
@@ -1092,9 +1262,9 @@ class LauncherWindow(QMainWindow):
             for app in pinned_apps:
                 if use_icons and app.get("icon"):
                     icon = QIcon(app["icon"])
-                    action = menu.addAction(icon, app["name"])
+                    action = menu.addAction(icon, self._app_menu_label(app))
                 else:
-                    action = menu.addAction(app["name"])
+                    action = menu.addAction(self._app_menu_label(app))
                 action.triggered.connect(lambda _=False, p=app["exe"]: self.launch_app(p))
             menu.addSeparator()
 
@@ -1117,74 +1287,41 @@ class LauncherWindow(QMainWindow):
 
     def _apply_mini_menu_style(self, menu, force_default=False):
         if (self.mini_menu_background_type == "solid" and self.mini_menu_background_color) and not force_default:
-            if self.mini_menu_text_color == "__rainbow__":
-                text_color = self._current_rainbow_color().name()
-            else:
-                text_color = self.mini_menu_text_color or ("#101318" if QColor(self.mini_menu_background_color).lightness() >= 128 else "#ffffff")
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background-color: {self.mini_menu_background_color};
-                    border: 1px solid {qcolor_to_rgba(COLOR_GLASS_BORDER)};
-                    border-radius: 8px;
-                    padding: 4px;
-                    color: {text_color};
-                }}
-                QMenu::item {{
-                    color: {text_color};
-                    padding: 6px 20px;
-                }}
-                QMenu::item:selected {{
-                    background-color: {COLOR_ACCENT.name()};
-                    color: #ffffff;
-                }}
-            """)
+            background = self.mini_menu_background_color
+            default_text = "#101318" if QColor(self.mini_menu_background_color).lightness() >= 128 else "#ffffff"
         elif (self.mini_menu_background_type == "gradient" and self.mini_menu_background_gradient_start and self.mini_menu_background_gradient_end) and not force_default:
             avg = QColor(self.mini_menu_background_gradient_start)
             avg2 = QColor(self.mini_menu_background_gradient_end)
-            if self.mini_menu_text_color == "__rainbow__":
-                text_color = self._current_rainbow_color().name()
-            else:
-                text_color = self.mini_menu_text_color or ("#101318" if (avg.lightness() + avg2.lightness()) / 2 >= 128 else "#ffffff")
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {self.mini_menu_background_gradient_start}, stop:1 {self.mini_menu_background_gradient_end});
-                    border: 1px solid {qcolor_to_rgba(COLOR_GLASS_BORDER)};
-                    border-radius: 8px;
-                    padding: 4px;
-                    color: {text_color};
-                }}
-                QMenu::item {{
-                    color: {text_color};
-                    padding: 6px 20px;
-                }}
-                QMenu::item:selected {{
-                    background-color: {COLOR_ACCENT.name()};
-                    color: #ffffff;
-                }}
-            """)
+            background = f"qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {self.mini_menu_background_gradient_start}, stop:1 {self.mini_menu_background_gradient_end})"
+            default_text = "#101318" if (avg.lightness() + avg2.lightness()) / 2 >= 128 else "#ffffff"
         else:
-            default_bg = "#060606" if self.effective_theme == "dark" else "#FDFDFD"
-            if self.mini_menu_text_color == "__rainbow__":
-                text_color = self._current_rainbow_color().name()
-            else:
-                text_color = self.mini_menu_text_color or ("#ffffff" if self.effective_theme == "dark" else "#101318")
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background-color: {default_bg};
-                    border: 1px solid {qcolor_to_rgba(COLOR_GLASS_BORDER)};
-                    border-radius: 8px;
-                    padding: 4px;
-                    color: {text_color};
-                }}
-                QMenu::item {{
-                    color: {text_color};
-                    padding: 6px 20px;
-                }}
-                QMenu::item:selected {{
-                    background-color: {COLOR_ACCENT.name()};
-                    color: #ffffff;
-                }}
-            """)
+            background = "#060606" if self.effective_theme == "dark" else "#FDFDFD"
+            default_text = "#ffffff" if self.effective_theme == "dark" else "#101318"
+        if self.mini_menu_text_color == "__rainbow__":
+            text_color = self._current_rainbow_color().name()
+        else:
+            text_color = self.mini_menu_text_color or default_text
+        menu.setStyleSheet(ui_styles.mini_menu_style(background, text_color, COLOR_ACCENT.name(), qcolor_to_rgba(COLOR_GLASS_BORDER)))
+
+    def style_menu(self, menu, role=ui_styles.MENU_ROLE_POPUP):
+        """
+        Style a context/popup menu opened from the window. Normally the menu
+        is just tagged and matched by the window-level sheet; with rainbow
+        text the menu's palette follows the shared driver while it is open.
+        """
+        if self._rainbow.is_active():
+            menu.setStyleSheet(ui_styles.menu_style(role, self.effective_theme, COLOR_TEXT_MAIN.name(), COLOR_ACCENT.name()))
+            self._rainbow.track(menu)
+            return
+        menu.setProperty(ui_styles.MENU_ROLE_PROPERTY, role)
+        self._ensure_menu_styles()
+
+    def _ensure_menu_styles(self):
+        key = (self.effective_theme, COLOR_TEXT_MAIN.name(), COLOR_ACCENT.name())
+        if key == getattr(self, "_menu_style_key", None):
+            return
+        self._menu_style_key = key
+        self.setStyleSheet(ui_styles.window_menu_style(*key))
 
     def _apply_mini_menu_scale(self, menu):
         try:
@@ -1201,113 +1338,97 @@ class LauncherWindow(QMainWindow):
         menu.setFont(font)
 
     def _current_rainbow_color(self):
-        hue = int((time.time() * 60) % 360)
-        return QColor.fromHsv(hue, 255, 255)
+        return ui_rainbow.rainbow_color()
 
     def _start_rainbow(self):
-        if self._rainbow_timer is None:
-            self._rainbow_timer = QTimer(self)
-            self._rainbow_timer.timeout.connect(self._tick_rainbow)
-        if not self._rainbow_timer.isActive():
-            self._rainbow_timer.start(120)
-        self._tick_rainbow()
+        self._rainbow.start()
 
     def _stop_rainbow(self):
-        if self._rainbow_timer and self._rainbow_timer.isActive():
-            self._rainbow_timer.stop()
-
-    def _tick_rainbow(self):
-        color = self._current_rainbow_color()
-        COLOR_TEXT_MAIN.setRgb(color.red(), color.green(), color.blue(), color.alpha())
-        COLOR_TEXT_SUB.setRgb(color.red(), color.green(), color.blue(), 160)
-        self._apply_text_color_to_widgets(color.name())
-
-    def _apply_text_color_to_widgets(self, color_hex):
-        for item in getattr(self, "app_widgets", []):
-            if isinstance(item, CategoryItem):
-                header = getattr(item, "header", None)
-                if header and hasattr(header, "text_label"):
-                    header.text_label.setStyleSheet(f"color: {color_hex}; background: transparent;")
-                if header and hasattr(header, "arrow_label"):
-                    header.arrow_label.setStyleSheet(f"color: {color_hex}; background: transparent;")
-                for child in getattr(item, "app_items", []):
-                    if hasattr(child, "text_label"):
-                        child.text_label.setStyleSheet(f"color: {color_hex}; background: transparent;")
-            else:
-                if hasattr(item, "text_label"):
-                    item.text_label.setStyleSheet(f"color: {color_hex}; background: transparent;")
-        for btn in getattr(self, "quick_buttons", []):
-            if hasattr(btn, "label"):
-                btn.label.setStyleSheet(f"color: {color_hex}; background: transparent;")
+        if not self._rainbow.is_active():
+            return
+        self._rainbow.stop()
+        # The colour rules stripped for the animation come back when the
+        # caller re-applies the theme (bound stylesheets are re-run).
+        for widget in self._rainbow_palette_widgets():
+            widget.setPalette(QPalette())
+        icon_lbl = getattr(getattr(self, "search_bar", None), "icon_lbl", None)
+        if icon_lbl is not None and hasattr(icon_lbl, "set_color"):
+            icon_lbl.set_color(None)
         if hasattr(self, "options_panel") and self.options_panel:
-            try:
-                self.options_panel.apply_rainbow_text(color_hex)
-            except Exception:
-                pass
+            for combo in self.options_panel.findChildren(QComboBox):
+                if hasattr(combo, "set_rainbow_text_color"):
+                    combo.set_rainbow_text_color(None)
+
+    def _rainbow_palette_widgets(self):
+        widgets = []
         if hasattr(self, "close_btn") and self.close_btn:
-            self.close_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    color: {color_hex};
-                    border: none;
-                    font-weight: bold;
-                    font-size: 18px;
-                }}
-                QPushButton:hover {{
-                    color: {color_hex};
-                }}
-                QPushButton:pressed {{
-                    color: {COLOR_ACCENT.name()};
-                }}
-            """)
+            widgets.append(self.close_btn)
         if hasattr(self, "search_bar") and self.search_bar:
+            widgets.append(self.search_bar.input)
+        return widgets
+
+    def _tick_rainbow(self, color):
+        # App, category and quick-button labels repaint themselves from the
+        # driver; only the few stylesheet-backed controls are recoloured here.
+        if not self.isVisible():
+            return
+        for widget in self._rainbow_palette_widgets():
+            if widget.isVisible():
+                ui_rainbow.apply_palette_color(widget, color)
+        icon_lbl = getattr(getattr(self, "search_bar", None), "icon_lbl", None)
+        if icon_lbl is not None and icon_lbl.isVisible():
+            if hasattr(icon_lbl, "set_color"):
+                icon_lbl.set_color(QColor(color))
+            else:
+                icon_lbl.update()
+        if hasattr(self, "options_panel") and self.options_panel and self.options_panel.isVisible():
             try:
-                self.search_bar.input.setStyleSheet(f"""
-                    QLineEdit {{
-                        background: transparent;
-                        border: none;
-                        color: {color_hex};
-                        selection-background-color: {COLOR_ACCENT.name()};
-                    }}
-                """)
-                if hasattr(self.search_bar, "icon_lbl"):
-                    if hasattr(self.search_bar.icon_lbl, "set_color"):
-                        self.search_bar.icon_lbl.set_color(QColor(color_hex))
-                    else:
-                        self.search_bar.icon_lbl.update()
-            except Exception:
-                pass
-        if hasattr(self, "options_panel") and self.options_panel:
-            try:
-                if hasattr(self.options_panel, "search_bar"):
-                    self.options_panel.search_bar.input.setStyleSheet(f"""
-                        QLineEdit {{
-                            background: transparent;
-                            border: none;
-                            color: {color_hex};
-                            selection-background-color: {COLOR_ACCENT.name()};
-                        }}
-                    """)
-                    if hasattr(self.options_panel.search_bar, "icon_lbl"):
-                        if hasattr(self.options_panel.search_bar.icon_lbl, "set_color"):
-                            self.options_panel.search_bar.icon_lbl.set_color(QColor(color_hex))
-                        else:
-                            self.options_panel.search_bar.icon_lbl.update()
-                if hasattr(self.options_panel, "btn_keybind"):
-                    self.options_panel.btn_keybind.setStyleSheet(self.options_panel.get_button_style(font_size=12).replace(COLOR_TEXT_MAIN.name(), color_hex))
-                for combo in self.options_panel.findChildren(QComboBox):
-                    if hasattr(combo, "set_rainbow_text_color"):
-                        combo.set_rainbow_text_color(color_hex)
+                self.options_panel.apply_rainbow_text(color)
             except Exception:
                 pass
 
+    def _menu_signature(self, config, use_icons, force_default):
+        """Everything a built tray/mini menu depends on, or None if it must always be rebuilt."""
+        if self.mini_menu_text_color == "__rainbow__":
+            return None
+        return (
+            tuple(sorted(config.items())),
+            use_icons,
+            force_default,
+            self.mini_menu_background_type,
+            self.mini_menu_background_color,
+            self.mini_menu_background_gradient_start,
+            self.mini_menu_background_gradient_end,
+            self.mini_menu_text_color,
+            self.mini_menu_scale,
+            self.effective_theme,
+            COLOR_ACCENT.name(),
+            qcolor_to_rgba(COLOR_GLASS_BORDER),
+            tuple(self.mini_pinned_apps or []),
+            getattr(self, "_catalog_version", 0),
+            self._pinned_running_key(),
+        )
+
+    def _pinned_running_key(self):
+        pinned = set(self.mini_pinned_apps or [])
+        if not pinned:
+            return ()
+        return tuple(sorted(
+            self.get_app_key(record.app_path) for record in self.launcher.running_records()
+            if self.get_app_key(record.app_path) in pinned
+        ))
+
+    def _app_menu_label(self, app):
+        if self.launcher.is_running(app["exe"]):
+            return f"{app['name']} (running)"
+        return app["name"]
+
     def rebuild_tray_menu(self):
         if not hasattr(self, "tray_icon") or not self.tray_icon:
             return
-        tray_menu = QMenu()
         if self.mini_apply_to_tray:
             config = self._get_mini_menu_config()
-            self._build_custom_menu(tray_menu, config, use_icons=self.mini_show_icons)
+            use_icons, force_default = self.mini_show_icons, False
         else:
             config = {
                 "show_documents": True,
@@ -1319,10 +1440,21 @@ class LauncherWindow(QMainWindow):
                 "show_favorites": True,
                 "show_exit": True,
             }
-            self._build_custom_menu(tray_menu, config, use_icons=True, force_default=True)
+            use_icons, force_default = True, True
 
+        # Settings changes call this a lot; keep the current menu (and the
+        # submenus already filled) unless something it shows has changed.
+        signature = self._menu_signature(config, use_icons, force_default)
+        old_menu = self.tray_icon.contextMenu()
+        if signature is not None and old_menu is not None and signature == getattr(self, "_tray_menu_signature", None):
+            return
+        tray_menu = QMenu()
+        self._build_custom_menu(tray_menu, config, use_icons=use_icons, force_default=force_default)
         tray_menu.aboutToHide.connect(self._on_tray_menu_closed)
         self.tray_icon.setContextMenu(tray_menu)
+        self._tray_menu_signature = signature
+        if old_menu is not None:
+            old_menu.deleteLater()
 
     def on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.Trigger:
@@ -1349,10 +1481,17 @@ class LauncherWindow(QMainWindow):
                 self._mini_menu_instance.close()
             except Exception:
                 pass
-        menu = QMenu()
         config = self._get_mini_menu_config()
-        self._build_custom_menu(menu, config, use_icons=self.mini_show_icons)
-        menu.aboutToHide.connect(self._on_tray_menu_closed)
+        signature = self._menu_signature(config, self.mini_show_icons, False)
+        menu = getattr(self, "_mini_menu_cached", None)
+        if menu is None or signature is None or signature != getattr(self, "_mini_menu_signature", None):
+            if menu is not None:
+                menu.deleteLater()
+            menu = QMenu()
+            self._build_custom_menu(menu, config, use_icons=self.mini_show_icons)
+            menu.aboutToHide.connect(self._on_tray_menu_closed)
+            self._mini_menu_cached = menu
+            self._mini_menu_signature = signature
         self._mini_menu_instance = menu
         menu.exec(QCursor.pos())
 
@@ -1569,12 +1708,58 @@ class LauncherWindow(QMainWindow):
         return msg.exec() == QMessageBox.Yes
 
 
-    def quit_app(self):
+    def _confirm_turbo_quit(self):
+        running = self.turbo.running()
+        if not running:
+            return True
+        names = ", ".join(QFileInfo(path).baseName() for path in running)
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Warning)
+        msg.setWindowTitle("Turbo Launch")
+        msg.setText(f"{names} {'is' if len(running) == 1 else 'are'} still running from this PC.")
+        msg.setInformativeText(
+            "Changes to their data are copied back to the drive the next time you launch them "
+            "with Turbo Launch on this PC. Close them first if the drive is moving to another computer.\n\n"
+            "Exit anyway?"
+        )
+        msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        msg.setDefaultButton(QMessageBox.No)
+        return msg.exec() == QMessageBox.Yes
+
+    def quit_app(self, confirmed=False):
+        if not confirmed and not self._confirm_turbo_quit():
+            return
         self.tray_icon.hide()
+        self.prefetcher.pause()
+        job_pool.job_pool().shutdown()
+        # Mirrored Data of turbo apps that have ended goes back to the stick now.
+        self.turbo.finish()
+        self.prefetcher.history.flush()
+        summary = self.prefetcher.summary()
+        if summary and stats_enabled():
+            print(summary)
+        self.flush_settings()
+        if stats_enabled():
+            stats = settings_store.get_settings_writer().stats()
+            print(f"Settings: {stats['writes']} write(s), {stats['bytes_written']} bytes this session")
         QApplication.quit()
 
+    def flush_settings(self):
+        timer = getattr(self, "_apps_cache_timer", None)
+        if timer is not None and timer.isActive():
+            timer.stop()
+            self._write_apps_cache(getattr(self, "_last_scanned_apps", None))
+        if getattr(self, "_apps_cache_file", None) is not None:
+            self._apps_cache_file.flush()
+        writer = settings_store.get_settings_writer()
+        if not writer.flush():
+            print(f"Settings flush timed out: {writer.last_error or 'write still pending'}")
+
     def restart_app(self):
+        if not self._confirm_turbo_quit():
+            return
         try:
+            self.flush_settings()
             if getattr(sys, "frozen", False):
                 args = [sys.executable] + sys.argv[1:]
             else:
@@ -1582,7 +1767,7 @@ class LauncherWindow(QMainWindow):
                 args = [sys.executable, script] + sys.argv[1:]
             subprocess.Popen(args, cwd=os.getcwd())
         finally:
-            self.quit_app()
+            self.quit_app(confirmed=True)
 
     def register_global_hotkey(self):
         if os.name == 'nt':
@@ -1637,102 +1822,17 @@ class LauncherWindow(QMainWindow):
 
     def showEvent(self, event):
         super().showEvent(event)
+        self.prefetcher.pause()
         if not getattr(self, "_initial_refresh_done", False):
             self._initial_refresh_done = True
             # Let the UI become responsive first, then load apps.
             QTimer.singleShot(900, self.refresh_apps)
 
-    def scan_portable_apps(self):
-        apps = []
-        base_dir = get_base_dir()
-        apps_dir = os.path.join(base_dir, "PortableApps")
-        
-        if not os.path.exists(apps_dir):
-            return []
-
-        # Load Settings
-        settings_config, _ = self.get_settings()
-        allowed_categories = _build_allowed_categories(settings_config, BASE_CATEGORIES)
-        
-        for entry in os.scandir(apps_dir):
-            if entry.is_dir():
-                potential_apps = []
-                ini_path = os.path.join(entry.path, "App", "AppInfo", "appinfo.ini")
-                
-                if os.path.exists(ini_path):
-                    try:
-                        app_config = configparser.ConfigParser()
-                        app_config.read(ini_path)
-                        
-                        name = app_config.get("Details", "Name", fallback=entry.name)
-                        name = name.replace("Portable", "").replace("  ", " ").strip()
-                        category = app_config.get("Details", "Category", fallback="No Category")
-                        start_exe = app_config.get("Control", "Start", fallback=None)
-                        version = app_config.get("Version", "DisplayVersion", fallback="")
-                        description = app_config.get("Details", "Description", fallback="")
-                        
-                        if start_exe:
-                            exe_path = os.path.join(entry.path, start_exe)
-                            
-                            # Icon Logic
-                            icon_path = None
-                            # Priority 1: App/AppInfo/appicon.ico
-                            ico_file = os.path.join(entry.path, "App", "AppInfo", "appicon.ico")
-                            if os.path.exists(ico_file):
-                                icon_path = ico_file
-                            else:
-                                # Priority 2: The executable itself (fallback)
-                                icon_path = exe_path
-                            
-                            potential_apps.append((name, exe_path, icon_path, version, description, category))
-                    except:
-                        pass
-                else:
-                    # Fallback: Scan for .exe files
-                    try:
-                        for file in os.scandir(entry.path):
-                            if file.is_file() and file.name.lower().endswith(".exe"):
-                                name = os.path.splitext(file.name)[0]
-                                name = name.replace("Portable", "").replace("  ", " ").strip()
-                                potential_apps.append((name, file.path, file.path, "", "", "No Category"))
-                    except:
-                        pass
-
-                for name, exe_path, icon_path, version, description, default_cat in potential_apps:
-                    # Check Settings Overrides
-                    is_fav = False
-                    is_hidden = False
-                    category = default_cat
-                    
-                    # Normalize path for config key
-                    key = self.get_app_key(exe_path)
-                    
-                    if settings_config.has_option("Renames", key):
-                        name = settings_config.get("Renames", key)
-                    if settings_config.has_option("Categories", key):
-                        category = settings_config.get("Categories", key)
-                    if settings_config.has_option("Favorites", key):
-                        is_fav = settings_config.getboolean("Favorites", key, fallback=False)
-                    if settings_config.has_option("Hidden", key):
-                        is_hidden = settings_config.getboolean("Hidden", key, fallback=False)
-
-                    category = resolve_category_name(category, allowed_categories)
-                        
-                    if is_hidden and not self.show_hidden:
-                        continue
-                    
-                    apps.append({
-                        "name": name,
-                        "exe": exe_path,
-                        "icon": icon_path,
-                        "is_favorite": is_fav,
-                        "is_hidden": is_hidden,
-                        "category": category,
-                        "version": version,
-                        "description": description
-                    })
-        # Sort: Favorites first, then Name
-        return sorted(apps, key=lambda x: (not x["is_favorite"], x["name"].lower()))
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Sitting in the tray: warm the page cache for the likeliest launches.
+        if self._apps_scan_completed:
+            self.prefetcher.schedule(self._last_scanned_apps)
 
     def _get_apps_cache_path(self):
         try:
@@ -1762,13 +1862,19 @@ class LauncherWindow(QMainWindow):
             return path
         return os.path.normpath(os.path.join(get_base_dir(), path))
 
+    def _apps_cache(self):
+        # Host-local copy in front of the stick's apps_cache.json (host_cache).
+        cache = getattr(self, "_apps_cache_file", None)
+        if cache is None:
+            cache = self._apps_cache_file = host_cache.TieredFile(self._get_apps_cache_path(), self)
+        return cache
+
     def _load_apps_cache(self):
-        cache_path = self._get_apps_cache_path()
-        if not os.path.exists(cache_path):
-            return None
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            data = self._apps_cache().read()
+            if data is None:
+                return None
+            payload = json.loads(data.decode("utf-8"))
         except Exception:
             return None
         if not isinstance(payload, dict):
@@ -1788,7 +1894,6 @@ class LauncherWindow(QMainWindow):
 
     def _write_apps_cache(self, apps):
         try:
-            cache_path = self._get_apps_cache_path()
             payload = {
                 "version": 1,
                 "apps": [],
@@ -1806,8 +1911,7 @@ class LauncherWindow(QMainWindow):
                     "version": app.get("version", ""),
                     "description": app.get("description", ""),
                 })
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f)
+            self._apps_cache().write(json.dumps(payload).encode("utf-8"))
         except Exception:
             pass
 
@@ -1939,6 +2043,7 @@ class LauncherWindow(QMainWindow):
             "window_y": config.get("Settings", "WindowY", fallback=None),
             "updates_repo": updates_repo,
             "updates_auto_check": updates_auto_check,
+            "indexed_settings": settings_store.is_indexed(),
             "updates_interval_hours": updates_interval_hours,
             "updates_last_check_epoch": updates_last_check_epoch,
         }
@@ -2023,7 +2128,14 @@ class LauncherWindow(QMainWindow):
 
     def refresh_apps(self):
         if getattr(self, "_refresh_pending", False):
+            scanning = job_pool.job_pool().is_busy(self.APP_SCAN_JOB)
+            if not (scanning and settings_store.generation() != self._scan_generation):
+                # Coalesced into at most one follow-up, run when this refresh lands.
+                # (A settings change during the scan is picked up by the scan
+                # itself, or by _on_app_scan_finished if it came too late.)
+                self._refresh_queued = True
             return
+        self._refresh_queued = False
         self._refresh_pending = True
         self._set_loading(True)
         if not getattr(self, "_cache_loaded", False):
@@ -2034,38 +2146,25 @@ class LauncherWindow(QMainWindow):
         self._start_app_scan()
 
     def _start_app_scan(self):
-        try:
-            if hasattr(self, "_scan_thread") and self._scan_thread and self._scan_thread.isRunning():
-                return
-        except Exception:
-            pass
-        try:
-            self._scan_thread = QThread(self)
-            self._scan_worker = AppScanWorker(get_base_dir(), True)
-            self._scan_worker.moveToThread(self._scan_thread)
-            self._scan_thread.started.connect(self._scan_worker.run)
-            self._scan_worker.finished.connect(self._scan_thread.quit)
-            self._scan_worker.error.connect(self._scan_thread.quit)
-            self._scan_worker.finished.connect(self._scan_worker.deleteLater)
-            self._scan_worker.error.connect(self._scan_worker.deleteLater)
-            self._scan_thread.finished.connect(self._scan_thread.deleteLater)
-            self._scan_worker.finished.connect(self._on_app_scan_finished)
-            self._scan_worker.error.connect(self._on_app_scan_error)
-            self._scan_thread.start()
-        except Exception:
-            # Fallback to synchronous scan if thread startup fails
-            try:
-                apps = _scan_portable_apps_on_disk(get_base_dir(), True)
-            except Exception:
-                apps = []
-            try:
-                self._last_scanned_apps = list(apps or [])
-            except Exception:
-                self._last_scanned_apps = []
-            self._apps_scan_completed = True
-            self._refresh_apps_from_scan(apps)
+        # Keyed: a newer scan cancels one still running instead of being dropped.
+        self._scan_generation = settings_store.generation()
+        job = job_pool.submit(
+            _scan_app_catalog, get_base_dir(), True,
+            priority=job_pool.PRIORITY_UI, name="app_scan", key=self.APP_SCAN_JOB, pass_token=True,
+        )
+        job.finished.connect(self._on_app_scan_finished)
+        job.failed.connect(self._on_app_scan_error)
 
-    def _on_app_scan_finished(self, apps):
+    def _on_app_scan_finished(self, result):
+        if result is None:
+            # Superseded by a settings change mid-scan; go again with the new settings.
+            self._start_app_scan()
+            return
+        generation, inputs, apps = result
+        if generation != settings_store.generation() and _scan_inputs(settings_store.load_settings()) != inputs:
+            # Changed after the scan's last check (while the result was on its
+            # way here): show this one, then scan again with the new settings.
+            self._refresh_queued = True
         try:
             self._last_scanned_apps = list(apps or [])
         except Exception:
@@ -2073,11 +2172,16 @@ class LauncherWindow(QMainWindow):
         self._apps_scan_completed = True
         self._write_apps_cache(apps)
         self._refresh_apps_from_scan(apps)
-        try:
-            if self.mini_pinned_apps:
-                QTimer.singleShot(0, self.rebuild_tray_menu)
-        except Exception:
-            pass
+        self._catalog_changed()
+        if not self.isVisible():
+            # Started minimized (no hideEvent) or rescanned from the tray.
+            self.prefetcher.schedule(self._last_scanned_apps)
+
+    def _catalog_changed(self):
+        # Menus and pickers built from the catalog compare against this.
+        self._catalog_version = getattr(self, "_catalog_version", 0) + 1
+        self.rebuild_tray_menu()
+        self.catalog_updated.emit()
 
     def _on_app_scan_error(self, error):
         try:
@@ -2090,10 +2194,13 @@ class LauncherWindow(QMainWindow):
             pass
         self._apps_scan_completed = True
         self._refresh_apps_from_scan([])
+        self._catalog_changed()
 
     def _refresh_apps_from_scan(self, apps, keep_loading=False, keep_pending=False):
         build_token = getattr(self, "_build_token", 0) + 1
         self._build_token = build_token
+        scheduler = ui_scheduler.build_scheduler()
+        scheduler.cancel(self.APP_VIEW_BUILD)
         apps = self._filter_apps_for_view(apps or [])
         # Save expansion state
         self._favorites_separator = None
@@ -2181,11 +2288,14 @@ class LauncherWindow(QMainWindow):
                 "cell_h": cell_h,
             }
 
-            def _build_grid_chunk():
+            # Tiles that fit in the viewport are built first; the rest yield to other visible work.
+            viewport_h = self.scroll.viewport().height() if getattr(self, "scroll", None) else 0
+            visible_count = cols * (max(1, viewport_h // cell_h) + 1)
+
+            def _build_grid_step():
                 if build_token != self._build_token:
-                    return
-                count = 0
-                while state["index"] < len(state["apps"]) and count < 32:
+                    return False
+                if state["index"] < len(state["apps"]):
                     app = state["apps"][state["index"]]
                     state["index"] += 1
                     font_size = None
@@ -2220,26 +2330,30 @@ class LauncherWindow(QMainWindow):
                         tile_height=cell_h,
                         font_size=font_size,
                     )
-                    item.clicked.connect(self.launch_app)
+                    item.clicked.connect(self._on_app_item_clicked)
+                    item.set_selected(app["exe"] in self._bulk_selected)
+                    item.set_running(self.launcher.is_running(app["exe"]))
                     self.app_widgets.append(item)
                     self.app_grid_layout.addWidget(item, state["row"], state["col"])
                     state["col"] += 1
                     if state["col"] >= state["cols"]:
                         state["col"] = 0
                         state["row"] += 1
-                    count += 1
+                    if state["index"] >= visible_count:
+                        state["job"].priority = ui_scheduler.PRIORITY_NORMAL
+                return state["index"] < len(state["apps"])
 
-                if state["index"] < len(state["apps"]):
-                    QTimer.singleShot(0, _build_grid_chunk)
-                else:
-                    if not keep_loading:
-                        self._set_loading(False)
-                    if not keep_pending:
-                        self._refresh_pending = False
-                    if hasattr(self, "search_bar") and self.search_bar:
-                        self.filter_apps(self.search_bar.input.text())
-
-            QTimer.singleShot(0, _build_grid_chunk)
+            def _finish_grid_build():
+                if build_token != self._build_token:
+                    return
+                if not keep_loading:
+                    self._set_loading(False)
+                if not keep_pending:
+                    self._end_refresh()
+                if hasattr(self, "search_bar") and self.search_bar:
+                    self.filter_apps(self.search_bar.input.text())
+
+            state["job"] = scheduler.submit(_build_grid_step, token=self.APP_VIEW_BUILD, priority=ui_scheduler.PRIORITY_VISIBLE, on_done=_finish_grid_build)
             return
 
         # Group by category
@@ -2278,57 +2392,166 @@ class LauncherWindow(QMainWindow):
             if not keep_loading:
                 self._set_loading(False)
             if not keep_pending:
-                self._refresh_pending = False
+                self._end_refresh()
             if hasattr(self, "search_bar") and self.search_bar:
                 self.filter_apps(self.search_bar.input.text())
             return
 
-        state = {"index": 0}
+        state = {"index": 0, "rows": 0}
+        # Rows that fit in the viewport are built first; the rest yield to other visible work.
+        viewport_h = self.scroll.viewport().height() if getattr(self, "scroll", None) else 0
+        visible_count = viewport_h // 33 + 1
 
-        def _build_list_chunk():
+        def _build_list_step():
             if build_token != self._build_token:
-                return
-            count = 0
-            while state["index"] < len(build_tasks) and count < 24:
+                return False
+            if state["index"] < len(build_tasks):
                 task = build_tasks[state["index"]]
                 state["index"] += 1
                 kind = task[0]
                 if kind == "item":
-                    app = task[1]
-                    item = AppListItem(app["name"], app["icon"], app["exe"], app["is_favorite"], app["is_hidden"], app["category"], app["version"], app["description"])
-                    item.clicked.connect(self.launch_app)
+                    item = self._make_list_item(task[1])
                     self.app_widgets.append(item)
                     self.app_list_layout.insertWidget(self.app_list_layout.count()-1, item)
                 elif kind == "separator":
-                    line = QFrame()
-                    line.setFixedHeight(1)
-                    line.setStyleSheet(f"background-color: {qcolor_to_rgba(COLOR_GLASS_BORDER)}; margin: 4px 5px;")
+                    line = self._make_favorites_separator()
                     self.app_list_layout.insertWidget(self.app_list_layout.count()-1, line)
                     self._favorites_separator = line
                 elif kind == "category":
                     cat = task[1]
-                    cat_apps = task[2]
-                    icon_path = get_category_icon_path(cat)
-                    cat_item = CategoryItem(cat, icon_path, cat_apps, parent=self.app_list_container, lazy=True)
-                    cat_item.app_clicked.connect(self.launch_app)
-                    cat_item.toggled.connect(self.on_category_toggled)
+                    cat_item = self._make_category_item(cat, task[2])
                     if self.expand_default or cat in expanded_categories:
+                        # Its rows stream in at this job's priority, ahead of later headers once off screen.
+                        cat_item.schedule_items(self.APP_VIEW_BUILD, state["job"].priority)
                         cat_item.set_expanded(True)
+                        state["rows"] += len(task[2])
                     self.app_list_layout.insertWidget(self.app_list_layout.count()-1, cat_item)
                     self.app_widgets.append(cat_item)
-                count += 1
+                state["rows"] += 1
+                if state["rows"] >= visible_count:
+                    state["job"].priority = ui_scheduler.PRIORITY_NORMAL
+            return state["index"] < len(build_tasks)
 
-            if state["index"] < len(build_tasks):
-                QTimer.singleShot(0, _build_list_chunk)
-            else:
-                if not keep_loading:
-                    self._set_loading(False)
-                if not keep_pending:
-                    self._refresh_pending = False
-                if hasattr(self, "search_bar") and self.search_bar:
-                    self.filter_apps(self.search_bar.input.text())
+        def _finish_list_build():
+            if build_token != self._build_token:
+                return
+            if not keep_loading:
+                self._set_loading(False)
+            if not keep_pending:
+                self._end_refresh()
+            if hasattr(self, "search_bar") and self.search_bar:
+                self.filter_apps(self.search_bar.input.text())
+
+        state["job"] = scheduler.submit(_build_list_step, token=self.APP_VIEW_BUILD, priority=ui_scheduler.PRIORITY_VISIBLE, on_done=_finish_list_build)
+
+    def _end_refresh(self):
+        self._refresh_pending = False
+        if self._refresh_queued:
+            self._refresh_queued = False
+            self.refresh_apps()
+
+    def _make_list_item(self, app):
+        item = AppListItem(app["name"], app["icon"], app["exe"], app["is_favorite"], app["is_hidden"], app["category"], app["version"], app["description"])
+        item.clicked.connect(self._on_app_item_clicked)
+        item.set_selected(app["exe"] in self._bulk_selected)
+        item.set_running(self.launcher.is_running(app["exe"]))
+        return item
+
+    def _make_favorites_separator(self):
+        line = QFrame()
+        line.setFixedHeight(1)
+        line.setStyleSheet(f"background-color: {qcolor_to_rgba(COLOR_GLASS_BORDER)}; margin: 4px 5px;")
+        return line
+
+    def _make_category_item(self, cat, cat_apps):
+        icon_path = get_category_icon_path(cat)
+        cat_item = CategoryItem(cat, icon_path, cat_apps, parent=self.app_list_container, lazy=True)
+        cat_item.app_clicked.connect(self._on_app_item_clicked)
+        cat_item.selection = self._bulk_selected
+        cat_item.is_running = self.launcher.is_running
+        cat_item.toggled.connect(self.on_category_toggled)
+        return cat_item
+
+    def _move_app_row(self, app):
+        """
+        Re-place one app in the list view: drop its old row and insert a fresh
+        one at its sorted position (favorites, category or top level) without
+        rebuilding the rest of the list.
+        """
+        exe_path = app.get("exe", "")
+        layout = self.app_list_layout
+        for widget in list(self.app_widgets):
+            if isinstance(widget, CategoryItem):
+                if widget.remove_app(exe_path) and not widget.apps_data:
+                    self.app_widgets.remove(widget)
+                    layout.removeWidget(widget)
+                    widget.deleteLater()
+            elif getattr(widget, "exe_path", None) == exe_path:
+                self.app_widgets.remove(widget)
+                layout.removeWidget(widget)
+                widget.deleteLater()
 
-        QTimer.singleShot(0, _build_list_chunk)
+        if app.get("is_hidden") and not self.show_hidden:
+            self._sync_favorites_separator()
+            return
+
+        def _item_key(widget):
+            return (not widget.is_favorite, widget.name.lower())
+
+        merge_favorites = getattr(self, "_merge_favorites_in_list", False)
+        key = _app_sort_key(app)
+        top_items = [w for w in self.app_widgets if isinstance(w, AppListItem)]
+        categories = [w for w in self.app_widgets if isinstance(w, CategoryItem)]
+        loose_items = top_items if merge_favorites else [w for w in top_items if not w.is_favorite]
+        cat = app.get("category") or "No Category"
+
+        if app.get("is_favorite") and not merge_favorites:
+            favorites = [w for w in top_items if w.is_favorite]
+            anchor = next((w for w in favorites if _item_key(w) > key), None)
+            if anchor is None:
+                anchor = self._favorites_separator or next(iter(categories + loose_items), None)
+            widget = self._make_list_item(app)
+        elif cat == "No Category":
+            anchor = next((w for w in loose_items if _item_key(w) > key), None)
+            widget = self._make_list_item(app)
+        else:
+            cat_item = next((w for w in categories if w.name == cat), None)
+            if cat_item is not None:
+                cat_item.insert_app(app, _app_sort_key)
+                self._sync_favorites_separator()
+                return
+            anchor = next((w for w in categories if w.name > cat), None)
+            if anchor is None:
+                anchor = next(iter(loose_items), None)
+            widget = self._make_category_item(cat, [app])
+
+        index = layout.indexOf(anchor) if anchor is not None else -1
+        if index < 0:
+            index = layout.count() - 1
+        layout.insertWidget(index, widget)
+        self.app_widgets.append(widget)
+        self._sync_favorites_separator()
+
+    def _sync_favorites_separator(self):
+        layout = self.app_list_layout
+        merge_favorites = getattr(self, "_merge_favorites_in_list", False)
+        favorites = [w for w in self.app_widgets if isinstance(w, AppListItem) and w.is_favorite]
+        others = [w for w in self.app_widgets if w not in favorites]
+        needed = bool(favorites and others and not merge_favorites)
+        line = getattr(self, "_favorites_separator", None)
+        if line is not None:
+            layout.removeWidget(line)
+            if not needed:
+                line.deleteLater()
+                self._favorites_separator = None
+                return
+        if not needed:
+            return
+        if line is None:
+            line = self._make_favorites_separator()
+            self._favorites_separator = line
+        index = max(layout.indexOf(w) for w in favorites) + 1
+        layout.insertWidget(index, line)
 
     def _set_loading(self, visible):
         if hasattr(self, "loading_container") and self.loading_container:
@@ -2341,42 +2564,74 @@ class LauncherWindow(QMainWindow):
                     w.set_expanded(False, animate=True)
 
     def launch_app(self, exe_path):
-        if exe_path and os.path.exists(exe_path):
-            key = self.get_app_key(exe_path)
-            if key in set(self.protected_apps or []) and self._password_is_set():
-                if not self._prompt_password("Protected App", "Enter password to launch this app:"):
-                    return
-            if self.confirm_launch:
-                name = QFileInfo(exe_path).baseName() or "this app"
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Question)
-                msg.setWindowTitle("Launch App")
-                msg.setText(f"Launch {name}?")
-                msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-                msg.setDefaultButton(QMessageBox.Yes)
-                if msg.exec() != QMessageBox.Yes:
-                    return
-            try:
-                subprocess.Popen(exe_path, cwd=os.path.dirname(exe_path))
-            except Exception as e:
-                # If the app requires elevation, re-run with UAC prompt
-                if isinstance(e, OSError) and getattr(e, "winerror", None) == 740:
-                    try:
-                        ctypes.windll.shell32.ShellExecuteW(
-                            None,
-                            "runas",
-                            exe_path,
-                            None,
-                            os.path.dirname(exe_path),
-                            1,
-                        )
-                    except Exception as inner:
-                        print(f"Error launching {exe_path} (elevation failed): {inner}")
-                else:
-                    print(f"Error launching {exe_path}: {e}")
-            self._maybe_reset_home_state()
-            if not self.keep_visible_after_launch:
-                self.animate_hide()
+        # Path checks and process creation happen on the job pool (app_launcher).
+        if not exe_path or self.launcher.is_launching(exe_path):
+            return
+        key = self.get_app_key(exe_path)
+        if key in set(self.protected_apps or []) and self._password_is_set():
+            if not self._prompt_password("Protected App", "Enter password to launch this app:"):
+                return
+        if self.launcher.is_running(exe_path) and self.launcher.focus(exe_path):
+            # Bring the open instance forward instead of starting a duplicate.
+            self._after_launch()
+            return
+        if self.confirm_launch:
+            name = QFileInfo(exe_path).baseName() or "this app"
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Question)
+            msg.setWindowTitle("Launch App")
+            msg.setText(f"Launch {name}?")
+            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            msg.setDefaultButton(QMessageBox.Yes)
+            if msg.exec() != QMessageBox.Yes:
+                return
+        if self.turbo.is_enabled(exe_path):
+            job = self.turbo.launch(exe_path)
+        else:
+            job = self.launcher.launch(exe_path)
+        if job is not None:
+            self._user_launches.add(os.path.normcase(os.path.normpath(exe_path)))
+
+    def _on_app_launched(self, record):
+        key = os.path.normcase(os.path.normpath(record.app_path))
+        if key in self._user_launches:
+            self._user_launches.discard(key)
+            self._after_launch()
+
+    def _on_app_launch_failed(self, exe_path, error):
+        key = os.path.normcase(os.path.normpath(exe_path))
+        if key not in self._user_launches:
+            return
+        self._user_launches.discard(key)
+        name = QFileInfo(exe_path).baseName() or "the app"
+        QMessageBox.warning(self, "Launch App", f"Could not start {name}.\n\n{error}")
+
+    def is_turbo(self, exe_path):
+        return self.turbo.is_enabled(exe_path)
+
+    def toggle_turbo(self, exe_path):
+        self.turbo.set_enabled(exe_path, not self.turbo.is_enabled(exe_path))
+
+    def _show_turbo_status(self, text):
+        try:
+            if hasattr(self, "tray_icon") and self.tray_icon:
+                self.tray_icon.showMessage("Turbo Launch", text, QSystemTrayIcon.Information, 8000)
+        except Exception:
+            pass
+
+    def _after_launch(self):
+        self._maybe_reset_home_state()
+        if not self.keep_visible_after_launch:
+            self.animate_hide()
+
+    def _on_app_running_changed(self, exe_path):
+        target = os.path.normcase(os.path.normpath(exe_path))
+        running = self.launcher.is_running(exe_path)
+        for item in self._iter_app_items():
+            if os.path.normcase(os.path.normpath(item.exe_path)) == target:
+                item.set_running(running)
+        if self.mini_pinned_apps:
+            self.rebuild_tray_menu()
 
     def handle_quick_button(self, name):
         base_dir = get_base_dir()
@@ -2566,6 +2821,7 @@ class LauncherWindow(QMainWindow):
         self.options_panel.fix_settings_clicked.connect(self.run_fix_settings)
         self.options_panel.check_updates_clicked.connect(lambda: self.check_for_updates(manual=True))
         self.options_panel.updates_auto_check_toggled.connect(self.set_updates_auto_check)
+        self.options_panel.indexed_settings_toggled.connect(self.set_indexed_settings)
         self.options_panel.browser_changed.connect(self.set_default_browser)
         self.options_panel.browser_install_clicked.connect(self.open_browser_download)
         self.options_panel.browser_open_folder_clicked.connect(self.open_browser_folder)
@@ -2636,37 +2892,7 @@ class LauncherWindow(QMainWindow):
 
     def show_apps_menu(self):
         menu = QMenu(self)
-        dark = self.effective_theme == "dark"
-        bg = "#1b1f26" if dark else "#FDFDFD"
-        fg = COLOR_TEXT_MAIN.name()
-        border = "rgba(255, 255, 255, 0.2)" if dark else "rgba(0, 0, 0, 0.2)"
-        def _apply_style():
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background-color: {bg};
-                    color: {COLOR_TEXT_MAIN.name()};
-                    border: 1px solid {border};
-                    padding-left: 1px;
-                }}
-                QMenu::icon {{
-                    margin-left: 1px;
-                    margin-right: 4px;
-                }}
-                QMenu::item {{
-                    padding: 6px 12px 6px 7px;
-                    color: {COLOR_TEXT_MAIN.name()};
-                }}
-                QMenu::item:selected {{
-                    background-color: {COLOR_ACCENT.name()};
-                    color: #ffffff;
-                }}
-            """)
-        _apply_style()
-        if self.text_color == "__rainbow__":
-            timer = QTimer(menu)
-            timer.timeout.connect(_apply_style)
-            timer.start(120)
-            menu.aboutToHide.connect(timer.stop)
+        self.style_menu(menu, ui_styles.MENU_ROLE_POPUP)
 
         base_dir = get_base_dir()
         icon_dir = os.path.join(base_dir, "PortableApps", "PortableX", "Graphics", "sidebaricons")
@@ -3109,6 +3335,14 @@ class LauncherWindow(QMainWindow):
         except Exception:
             pass
 
+    def set_indexed_settings(self, enabled):
+        ok = settings_store.set_indexed(enabled)
+        if not ok:
+            print(f"Failed to switch settings storage: {settings_store.get_settings_writer().last_error}")
+        self.settings["indexed_settings"] = settings_store.is_indexed()
+        if hasattr(self, "options_panel") and self.options_panel:
+            self.options_panel.settings["indexed_settings"] = self.settings["indexed_settings"]
+
     def _read_updates_config(self):
         enabled = True
         repo = ""
@@ -3141,15 +3375,14 @@ class LauncherWindow(QMainWindow):
 
     def _write_settings_value_quiet(self, section, key, value):
         try:
-            config, path = self.get_settings()
+            config, _ = self.get_settings()
             if not config.has_section(section):
                 config.add_section(section)
             if value is None:
                 config.remove_option(section, key)
             else:
                 config.set(section, key, str(value))
-            with open(path, "w") as f:
-                config.write(f)
+            self.save_settings(config)
         except Exception:
             pass
 
@@ -3233,19 +3466,9 @@ class LauncherWindow(QMainWindow):
         self._write_settings_value_quiet("Updates", "LastCheckEpoch", str(int(time.time())))
 
         try:
-            self._update_thread = QThread(self)
-            self._update_worker = UpdateCheckWorker(repo)
-            self._update_worker.moveToThread(self._update_thread)
-            self._update_thread.started.connect(self._update_worker.run)
-            # Connect directly to ensure the slot runs on the GUI thread (queued connection).
-            self._update_worker.finished.connect(self._on_update_check_finished)
-            self._update_worker.error.connect(self._on_update_check_failed)
-            self._update_worker.finished.connect(self._update_worker.deleteLater)
-            self._update_worker.error.connect(self._update_worker.deleteLater)
-            self._update_worker.finished.connect(self._update_thread.quit)
-            self._update_worker.error.connect(self._update_thread.quit)
-            self._update_thread.finished.connect(self._update_thread.deleteLater)
-            self._update_thread.start()
+            job = job_pool.submit(update_checker.get_latest_github_release, repo, name="update_check", key="update_check")
+            job.finished.connect(self._on_update_check_finished)
+            job.failed.connect(self._on_update_check_failed)
         except Exception as e:
             self._on_update_check_failed(str(e))
 
@@ -3495,38 +3718,7 @@ class LauncherWindow(QMainWindow):
 
     def show_search_menu(self):
         menu = QMenu(self)
-        dark = self.effective_theme == "dark"
-        bg = "#1b1f26" if dark else "#FDFDFD"
-        border = "rgba(255, 255, 255, 0.2)" if dark else "rgba(0, 0, 0, 0.2)"
-
-        def _apply_style():
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background-color: {bg};
-                    color: {COLOR_TEXT_MAIN.name()};
-                    border: 1px solid {border};
-                    padding-left: 1px;
-                }}
-                QMenu::icon {{
-                    margin-left: 1px;
-                    margin-right: 4px;
-                }}
-                QMenu::item {{
-                    padding: 6px 12px 6px 7px;
-                    color: {COLOR_TEXT_MAIN.name()};
-                }}
-                QMenu::item:selected {{
-                    background-color: {COLOR_ACCENT.name()};
-                    color: #ffffff;
-                }}
-            """)
-
-        _apply_style()
-        if self.text_color == "__rainbow__":
-            timer = QTimer(menu)
-            timer.timeout.connect(_apply_style)
-            timer.start(120)
-            menu.aboutToHide.connect(timer.stop)
+        self.style_menu(menu, ui_styles.MENU_ROLE_POPUP)
 
         base_dir = get_base_dir()
         icon_dir = os.path.join(base_dir, "PortableApps", "PortableX", "Graphics", "sidebaricons")
@@ -3642,78 +3834,48 @@ class LauncherWindow(QMainWindow):
             self.refresh_apps()
         self.show_apps_view()
 
-    def open_pinned_apps_dialog(self):
-        apps = self.scan_portable_apps()
+    def _picker_apps(self):
+        """Apps for the picker dialogs, straight from the cached catalog."""
+        apps = self._filter_apps_for_view(self._get_apps_snapshot())
+        if not apps and not getattr(self, "_apps_scan_completed", False):
+            self.refresh_apps()
+        return apps
+
+    def _build_app_picker_dialog(self, title, checked_keys=None, columns=None, apps_filter=None):
         dlg = QDialog(self)
-        dlg.setWindowTitle("Pinned Apps")
+        dlg.setWindowTitle(title)
         dlg.setModal(True)
         layout = QVBoxLayout(dlg)
-        tree = QTreeWidget()
-        tree.setColumnCount(2)
-        tree.setHeaderHidden(True)
-        tree.setRootIsDecorated(False)
-        tree.setIndentation(14)
-        tree.setTextElideMode(Qt.ElideNone)
-        tree.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
-        tree.header().setSectionResizeMode(1, QHeaderView.Fixed)
-        tree.setColumnWidth(1, 18)
-        pinned = set(self.mini_pinned_apps or [])
-        grouped = {}
-        for app in apps:
-            cat = app.get("category", "No Category") or "No Category"
-            grouped.setdefault(cat, []).append(app)
-
-        for cat in self.CATEGORIES:
-            if cat not in grouped:
-                continue
-            cat_item = QTreeWidgetItem([cat])
-            cat_item.setFlags(cat_item.flags() & ~Qt.ItemIsSelectable)
-            cat_icon = get_category_icon_path(cat)
-            if cat_icon and os.path.exists(cat_icon):
-                cat_item.setIcon(0, QIcon(cat_icon))
-            tree.addTopLevelItem(cat_item)
-            toggle_btn = QToolButton()
-            toggle_btn.setCheckable(True)
-            toggle_btn.setChecked(True)
-            toggle_btn.setArrowType(Qt.DownArrow)
-            toggle_btn.setCursor(Qt.PointingHandCursor)
-            toggle_btn.setFixedSize(12, 12)
-            toggle_btn.setStyleSheet("QToolButton { border: none; background: transparent; }")
-            def _make_toggle(item, btn):
-                def _toggle():
-                    expanded = btn.isChecked()
-                    item.setExpanded(expanded)
-                    btn.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
-                return _toggle
-            toggle_btn.clicked.connect(_make_toggle(cat_item, toggle_btn))
-            tree.setItemWidget(cat_item, 1, toggle_btn)
-            for app in grouped[cat]:
-                key = self.get_app_key(app["exe"])
-                item = QTreeWidgetItem([app["name"]])
-                icon_path = app.get("icon", "")
-                if icon_path and os.path.exists(icon_path):
-                    item.setIcon(0, QIcon(icon_path))
-                item.setData(0, Qt.UserRole, key)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(0, Qt.Checked if key in pinned else Qt.Unchecked)
-                cat_item.addChild(item)
-        tree.expandAll()
-        layout.addWidget(tree)
-
+        picker = AppPicker(self.get_app_key, columns=columns, parent=dlg)
+
+        def _load():
+            apps = self._picker_apps()
+            if apps_filter:
+                apps = apps_filter(apps)
+            picker.set_apps(apps, self.CATEGORIES)
+
+        _load()
+        picker.set_checked(checked_keys)
+        # A scan that finishes while the dialog is open fills it in place.
+        self.catalog_updated.connect(_load)
+        dlg.finished.connect(lambda _result: self.catalog_updated.disconnect(_load))
+        layout.addWidget(picker)
+        picker.search.setFocus()
+        return dlg, picker
+
+    def _pick_app_keys(self, title, checked_keys):
+        dlg, picker = self._build_app_picker_dialog(title, checked_keys)
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        layout.addWidget(buttons)
+        dlg.layout().addWidget(buttons)
         buttons.accepted.connect(dlg.accept)
         buttons.rejected.connect(dlg.reject)
-
         if dlg.exec() == QDialog.Accepted:
-            selected = []
-            for i in range(tree.topLevelItemCount()):
-                cat_item = tree.topLevelItem(i)
-                for j in range(cat_item.childCount()):
-                    item = cat_item.child(j)
-                    if item.checkState(0) == Qt.Checked:
-                        selected.append(item.data(0, Qt.UserRole))
+            return picker.checked_keys()
+        return None
+
+    def open_pinned_apps_dialog(self):
+        selected = self._pick_app_keys("Pinned Apps", self.mini_pinned_apps or [])
+        if selected is not None:
             self.mini_pinned_apps = selected
             self.update_setting("Settings", "MiniPinnedApps", self._serialize_pinned_apps(selected))
             self.rebuild_tray_menu()
@@ -3725,154 +3887,14 @@ class LauncherWindow(QMainWindow):
                     self.options_panel.mini_preview.update_config(self.settings)
 
     def open_startup_apps_dialog(self):
-        apps = self.scan_portable_apps()
-        dlg = QDialog(self)
-        dlg.setWindowTitle("Startup Apps")
-        dlg.setModal(True)
-        layout = QVBoxLayout(dlg)
-        tree = QTreeWidget()
-        tree.setColumnCount(2)
-        tree.setHeaderHidden(True)
-        tree.setRootIsDecorated(False)
-        tree.setIndentation(14)
-        tree.setTextElideMode(Qt.ElideNone)
-        tree.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
-        tree.header().setSectionResizeMode(1, QHeaderView.Fixed)
-        tree.setColumnWidth(1, 18)
-
-        selected = set(self.startup_apps or [])
-        grouped = {}
-        for app in apps:
-            cat = app.get("category", "No Category") or "No Category"
-            grouped.setdefault(cat, []).append(app)
-
-        for cat in self.CATEGORIES:
-            if cat not in grouped:
-                continue
-            cat_item = QTreeWidgetItem([cat])
-            cat_item.setFlags(cat_item.flags() & ~Qt.ItemIsSelectable)
-            cat_icon = get_category_icon_path(cat)
-            if cat_icon and os.path.exists(cat_icon):
-                cat_item.setIcon(0, QIcon(cat_icon))
-            tree.addTopLevelItem(cat_item)
-            toggle_btn = QToolButton()
-            toggle_btn.setCheckable(True)
-            toggle_btn.setChecked(True)
-            toggle_btn.setArrowType(Qt.DownArrow)
-            toggle_btn.setCursor(Qt.PointingHandCursor)
-            toggle_btn.setFixedSize(12, 12)
-            toggle_btn.setStyleSheet("QToolButton { border: none; background: transparent; }")
-            def _make_toggle(item, btn):
-                def _toggle():
-                    expanded = btn.isChecked()
-                    item.setExpanded(expanded)
-                    btn.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
-                return _toggle
-            toggle_btn.clicked.connect(_make_toggle(cat_item, toggle_btn))
-            tree.setItemWidget(cat_item, 1, toggle_btn)
-            for app in grouped[cat]:
-                key = self.get_app_key(app["exe"])
-                item = QTreeWidgetItem([app["name"]])
-                icon_path = app.get("icon", "")
-                if icon_path and os.path.exists(icon_path):
-                    item.setIcon(0, QIcon(icon_path))
-                item.setData(0, Qt.UserRole, key)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(0, Qt.Checked if key in selected else Qt.Unchecked)
-                cat_item.addChild(item)
-        tree.expandAll()
-        layout.addWidget(tree)
-
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        layout.addWidget(buttons)
-        buttons.accepted.connect(dlg.accept)
-        buttons.rejected.connect(dlg.reject)
-
-        if dlg.exec() == QDialog.Accepted:
-            selected_keys = []
-            for i in range(tree.topLevelItemCount()):
-                cat_item = tree.topLevelItem(i)
-                for j in range(cat_item.childCount()):
-                    item = cat_item.child(j)
-                    if item.checkState(0) == Qt.Checked:
-                        selected_keys.append(item.data(0, Qt.UserRole))
+        selected_keys = self._pick_app_keys("Startup Apps", self.startup_apps or [])
+        if selected_keys is not None:
             self.startup_apps = selected_keys
             self.update_setting("Settings", "StartupApps", self._serialize_pinned_apps(selected_keys))
 
     def open_protected_apps_dialog(self):
-        apps = self.scan_portable_apps()
-        dlg = QDialog(self)
-        dlg.setWindowTitle("Protected Apps")
-        dlg.setModal(True)
-        layout = QVBoxLayout(dlg)
-        tree = QTreeWidget()
-        tree.setColumnCount(2)
-        tree.setHeaderHidden(True)
-        tree.setRootIsDecorated(False)
-        tree.setIndentation(14)
-        tree.setTextElideMode(Qt.ElideNone)
-        tree.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
-        tree.header().setSectionResizeMode(1, QHeaderView.Fixed)
-        tree.setColumnWidth(1, 18)
-
-        selected = set(self.protected_apps or [])
-        grouped = {}
-        for app in apps:
-            cat = app.get("category", "No Category") or "No Category"
-            grouped.setdefault(cat, []).append(app)
-
-        for cat in self.CATEGORIES:
-            if cat not in grouped:
-                continue
-            cat_item = QTreeWidgetItem([cat])
-            cat_item.setFlags(cat_item.flags() & ~Qt.ItemIsSelectable)
-            cat_icon = get_category_icon_path(cat)
-            if cat_icon and os.path.exists(cat_icon):
-                cat_item.setIcon(0, QIcon(cat_icon))
-            tree.addTopLevelItem(cat_item)
-            toggle_btn = QToolButton()
-            toggle_btn.setCheckable(True)
-            toggle_btn.setChecked(True)
-            toggle_btn.setArrowType(Qt.DownArrow)
-            toggle_btn.setCursor(Qt.PointingHandCursor)
-            toggle_btn.setFixedSize(12, 12)
-            toggle_btn.setStyleSheet("QToolButton { border: none; background: transparent; }")
-            def _make_toggle(item, btn):
-                def _toggle():
-                    expanded = btn.isChecked()
-                    item.setExpanded(expanded)
-                    btn.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
-                return _toggle
-            toggle_btn.clicked.connect(_make_toggle(cat_item, toggle_btn))
-            tree.setItemWidget(cat_item, 1, toggle_btn)
-            for app in grouped[cat]:
-                key = self.get_app_key(app["exe"])
-                item = QTreeWidgetItem([app["name"]])
-                icon_path = app.get("icon", "")
-                if icon_path and os.path.exists(icon_path):
-                    item.setIcon(0, QIcon(icon_path))
-                item.setData(0, Qt.UserRole, key)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(0, Qt.Checked if key in selected else Qt.Unchecked)
-                cat_item.addChild(item)
-        tree.expandAll()
-        layout.addWidget(tree)
-
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        layout.addWidget(buttons)
-        buttons.accepted.connect(dlg.accept)
-        buttons.rejected.connect(dlg.reject)
-
-        if dlg.exec() == QDialog.Accepted:
-            selected_keys = []
-            for i in range(tree.topLevelItemCount()):
-                cat_item = tree.topLevelItem(i)
-                for j in range(cat_item.childCount()):
-                    item = cat_item.child(j)
-                    if item.checkState(0) == Qt.Checked:
-                        selected_keys.append(item.data(0, Qt.UserRole))
+        selected_keys = self._pick_app_keys("Protected Apps", self.protected_apps or [])
+        if selected_keys is not None:
             self.protected_apps = selected_keys
             self.update_setting("Security", "ProtectedApps", self._serialize_pinned_apps(selected_keys))
 
@@ -4173,59 +4195,32 @@ class LauncherWindow(QMainWindow):
         return msg.exec() == QMessageBox.Yes
 
     def set_theme_mode(self, mode):
-        if getattr(self, "view_mode", "list") == "grid":
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Warning)
-            msg.setWindowTitle("Restart Required")
-            msg.setText("Changing theme while Grid view is active requires a restart.")
-            msg.setInformativeText("Restart now?")
-            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-            msg.setDefaultButton(QMessageBox.Yes)
-            if msg.exec() != QMessageBox.Yes:
-                return
-            self.update_setting("Settings", "ThemeMode", mode)
-            self.restart_app()
-            return
-        self.update_setting("Settings", "ThemeMode", mode)
+        # Existing rows, grid tiles and chrome restyle in place; only the
+        # options page (built per visit) is recreated.
+        self._store_theme_setting("ThemeMode", mode)
         self.apply_theme_mode(mode)
-        if self.accent_color:
-            apply_accent_color(self.accent_color)
-        if self.text_color and self.text_color != "__rainbow__":
-            apply_text_color(self.text_color)
-        self.rebuild_main_view()
-        self.refresh_apps()
         self.show_options_menu()
 
+    def _store_theme_setting(self, key, value):
+        # Theme changes are applied in place, so skip update_setting's reload
+        # and app rescan.
+        settings_store.update_values({("Settings", key): value or None})
+        self.settings = self.load_settings_dict()
+
     def set_accent_color(self, value):
         self.accent_color = value or ""
-        if self.accent_color:
-            self.update_setting("Settings", "AccentColor", self.accent_color)
-        else:
-            self.update_setting("Settings", "AccentColor", None)
+        self._store_theme_setting("AccentColor", self.accent_color)
         self.apply_theme_mode(self.theme_mode)
-        if self.accent_color:
-            apply_accent_color(self.accent_color)
-        if self.text_color:
-            apply_text_color(self.text_color)
-        self.rebuild_main_view()
         self.show_options_menu()
 
     def set_text_color(self, value):
         self.text_color = value or ""
-        if self.text_color:
-            self.update_setting("Settings", "TextColor", self.text_color)
-        else:
-            self.update_setting("Settings", "TextColor", None)
+        self._store_theme_setting("TextColor", self.text_color)
+        if self.text_color != "__rainbow__":
+            self._stop_rainbow()
         self.apply_theme_mode(self.theme_mode)
-        if self.accent_color:
-            apply_accent_color(self.accent_color)
         if self.text_color == "__rainbow__":
             self._start_rainbow()
-        else:
-            self._stop_rainbow()
-            if self.text_color:
-                apply_text_color(self.text_color)
-        self.rebuild_main_view()
         self.show_options_menu()
 
     def set_view_mode(self, value):
@@ -4270,6 +4265,25 @@ class LauncherWindow(QMainWindow):
         self.update_setting("Settings", "BackgroundGradientEnd", self.background_gradient_end or None)
         self.update_setting("Settings", "BackgroundImage", stored_image or None)
 
+        if self.background_type == "image" and self.background_image:
+            self._import_background_image(self.background_image)
+        self.update()
+
+    def _import_background_image(self, path):
+        """Swap a large background image for a downsampled copy in the Data dir (off the GUI thread)."""
+        if self._background_import is not None:
+            return
+        job = job_pool.submit(ui_background.import_background_image, path, name="background_import")
+        job.finished.connect(lambda stored, path=path: self._on_background_imported(path, stored or path))
+        job.failed.connect(lambda _error, path=path: self._on_background_imported(path, path))
+        self._background_import = job
+
+    def _on_background_imported(self, path, stored_path):
+        self._background_import = None
+        if stored_path == path or path != self.background_image:
+            return
+        self.background_image = stored_path
+        self.update_setting("Settings", "BackgroundImage", self._normalize_setting_path(stored_path))
         self.update()
 
     def set_mini_menu_background(self, payload):
@@ -4278,7 +4292,7 @@ class LauncherWindow(QMainWindow):
         self.mini_menu_background_color = payload.get("color", "")
         self.mini_menu_background_gradient_start = payload.get("gradient_start", "")
         self.mini_menu_background_gradient_end = payload.get("gradient_end", "")
-        config, path = self.get_settings()
+        config, _ = self.get_settings()
         if not config.has_section("Settings"):
             config.add_section("Settings")
         config.set("Settings", "MiniMenuBackgroundType", self.mini_menu_background_type)
@@ -4294,8 +4308,7 @@ class LauncherWindow(QMainWindow):
             config.set("Settings", "MiniMenuBackgroundGradientEnd", self.mini_menu_background_gradient_end)
         else:
             config.remove_option("Settings", "MiniMenuBackgroundGradientEnd")
-        with open(path, 'w') as f:
-            config.write(f)
+        self.save_settings(config)
         # Refresh local state and menus
         self.settings = self.load_settings_dict()
         self.mini_menu_background_type = self.settings.get("mini_menu_background_type", "default")
@@ -4453,6 +4466,7 @@ class LauncherWindow(QMainWindow):
                 self.update_setting("GlobalCategories", cat, "true")
 
     def open_settings_file(self):
+        self.flush_settings()
         target_path = get_settings_path()
         if not os.path.exists(target_path):
             with open(target_path, 'w') as f:
@@ -4460,6 +4474,7 @@ class LauncherWindow(QMainWindow):
         os.startfile(target_path)
 
     def export_settings(self):
+        self.flush_settings()
         source_path = get_settings_path()
         if not os.path.exists(source_path):
             try:
@@ -4476,7 +4491,9 @@ class LauncherWindow(QMainWindow):
         if not path:
             return
         try:
-            shutil.copy2(source_path, path)
+            # Merged text, so per-app state kept in settings.db is included.
+            with open(path, 'w') as f:
+                f.write(settings_store.export_text())
             msg = QMessageBox(self)
             msg.setIcon(QMessageBox.Information)
             msg.setWindowTitle("Export Settings")
@@ -4509,13 +4526,18 @@ class LauncherWindow(QMainWindow):
         if confirm.exec() != QMessageBox.Yes:
             return
 
+        self.flush_settings()
         dest_path = get_settings_path()
         try:
             if os.path.exists(dest_path):
                 timestamp = time.strftime("%Y%m%d-%H%M%S")
                 backup_path = f"{dest_path}.bak-{timestamp}"
-                shutil.copy2(dest_path, backup_path)
-            shutil.copy2(path, dest_path)
+                with open(backup_path, 'w') as f:
+                    f.write(settings_store.export_text())
+            with open(path, 'r') as f:
+                text = f.read()
+            if not settings_store.import_text(text):
+                raise OSError(settings_store.get_settings_writer().last_error or "Settings write timed out.")
         except Exception as e:
             msg = QMessageBox(self)
             msg.setIcon(QMessageBox.Warning)
@@ -4540,14 +4562,16 @@ class LauncherWindow(QMainWindow):
     # Settings & Context Menu Logic
     # -------------------------------------------------------------------------
     def get_settings(self):
-        config = configparser.ConfigParser()
-        config.optionxform = str # Preserve case
         path = get_settings_path()
-        config.read(path)
+        config = settings_store.load_settings(path)
         return config, path
 
+    def save_settings(self, config):
+        # Coalesced and written off the GUI thread; see settings_store.
+        settings_store.save_settings(config)
+
     def update_setting(self, section, key, value):
-        config, path = self.get_settings()
+        config, _ = self.get_settings()
         if not config.has_section(section):
             config.add_section(section)
         
@@ -4556,8 +4580,7 @@ class LauncherWindow(QMainWindow):
         else:
             config.set(section, key, str(value))
             
-        with open(path, 'w') as f:
-            config.write(f)
+        self.save_settings(config)
             
         # Update local state
         self.settings = self.load_settings_dict()
@@ -4658,7 +4681,7 @@ class LauncherWindow(QMainWindow):
             "home_custom_label": "HomeCustomLabel",
             "home_custom_folders": "HomeCustomFolders",
         }
-        config, path = self.get_settings()
+        config, _ = self.get_settings()
         if not config.has_section("Settings"):
             config.add_section("Settings")
         for key, value in updates.items():
@@ -4671,8 +4694,7 @@ class LauncherWindow(QMainWindow):
                 config.set("Settings", setting_key, json.dumps(value, ensure_ascii=True))
             else:
                 config.set("Settings", setting_key, str(value))
-        with open(path, 'w') as f:
-            config.write(f)
+        self.save_settings(config)
 
         self.settings = self.load_settings_dict()
         self.home_show_documents = self.settings.get("home_show_documents", True)
@@ -4734,39 +4756,17 @@ class LauncherWindow(QMainWindow):
         return pinned_apps
 
     def launch_startup_apps(self):
+        # Ordering, gaps and concurrency come from [Startup]; see startup_orchestrator.
         if not self.startup_apps:
             return
-        base_dir = get_base_dir()
-        hidden_map = {}
-        if not self.show_hidden:
-            try:
-                config, _ = self.get_settings()
-                if config.has_section("Hidden"):
-                    for key in self.startup_apps:
-                        if not key:
-                            continue
-                        hidden_map[key] = config.getboolean("Hidden", key, fallback=False)
-            except Exception:
-                hidden_map = {}
-        for key in self.startup_apps:
-            if not key:
-                continue
-            if not self.show_hidden and hidden_map.get(key, False):
-                continue
-            exe_path = key
-            if not os.path.isabs(exe_path):
-                exe_path = os.path.normpath(os.path.join(base_dir, exe_path))
-            if not exe_path or not os.path.exists(exe_path):
-                continue
-            try:
-                subprocess.Popen(exe_path, cwd=os.path.dirname(exe_path))
-            except Exception as e:
-                print(f"Error launching startup app {exe_path}: {e}")
+        self.startup.start(self.startup_apps, get_base_dir(), self.show_hidden)
 
-    def run_fix_settings(self):
+    def run_fix_settings(self, dry_run=True):
+        # The first pass only reports; the user applies it from the preview.
         if getattr(self, "_fix_settings_running", False):
             return
         self._fix_settings_running = True
+        self.flush_settings()
         if hasattr(self, "options_panel") and self.options_panel:
             try:
                 self.options_panel.set_fix_settings_busy(True)
@@ -4774,18 +4774,9 @@ class LauncherWindow(QMainWindow):
                 pass
 
         try:
-            self._fix_thread = QThread(self)
-            self._fix_worker = FixSettingsWorker()
-            self._fix_worker.moveToThread(self._fix_thread)
-            self._fix_thread.started.connect(self._fix_worker.run)
-            self._fix_worker.finished.connect(self._fix_thread.quit)
-            self._fix_worker.error.connect(self._fix_thread.quit)
-            self._fix_worker.finished.connect(self._fix_worker.deleteLater)
-            self._fix_worker.error.connect(self._fix_worker.deleteLater)
-            self._fix_thread.finished.connect(self._fix_thread.deleteLater)
-            self._fix_worker.finished.connect(self._on_fix_settings_done)
-            self._fix_worker.error.connect(self._on_fix_settings_error)
-            self._fix_thread.start()
+            job = job_pool.submit(_run_fix_settings, dry_run, priority=job_pool.PRIORITY_UI, name="fix_settings")
+            job.finished.connect(self._on_fix_settings_done)
+            job.failed.connect(self._on_fix_settings_error)
         except Exception as e:
             self._fix_settings_running = False
             if hasattr(self, "options_panel") and self.options_panel:
@@ -4797,6 +4788,7 @@ class LauncherWindow(QMainWindow):
 
     def _on_fix_settings_done(self, result):
         self._fix_settings_running = False
+        settings_store.get_settings_writer().invalidate()
         if hasattr(self, "options_panel") and self.options_panel:
             try:
                 self.options_panel.set_fix_settings_busy(False)
@@ -4807,8 +4799,24 @@ class LauncherWindow(QMainWindow):
             message = result.get("message") or ""
         if not message:
             message = "Fix settings completed."
+        if isinstance(result, dict) and result.get("dry_run"):
+            if not result.get("changes"):
+                QMessageBox.information(self, "Fix Settings", message)
+                return
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Question)
+            msg.setWindowTitle("Fix Settings")
+            msg.setText(message)
+            msg.setInformativeText("Apply these fixes? A backup will be created.")
+            msg.setDetailedText(result.get("diff") or "")
+            msg.setStandardButtons(QMessageBox.Apply | QMessageBox.Cancel)
+            msg.setDefaultButton(QMessageBox.Apply)
+            if msg.exec() == QMessageBox.Apply:
+                self.run_fix_settings(dry_run=False)
+            return
         QMessageBox.information(self, "Fix Settings", message)
-        self.refresh_apps()
+        if isinstance(result, dict) and result.get("changed"):
+            self.refresh_apps()
 
     def _on_fix_settings_error(self, error):
         self._fix_settings_running = False
@@ -4820,13 +4828,12 @@ class LauncherWindow(QMainWindow):
         QMessageBox.warning(self, "Fix Settings", f"Failed to run fix_settings.py: {error}")
 
     def save_window_position(self, pos):
-        config, path = self.get_settings()
+        config, _ = self.get_settings()
         if not config.has_section("Settings"):
             config.add_section("Settings")
         config.set("Settings", "WindowX", str(pos.x()))
         config.set("Settings", "WindowY", str(pos.y()))
-        with open(path, 'w') as f:
-            config.write(f)
+        self.save_settings(config)
 
     def flush_window_position(self):
         if self._pending_pos is None:
@@ -4842,23 +4849,164 @@ class LauncherWindow(QMainWindow):
             return exe_path.replace("\\", "/")
 
     def toggle_favorite(self, exe_path):
-        config, _ = self.get_settings()
-        key = self.get_app_key(exe_path)
-        is_fav = False
-        if config.has_section("Favorites"):
-            is_fav = config.getboolean("Favorites", key, fallback=False)
-        
-        # Toggle
-        self.update_setting("Favorites", key, "false" if is_fav else "true")
+        app = self._get_app_state(exe_path)
+        if app is not None:
+            is_fav = bool(app.get("is_favorite"))
+        else:
+            config, _ = self.get_settings()
+            is_fav = config.getboolean("Favorites", self.get_app_key(exe_path), fallback=False)
+        self.apply_app_changes({exe_path: {"is_favorite": not is_fav}})
 
     def toggle_hide(self, exe_path):
-        config, _ = self.get_settings()
-        key = self.get_app_key(exe_path)
-        is_hidden = False
-        if config.has_section("Hidden"):
-            is_hidden = config.getboolean("Hidden", key, fallback=False)
-            
-        self.update_setting("Hidden", key, "false" if is_hidden else "true")
+        app = self._get_app_state(exe_path)
+        if app is not None:
+            is_hidden = bool(app.get("is_hidden"))
+        else:
+            config, _ = self.get_settings()
+            is_hidden = config.getboolean("Hidden", self.get_app_key(exe_path), fallback=False)
+        self.apply_app_changes({exe_path: {"is_hidden": not is_hidden}})
+
+    def apply_app_changes(self, changes):
+        """
+        Apply per-app edits as one batch: one settings write and one in-place
+        catalog update, however many apps are involved. `changes` maps exe
+        paths to dicts of catalog fields (see APP_STATE_SECTIONS).
+        """
+        if not changes:
+            return
+        values = {}
+        for exe_path, fields in changes.items():
+            key = self.get_app_key(exe_path)
+            for field, value in fields.items():
+                section = APP_STATE_SECTIONS.get(field)
+                if not section:
+                    continue
+                if isinstance(value, bool):
+                    value = "true" if value else "false"
+                values[(section, key)] = str(value)
+        settings_store.update_values(values)
+        self._apply_catalog_changes(changes)
+
+    def _apply_catalog_changes(self, changes):
+        apps = getattr(self, "_last_scanned_apps", None)
+        if not apps:
+            self.refresh_apps()
+            return
+        by_path = {os.path.normcase(os.path.normpath(p)): fields for p, fields in changes.items()}
+        changed = []
+        for app in apps:
+            fields = by_path.get(os.path.normcase(os.path.normpath(app.get("exe", ""))))
+            if not fields:
+                continue
+            for field, value in fields.items():
+                if field not in APP_STATE_SECTIONS:
+                    continue
+                if field == "category":
+                    value = resolve_category_name(value, self.CATEGORIES)
+                app[field] = value
+            changed.append(app)
+        apps.sort(key=_app_sort_key)
+        self._schedule_apps_cache_write()
+        in_place = (
+            self.view_mode == "list"
+            and not self._refresh_pending
+            and len(changed) <= MAX_IN_PLACE_CHANGES
+        )
+        if in_place:
+            for app in changed:
+                self._move_app_row(app)
+            if hasattr(self, "search_bar") and self.search_bar:
+                self.filter_apps(self.search_bar.input.text())
+        else:
+            self._refresh_apps_from_scan(apps)
+        self._catalog_changed()
+
+    def _schedule_apps_cache_write(self):
+        # Several quick edits (favourite, then rename...) share one cache write.
+        timer = getattr(self, "_apps_cache_timer", None)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(500)
+            timer.timeout.connect(lambda: self._write_apps_cache(getattr(self, "_last_scanned_apps", None)))
+            self._apps_cache_timer = timer
+        timer.start()
+
+    def _get_app_state(self, exe_path):
+        target = os.path.normcase(os.path.normpath(exe_path))
+        for app in getattr(self, "_last_scanned_apps", None) or []:
+            if os.path.normcase(os.path.normpath(app.get("exe", ""))) == target:
+                return app
+        return None
+
+    def _on_app_item_clicked(self, exe_path):
+        if self._bulk_select_mode:
+            self.toggle_bulk_selection(exe_path)
+            return
+        self.launch_app(exe_path)
+
+    def _iter_app_items(self):
+        for widget in self.app_widgets:
+            if isinstance(widget, CategoryItem):
+                for child in widget.app_items:
+                    yield child
+            elif hasattr(widget, "exe_path"):
+                yield widget
+
+    def set_bulk_select_mode(self, enabled, exe_path=None):
+        self._bulk_select_mode = bool(enabled)
+        self._bulk_selected.clear()
+        if enabled and exe_path:
+            self._bulk_selected.add(exe_path)
+        if hasattr(self, "bulk_bar") and self.bulk_bar:
+            self.bulk_bar.setVisible(self._bulk_select_mode)
+        self._sync_bulk_selection()
+
+    def toggle_bulk_selection(self, exe_path):
+        if exe_path in self._bulk_selected:
+            self._bulk_selected.discard(exe_path)
+        else:
+            self._bulk_selected.add(exe_path)
+        self._sync_bulk_selection()
+
+    def bulk_select_all(self):
+        # Only apps the view shows: rows a search or favorites-only hides
+        # stay out of bulk edits. Rows of a collapsed category still count,
+        # including ones not built yet (a search builds them all first).
+        for widget in self.app_widgets:
+            if widget.isHidden():
+                continue
+            if isinstance(widget, CategoryItem):
+                for child in widget.app_items:
+                    if not child.isHidden():
+                        self._bulk_selected.add(child.exe_path)
+                for app in widget.apps_data[len(widget.app_items):]:
+                    self._bulk_selected.add(app["exe"])
+            elif hasattr(widget, "exe_path"):
+                self._bulk_selected.add(widget.exe_path)
+        self._sync_bulk_selection()
+
+    def bulk_clear_selection(self):
+        self._bulk_selected.clear()
+        self._sync_bulk_selection()
+
+    def _sync_bulk_selection(self):
+        for item in self._iter_app_items():
+            item.set_selected(item.exe_path in self._bulk_selected)
+        if hasattr(self, "bulk_count_label") and self.bulk_count_label:
+            self.bulk_count_label.setText(f"{len(self._bulk_selected)} selected")
+
+    def bulk_set_field(self, field, value):
+        if not self._bulk_selected:
+            return
+        self.apply_app_changes({exe: {field: value} for exe in self._bulk_selected})
+
+    def bulk_request_category(self):
+        if not self._bulk_selected:
+            return
+        dialog = CategorySelectionDialog(self.CATEGORIES, "No Category", self)
+        if dialog.exec() == QDialog.Accepted:
+            self.bulk_set_field("category", dialog.get_selected_category())
 
     def toggle_show_hidden(self):
         self.show_hidden = not self.show_hidden
@@ -4867,28 +5015,18 @@ class LauncherWindow(QMainWindow):
     def request_rename(self, exe_path, current_name):
         new_name, ok = QInputDialog.getText(self, "Rename App", "New Name:", text=current_name)
         if ok and new_name:
-            key = self.get_app_key(exe_path)
-            self.update_setting("Renames", key, new_name)
+            self.apply_app_changes({exe_path: {"name": new_name}})
 
     def request_category(self, exe_path):
-        # Just storing it for now as requested
-        config, _ = self.get_settings()
-        key = self.get_app_key(exe_path)
-        current_cat = "No Category"
-        if config.has_section("Categories"):
-            current_cat = config.get("Categories", key, fallback="No Category")
+        app = self._get_app_state(exe_path)
+        if app is not None:
+            current_cat = app.get("category") or "No Category"
         else:
-            # Try to find in current widgets
-            for item in self.app_widgets:
-                if item.exe_path == exe_path:
-                    current_cat = item.category
-                    break
-            
-        index = self.CATEGORIES.index(current_cat) if current_cat in self.CATEGORIES else 0
+            config, _ = self.get_settings()
+            current_cat = config.get("Categories", self.get_app_key(exe_path), fallback="No Category")
         dialog = CategorySelectionDialog(self.CATEGORIES, current_cat, self)
         if dialog.exec() == QDialog.Accepted:
-            new_cat = dialog.get_selected_category()
-            self.update_setting("Categories", key, new_cat)
+            self.apply_app_changes({exe_path: {"category": dialog.get_selected_category()}})
 
     def explore_app_dir(self, exe_path):
         if exe_path and os.path.exists(exe_path):
@@ -4915,30 +5053,27 @@ class LauncherWindow(QMainWindow):
     def _remove_app_keys_from_settings(self, keys):
         if not keys:
             return
-        config, path = self.get_settings()
-        for section in ("Renames", "Categories", "Favorites", "Hidden"):
-            if not config.has_section(section):
-                continue
+        # Per-app rows are dropped key by key (row deletes when settings.db
+        # is in use); the ;-joined lists need the current values.
+        changes = {}
+        for section in settings_store.INDEXED_SECTIONS + (turbo.TURBO_SECTION,):
             for key in keys:
-                if config.has_option(section, key):
-                    config.remove_option(section, key)
+                changes[(section, key)] = None
+        config, _ = self.get_settings()
 
         def _filter_list(section, option):
             if not config.has_option(section, option):
                 return
             raw = config.get(section, option, fallback="")
             items = [p for p in raw.split(";") if p and p not in keys]
-            if items:
-                config.set(section, option, ";".join(items))
-            else:
-                config.remove_option(section, option)
+            changes[(section, option)] = ";".join(items) if items else None
 
         _filter_list("Security", "ProtectedApps")
         _filter_list("Settings", "StartupApps")
         _filter_list("Settings", "MiniPinnedApps")
 
-        with open(path, 'w') as f:
-            config.write(f)
+        settings_store.update_values(changes)
+        self.turbo.reload()
 
         self.settings = self.load_settings_dict()
         self.protected_apps = self.settings.get("protected_apps", [])
@@ -4947,86 +5082,61 @@ class LauncherWindow(QMainWindow):
         self.rebuild_tray_menu()
 
     def open_manage_apps_dialog(self):
-        apps = self.scan_portable_apps()
-        dlg = QDialog(self)
-        dlg.setWindowTitle("Manage Apps")
-        dlg.resize(620, 520)
-        dlg.setModal(True)
-        layout = QVBoxLayout(dlg)
-        tree = QTreeWidget()
-        tree.setColumnCount(2)
-        tree.setHeaderHidden(False)
-        tree.setHeaderLabels(["App", "Folder"])
-        tree.setRootIsDecorated(False)
-        tree.setIndentation(14)
-        tree.setTextElideMode(Qt.ElideRight)
-        tree.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
-        tree.header().setSectionResizeMode(1, QHeaderView.Fixed)
-        tree.setColumnWidth(1, 160)
+        def _manageable(apps):
+            result = []
+            for app in apps:
+                root = self._get_portable_app_root(app.get("exe", ""))
+                if not root or os.path.basename(root).lower() in {"portablex", "portableapps.com"}:
+                    continue
+                result.append(app)
+            return result
 
-        grouped = {}
-        for app in apps:
-            root = self._get_portable_app_root(app.get("exe", ""))
-            if not root or not os.path.isdir(root):
-                continue
-            root_name = os.path.basename(root)
-            if root_name.lower() in {"portablex", "portableapps.com"}:
-                continue
-            cat = app.get("category", "No Category") or "No Category"
-            grouped.setdefault(cat, []).append((app, root))
-
-        for cat in sorted(grouped.keys()):
-            cat_item = QTreeWidgetItem([cat, ""])
-            cat_item.setFlags(cat_item.flags() & ~Qt.ItemIsSelectable)
-            cat_icon = get_category_icon_path(cat)
-            if cat_icon and os.path.exists(cat_icon):
-                cat_item.setIcon(0, QIcon(cat_icon))
-            tree.addTopLevelItem(cat_item)
-            toggle_btn = QToolButton()
-            toggle_btn.setCheckable(True)
-            toggle_btn.setChecked(True)
-            toggle_btn.setArrowType(Qt.DownArrow)
-            toggle_btn.setCursor(Qt.PointingHandCursor)
-            toggle_btn.setFixedSize(12, 12)
-            toggle_btn.setStyleSheet("QToolButton { border: none; background: transparent; }")
-            def _make_toggle(item, btn):
-                def _toggle():
-                    expanded = btn.isChecked()
-                    item.setExpanded(expanded)
-                    btn.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
-                return _toggle
-            toggle_btn.clicked.connect(_make_toggle(cat_item, toggle_btn))
-            tree.setItemWidget(cat_item, 1, toggle_btn)
-            for app, root in grouped[cat]:
-                key = self.get_app_key(app["exe"])
-                item = QTreeWidgetItem([app["name"], os.path.basename(root)])
-                icon_path = app.get("icon", "")
-                if icon_path and os.path.exists(icon_path):
-                    item.setIcon(0, QIcon(icon_path))
-                item.setData(0, Qt.UserRole, {"root": root, "key": key, "name": app["name"]})
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(0, Qt.Unchecked)
-                cat_item.addChild(item)
-        tree.expandAll()
-        layout.addWidget(tree)
+        def _folder(app):
+            return os.path.basename(self._get_portable_app_root(app.get("exe", "")))
+
+        dlg, picker = self._build_app_picker_dialog("Manage Apps", columns=[("Folder", _folder)], apps_filter=_manageable)
+        dlg.resize(620, 520)
+        layout = dlg.layout()
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         ok_button = buttons.button(QDialogButtonBox.Ok)
         if ok_button:
             ok_button.setText("Delete")
+        edit_button = buttons.addButton("Edit Checked", QDialogButtonBox.ActionRole)
         layout.addWidget(buttons)
 
+        def _checked_payloads():
+            checked = []
+            for app, key in picker.checked_apps():
+                root = self._get_portable_app_root(app.get("exe", ""))
+                checked.append({"root": root, "key": key, "name": app.get("name", ""), "exe": app.get("exe", "")})
+            return checked
+
+        def _edit_checked(field, value=None):
+            checked = _checked_payloads()
+            if not checked:
+                QMessageBox.information(dlg, "Manage Apps", "No apps selected.")
+                return
+            if field == "category":
+                cat_dialog = CategorySelectionDialog(self.CATEGORIES, "No Category", dlg)
+                if cat_dialog.exec() != QDialog.Accepted:
+                    return
+                value = cat_dialog.get_selected_category()
+            self.apply_app_changes({p["exe"]: {field: value} for p in checked if p.get("exe")})
+            QMessageBox.information(dlg, "Manage Apps", f"Updated {len(checked)} app(s).")
+
+        edit_menu = QMenu(edit_button)
+        edit_menu.addAction("Favourite").triggered.connect(lambda: _edit_checked("is_favorite", True))
+        edit_menu.addAction("Unfavourite").triggered.connect(lambda: _edit_checked("is_favorite", False))
+        edit_menu.addSeparator()
+        edit_menu.addAction("Hide").triggered.connect(lambda: _edit_checked("is_hidden", True))
+        edit_menu.addAction("Unhide").triggered.connect(lambda: _edit_checked("is_hidden", False))
+        edit_menu.addSeparator()
+        edit_menu.addAction("Change Category").triggered.connect(lambda: _edit_checked("category"))
+        edit_button.setMenu(edit_menu)
+
         def _delete_selected():
-            to_delete = []
-            for i in range(tree.topLevelItemCount()):
-                cat_item = tree.topLevelItem(i)
-                for j in range(cat_item.childCount()):
-                    item = cat_item.child(j)
-                    if item.checkState(0) == Qt.Checked:
-                        payload = item.data(0, Qt.UserRole) or {}
-                        if payload:
-                            to_delete.append(payload)
+            to_delete = _checked_payloads()
 
             if not to_delete:
                 QMessageBox.information(dlg, "Manage Apps", "No apps selected.")
@@ -5212,27 +5322,47 @@ class LauncherWindow(QMainWindow):
     # Actually, simpler to subclass container. But for single file, let's do this:
     
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
         # Define the main shape
         rect = self.container.geometry()
-        
+
+        background = None
+        if self.background_type == "image" and self.background_image:
+            background = self._background_cache.pixmap(self.background_image, rect.size(), self.devicePixelRatioF())
+        if background is not None and background.deviceIndependentSize().toSize() != rect.size():
+            # Stretched only while a resize re-render is pending; not worth caching.
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._paint_window_body(painter, rect, background)
+            return
+
+        # Fill, clip and border only change with size/background/theme: blit the
+        # pre-rendered layer (1px larger on every side for the border stroke).
+        if background is not None:
+            key = ("image", background.cacheKey())
+        elif self.background_type == "solid" and self.background_color:
+            key = ("solid", self.background_color)
+        elif self.background_type == "gradient" and self.background_gradient_start and self.background_gradient_end:
+            key = ("gradient", self.background_gradient_start, self.background_gradient_end)
+        else:
+            key = ("theme", COLOR_BG_START.rgba(), COLOR_BG_END.rgba())
+
+        def _draw(layer_painter, layer_rect):
+            self._paint_window_body(layer_painter, layer_rect.adjusted(1, 1, -1, -1), background)
+
+        layer = self._window_chrome.pixmap(key, rect.size() + QSize(2, 2), self.devicePixelRatioF(), _draw)
+        painter = QPainter(self)
+        painter.drawPixmap(rect.topLeft() - QPoint(1, 1), layer)
+
+    def _paint_window_body(self, painter, rect, background):
         # Clip to rounded rect for background fill
         clip_path = QPainterPath()
         clip_path.addRoundedRect(rect, BORDER_RADIUS, BORDER_RADIUS)
         painter.setClipPath(clip_path)
 
         # Background fill
-        if self.background_type == "image" and self.background_image and os.path.exists(self.background_image):
-            pixmap = QPixmap(self.background_image)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(rect.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                x = rect.x() + (rect.width() - scaled.width()) // 2
-                y = rect.y() + (rect.height() - scaled.height()) // 2
-                painter.drawPixmap(QRect(x, y, scaled.width(), scaled.height()), scaled)
-            else:
-                painter.fillPath(clip_path, QBrush(COLOR_BG_END))
+        if background is not None:
+            # Already cropped to the container; stretched only while a resize re-render is pending.
+            painter.drawPixmap(rect, background)
         elif self.background_type == "solid" and self.background_color:
             painter.fillPath(clip_path, QBrush(QColor(self.background_color)))
         elif self.background_type == "gradient" and self.background_gradient_start and self.background_gradient_end:
@@ -5317,7 +5447,9 @@ class LauncherWindow(QMainWindow):
             
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
-            if self.main_stack.currentIndex() == 1:
+            if self._bulk_select_mode:
+                self.set_bulk_select_mode(False)
+            elif self.main_stack.currentIndex() == 1:
                 self.show_apps_view()
             else:
                 pass
@@ -0,0 +1,628 @@
+import os
+import sys
+import json
+import time
+import ctypes
+import shutil
+import threading
+import subprocess
+
+# Metrics a backend can provide. Rates are per second; "disk" is a dict of
+# read_bps/write_bps/percent for one drive.
+METRICS = ("cpu", "ram", "gpu", "net", "disk")
+
+# A streamed reading older than this is treated as missing.
+STALE_AFTER_S = 5.0
+HELPER_INTERVAL_S = 1
+
+
+def _no_window_kwargs():
+    if os.name != "nt":
+        return {}
+    kwargs = {}
+    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    if creationflags:
+        kwargs["creationflags"] = creationflags
+    try:
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        kwargs["startupinfo"] = startupinfo
+    except Exception:
+        pass
+    return kwargs
+
+
+class _Delta:
+    """Per-second rates from cumulative counters; the first reading only sets the baseline."""
+
+    def __init__(self):
+        self._last = {}
+
+    def rate(self, key, values, now, wrap=None):
+        last = self._last.get(key)
+        self._last[key] = (now, values)
+        if last is None:
+            return None
+        elapsed = now - last[0]
+        if elapsed <= 0:
+            return None
+        rates = []
+        for value, previous in zip(values, last[1]):
+            delta = value - previous
+            if delta < 0:
+                if not wrap:
+                    return None
+                delta += wrap
+            rates.append(delta / elapsed)
+        return rates
+
+
+class MetricsBackend:
+    """
+    Where UsageSampler gets its readings. Every reader returns None when it
+    has nothing (yet); supports() says whether asking is worth it at all,
+    so a ChainBackend can fall through to the next backend. Readers run on
+    a job-pool thread, one sample at a time.
+    """
+
+    name = "base"
+
+    def supports(self, metric):
+        return False
+
+    def cpu_percent(self):
+        return None
+
+    def ram_percent(self):
+        return None
+
+    def gpu_percent(self):
+        return None
+
+    def net_rates(self):
+        """(sent, received) bytes per second."""
+        return None
+
+    def disk(self, drive):
+        """{"read_bps", "write_bps", "percent"} for drive ("C:", or "" for all)."""
+        return None
+
+    def helper_cpu_seconds(self):
+        """CPU time used so far by helper processes this backend started."""
+        return 0.0
+
+    def close(self):
+        pass
+
+
+class Win32Backend(MetricsBackend):
+    """Direct Win32 calls: GetSystemTimes, GlobalMemoryStatusEx, GetIfTable and IOCTL_DISK_PERFORMANCE."""
+
+    name = "win32"
+    IOCTL_DISK_PERFORMANCE = 0x70020
+
+    class _FILETIME(ctypes.Structure):
+        _fields_ = [("dwLowDateTime", ctypes.c_uint32), ("dwHighDateTime", ctypes.c_uint32)]
+
+    class _MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [
+            ("dwLength", ctypes.c_ulong),
+            ("dwMemoryLoad", ctypes.c_ulong),
+            ("ullTotalPhys", ctypes.c_ulonglong),
+            ("ullAvailPhys", ctypes.c_ulonglong),
+            ("ullTotalPageFile", ctypes.c_ulonglong),
+            ("ullAvailPageFile", ctypes.c_ulonglong),
+            ("ullTotalVirtual", ctypes.c_ulonglong),
+            ("ullAvailVirtual", ctypes.c_ulonglong),
+            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+        ]
+
+    class _MIB_IFROW(ctypes.Structure):
+        _fields_ = [
+            ("wszName", ctypes.c_wchar * 256),
+            ("dwIndex", ctypes.c_uint32),
+            ("dwType", ctypes.c_uint32),
+            ("dwMtu", ctypes.c_uint32),
+            ("dwSpeed", ctypes.c_uint32),
+            ("dwPhysAddrLen", ctypes.c_uint32),
+            ("bPhysAddr", ctypes.c_ubyte * 8),
+            ("dwAdminStatus", ctypes.c_uint32),
+            ("dwOperStatus", ctypes.c_uint32),
+            ("dwLastChange", ctypes.c_uint32),
+            ("dwInOctets", ctypes.c_uint32),
+            ("dwInUcastPkts", ctypes.c_uint32),
+            ("dwInNUcastPkts", ctypes.c_uint32),
+            ("dwInDiscards", ctypes.c_uint32),
+            ("dwInErrors", ctypes.c_uint32),
+            ("dwInUnknownProtos", ctypes.c_uint32),
+            ("dwOutOctets", ctypes.c_uint32),
+            ("dwOutUcastPkts", ctypes.c_uint32),
+            ("dwOutNUcastPkts", ctypes.c_uint32),
+            ("dwOutDiscards", ctypes.c_uint32),
+            ("dwOutErrors", ctypes.c_uint32),
+            ("dwOutQLen", ctypes.c_uint32),
+            ("dwDescrLen", ctypes.c_uint32),
+            ("bDescr", ctypes.c_ubyte * 256),
+        ]
+
+    class _DISK_PERFORMANCE(ctypes.Structure):
+        _fields_ = [
+            ("BytesRead", ctypes.c_longlong),
+            ("BytesWritten", ctypes.c_longlong),
+            ("ReadTime", ctypes.c_longlong),
+            ("WriteTime", ctypes.c_longlong),
+            ("IdleTime", ctypes.c_longlong),
+            ("ReadCount", ctypes.c_ulong),
+            ("WriteCount", ctypes.c_ulong),
+            ("QueueDepth", ctypes.c_ulong),
+            ("SplitCount", ctypes.c_ulong),
+            ("QueryTime", ctypes.c_longlong),
+            ("StorageDeviceNumber", ctypes.c_ulong),
+            ("StorageManagerName", ctypes.c_wchar * 8),
+        ]
+
+    IF_TYPE_SOFTWARE_LOOPBACK = 24
+
+    def __init__(self):
+        self._delta = _Delta()
+        self._failed = set()
+        self._volumes = {}
+
+    def supports(self, metric):
+        return sys.platform == "win32" and metric != "gpu" and metric not in self._failed
+
+    def cpu_percent(self):
+        try:
+            idle, kernel, user = self._FILETIME(), self._FILETIME(), self._FILETIME()
+            if not ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+                return None
+        except Exception:
+            self._failed.add("cpu")
+            return None
+
+        def _ft(ft):
+            return (ft.dwHighDateTime << 32) + ft.dwLowDateTime
+
+        # Kernel time includes idle time.
+        rates = self._delta.rate("cpu", (_ft(idle), _ft(kernel) + _ft(user)), time.monotonic())
+        if not rates or rates[1] <= 0:
+            return None
+        return max(0.0, min(100.0, (rates[1] - rates[0]) / rates[1] * 100.0))
+
+    def ram_percent(self):
+        try:
+            status = self._MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(self._MEMORYSTATUSEX)
+            if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)) or not status.ullTotalPhys:
+                return None
+        except Exception:
+            self._failed.add("ram")
+            return None
+        return max(0.0, min(100.0, (1.0 - status.ullAvailPhys / float(status.ullTotalPhys)) * 100.0))
+
+    def net_rates(self):
+        try:
+            iphlpapi = ctypes.windll.iphlpapi
+            size = ctypes.c_ulong(0)
+            iphlpapi.GetIfTable(None, ctypes.byref(size), False)
+            buffer = ctypes.create_string_buffer(size.value)
+            if iphlpapi.GetIfTable(buffer, ctypes.byref(size), False) != 0:
+                return None
+        except Exception:
+            self._failed.add("net")
+            return None
+        count = ctypes.c_uint32.from_buffer(buffer).value
+        rows = ctypes.cast(ctypes.addressof(buffer) + 4, ctypes.POINTER(self._MIB_IFROW))
+        sent = recv = 0
+        for index in range(count):
+            row = rows[index]
+            if row.dwType == self.IF_TYPE_SOFTWARE_LOOPBACK:
+                continue
+            sent += row.dwOutOctets
+            recv += row.dwInOctets
+        # The 32-bit counters wrap every 4 GB.
+        return self._delta.rate("net", (sent, recv), time.monotonic(), wrap=2 ** 32)
+
+    def _open_volume(self, drive):
+        handle = self._volumes.get(drive)
+        if handle is None:
+            kernel32 = ctypes.windll.kernel32
+            kernel32.CreateFileW.restype = ctypes.c_void_p
+            # No access rights needed for the performance query.
+            handle = kernel32.CreateFileW(f"\\\\.\\{drive}", 0, 3, None, 3, 0, None)
+            if handle in (None, ctypes.c_void_p(-1).value):
+                return None
+            self._volumes[drive] = handle
+        return handle
+
+    def disk(self, drive):
+        drive = (drive or os.environ.get("SystemDrive", "C:")).rstrip("\\")
+        try:
+            handle = self._open_volume(drive)
+            if handle is None:
+                raise OSError(f"cannot open {drive}")
+            perf = self._DISK_PERFORMANCE()
+            returned = ctypes.c_ulong()
+            if not ctypes.windll.kernel32.DeviceIoControl(
+                ctypes.c_void_p(handle), self.IOCTL_DISK_PERFORMANCE, None, 0,
+                ctypes.byref(perf), ctypes.sizeof(perf), ctypes.byref(returned), None,
+            ):
+                raise OSError("IOCTL_DISK_PERFORMANCE failed")
+        except Exception:
+            self._failed.add("disk")
+            return None
+        rates = self._delta.rate(
+            "disk:" + drive, (perf.BytesRead, perf.BytesWritten, perf.IdleTime, perf.QueryTime), time.monotonic()
+        )
+        if not rates:
+            return None
+        percent = None
+        if rates[3] > 0:
+            percent = max(0.0, min(100.0, (1.0 - rates[2] / rates[3]) * 100.0))
+        return {"read_bps": rates[0], "write_bps": rates[1], "percent": percent}
+
+    def close(self):
+        for handle in self._volumes.values():
+            try:
+                ctypes.windll.kernel32.CloseHandle(ctypes.c_void_p(handle))
+            except Exception:
+                pass
+        self._volumes = {}
+
+
+class StreamingHelper(MetricsBackend):
+    """
+    One long-lived helper process printing a reading per line (e.g.
+    PowerShell's Get-Counter -Continuous), read on a daemon thread. Readers
+    return the latest parsed line. Started on first use; if it exits it is
+    not restarted, and supports() turns False so the chain falls through.
+    """
+
+    name = "helper"
+    provides = ()
+
+    def __init__(self):
+        self._process = None
+        self._thread = None
+        self._latest = {}
+        self._latest_at = 0.0
+        self._dead = False
+        self._lock = threading.Lock()
+
+    def command(self):
+        """argv of the helper to start, or None if there is none here."""
+        return None
+
+    def parse(self, line):
+        """{metric: value} from one output line, or None to skip it."""
+        return None
+
+    def supports(self, metric):
+        return metric in self.provides and not self._dead
+
+    def _ensure_started(self):
+        if self._process is not None or self._dead:
+            return
+        command = self.command()
+        if not command:
+            self._dead = True
+            return
+        try:
+            self._process = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL,
+                text=True, bufsize=1, **_no_window_kwargs(),
+            )
+        except Exception as e:
+            print(f"Metrics helper {self.name} unavailable: {e}")
+            self._dead = True
+            return
+        self._thread = threading.Thread(target=self._read_loop, name=f"metrics-{self.name}", daemon=True)
+        self._thread.start()
+
+    def _read_loop(self):
+        process = self._process
+        try:
+            for line in process.stdout:
+                try:
+                    values = self.parse(line.strip())
+                except Exception:
+                    values = None
+                if values:
+                    with self._lock:
+                        self._latest = values
+                        self._latest_at = time.monotonic()
+        except Exception:
+            pass
+        self._dead = True
+
+    def _value(self, metric):
+        self._ensure_started()
+        with self._lock:
+            if time.monotonic() - self._latest_at > STALE_AFTER_S:
+                return None
+            return self._latest.get(metric)
+
+    def cpu_percent(self):
+        return self._value("cpu")
+
+    def gpu_percent(self):
+        return self._value("gpu")
+
+    def net_rates(self):
+        return self._value("net")
+
+    def disk(self, drive):
+        return self._value("disk")
+
+    def helper_cpu_seconds(self):
+        process = self._process
+        if process is None:
+            return 0.0
+        if sys.platform == "win32":
+            try:
+                created, exited, kernel, user = (Win32Backend._FILETIME() for _ in range(4))
+                if ctypes.windll.kernel32.GetProcessTimes(
+                    ctypes.c_void_p(int(process._handle)), ctypes.byref(created), ctypes.byref(exited),
+                    ctypes.byref(kernel), ctypes.byref(user),
+                ):
+                    ticks = sum((ft.dwHighDateTime << 32) + ft.dwLowDateTime for ft in (kernel, user))
+                    return ticks / 1e7
+            except Exception:
+                pass
+        try:
+            with open(f"/proc/{process.pid}/stat", "r") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / float(os.sysconf("SC_CLK_TCK"))
+        except Exception:
+            return 0.0
+
+    def close(self):
+        process, self._process = self._process, None
+        if process is not None:
+            try:
+                process.kill()
+                process.wait(timeout=2)
+            except Exception:
+                pass
+        self._dead = True
+
+
+class PowerShellCounters(StreamingHelper):
+    """GPU engine, disk and network counters from a single Get-Counter -Continuous process."""
+
+    name = "powershell"
+    provides = ("gpu", "net", "disk")
+
+    def __init__(self, drive=""):
+        super().__init__()
+        self.drive = drive
+
+    def command(self):
+        if sys.platform != "win32":
+            return None
+        drive = (self.drive or "_Total").rstrip("\\")
+        counters = ",".join(f"'{c}'" for c in (
+            "\\GPU Engine(*)\\Utilization Percentage",
+            f"\\LogicalDisk({drive})\\Disk Read Bytes/sec",
+            f"\\LogicalDisk({drive})\\Disk Write Bytes/sec",
+            f"\\LogicalDisk({drive})\\% Disk Time",
+            "\\Network Interface(*)\\Bytes Sent/sec",
+            "\\Network Interface(*)\\Bytes Received/sec",
+        ))
+        script = (
+            f"Get-Counter -Counter @({counters}) -SampleInterval {HELPER_INTERVAL_S} -Continuous -ErrorAction SilentlyContinue "
+            "| ForEach-Object { $_.CounterSamples | Select-Object Path,InstanceName,CookedValue | ConvertTo-Json -Compress }"
+        )
+        return ["powershell", "-NoProfile", "-NonInteractive", "-Command", script]
+
+    def parse(self, line):
+        if not line.startswith(("[", "{")):
+            return None
+        items = json.loads(line)
+        if isinstance(items, dict):
+            items = [items]
+        gpu_3d, gpu_other = [], []
+        sent = recv = 0.0
+        disk = {"read_bps": None, "write_bps": None, "percent": None}
+        for item in items:
+            path = str(item.get("Path", "")).lower()
+            value = float(item.get("CookedValue", 0.0))
+            name = str(item.get("InstanceName", "")).lower()
+            if "\\gpu engine(" in path:
+                if "engtype_3d" in name or "engtype_graphics" in name:
+                    gpu_3d.append(value)
+                elif "engtype_copy" not in name:
+                    gpu_other.append(value)
+            elif "disk read bytes/sec" in path:
+                disk["read_bps"] = value
+            elif "disk write bytes/sec" in path:
+                disk["write_bps"] = value
+            elif "% disk time" in path:
+                disk["percent"] = max(0.0, min(100.0, value))
+            elif "bytes sent/sec" in path:
+                sent += value
+            elif "bytes received/sec" in path:
+                recv += value
+        engines = gpu_3d or gpu_other
+        gpu = max(0.0, min(100.0, max(engines))) if engines else None
+        return {"gpu": gpu, "net": (sent, recv), "disk": disk}
+
+
+class NvidiaSmiStream(StreamingHelper):
+    """GPU utilization from nvidia-smi's own loop mode (-l), one process for the session."""
+
+    name = "nvidia-smi"
+    provides = ("gpu",)
+
+    def command(self):
+        exe = shutil.which("nvidia-smi")
+        if not exe and sys.platform == "win32":
+            candidate = os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "NVIDIA Corporation", "NVSMI", "nvidia-smi.exe")
+            if os.path.exists(candidate):
+                exe = candidate
+        if not exe:
+            return None
+        return [exe, "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits", "-l", str(HELPER_INTERVAL_S)]
+
+    def parse(self, line):
+        return {"gpu": max(0.0, min(100.0, float(line.split(",")[0])))} if line else None
+
+
+class ProcBackend(MetricsBackend):
+    """Linux /proc counters (for running and testing the sampler off Windows)."""
+
+    name = "proc"
+
+    def __init__(self):
+        self._delta = _Delta()
+
+    def supports(self, metric):
+        return metric != "gpu" and os.path.exists("/proc/stat")
+
+    def cpu_percent(self):
+        try:
+            with open("/proc/stat", "r") as f:
+                fields = [int(v) for v in f.readline().split()[1:]]
+        except (OSError, ValueError):
+            return None
+        idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+        rates = self._delta.rate("cpu", (idle, sum(fields[:8])), time.monotonic())
+        if not rates or rates[1] <= 0:
+            return None
+        return max(0.0, min(100.0, (rates[1] - rates[0]) / rates[1] * 100.0))
+
+    def ram_percent(self):
+        info = {}
+        try:
+            with open("/proc/meminfo", "r") as f:
+                for line in f:
+                    key, _, rest = line.partition(":")
+                    info[key] = int(rest.split()[0])
+        except (OSError, ValueError, IndexError):
+            return None
+        total = info.get("MemTotal")
+        available = info.get("MemAvailable", info.get("MemFree"))
+        if not total or available is None:
+            return None
+        return max(0.0, min(100.0, (1.0 - available / float(total)) * 100.0))
+
+    def net_rates(self):
+        sent = recv = 0
+        try:
+            with open("/proc/net/dev", "r") as f:
+                for line in f.readlines()[2:]:
+                    name, _, rest = line.partition(":")
+                    if name.strip() == "lo":
+                        continue
+                    fields = rest.split()
+                    recv += int(fields[0])
+                    sent += int(fields[8])
+        except (OSError, ValueError, IndexError):
+            return None
+        return self._delta.rate("net", (sent, recv), time.monotonic())
+
+    @staticmethod
+    def _device_for(path):
+        """Whole-disk name under /sys/block holding path, or None."""
+        try:
+            st = os.stat(path)
+            node = os.path.realpath(f"/sys/dev/block/{os.major(st.st_dev)}:{os.minor(st.st_dev)}")
+        except (OSError, ValueError):
+            return None
+        if os.path.exists(os.path.join(node, "partition")):
+            node = os.path.dirname(node)
+        return os.path.basename(node)
+
+    def disk(self, drive):
+        # Whole devices only (partitions would count twice). drive is a path
+        # here; its disk is reported, or the busiest one if it can't be found.
+        try:
+            devices = {name for name in os.listdir("/sys/block") if not name.startswith(("loop", "ram", "zram"))}
+            counters = {}
+            with open("/proc/diskstats", "r") as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) > 12 and fields[2] in devices:
+                        counters[fields[2]] = (int(fields[5]) * 512, int(fields[9]) * 512, int(fields[12]))
+        except (OSError, ValueError):
+            return None
+        now = time.monotonic()
+        rates = {}
+        for name, values in counters.items():
+            rate = self._delta.rate("disk:" + name, values, now)
+            if rate:
+                rates[name] = rate
+        if not rates:
+            return None
+        device = self._device_for(drive) if drive else None
+        if device in rates:
+            read_bps, write_bps, busy = rates[device]
+        else:
+            read_bps = sum(rate[0] for rate in rates.values())
+            write_bps = sum(rate[1] for rate in rates.values())
+            busy = max(rate[2] for rate in rates.values())
+        return {"read_bps": read_bps, "write_bps": write_bps, "percent": max(0.0, min(100.0, busy / 10.0))}
+
+
+class ChainBackend(MetricsBackend):
+    """Asks each backend in turn, per metric, skipping those that don't support it."""
+
+    def __init__(self, backends):
+        self.backends = list(backends)
+
+    @property
+    def name(self):
+        return "+".join(backend.name for backend in self.backends)
+
+    def _first(self, metric):
+        for backend in self.backends:
+            if backend.supports(metric):
+                return backend
+        return None
+
+    def supports(self, metric):
+        return self._first(metric) is not None
+
+    def cpu_percent(self):
+        backend = self._first("cpu")
+        return backend.cpu_percent() if backend else None
+
+    def ram_percent(self):
+        backend = self._first("ram")
+        return backend.ram_percent() if backend else None
+
+    def gpu_percent(self):
+        backend = self._first("gpu")
+        return backend.gpu_percent() if backend else None
+
+    def net_rates(self):
+        backend = self._first("net")
+        return backend.net_rates() if backend else None
+
+    def disk(self, drive):
+        backend = self._first("disk")
+        return backend.disk(drive) if backend else None
+
+    def helper_cpu_seconds(self):
+        return sum(backend.helper_cpu_seconds() for backend in self.backends)
+
+    def close(self):
+        for backend in self.backends:
+            backend.close()
+
+
+def create_backend(kind="auto", drive=""):
+    """
+    The backend for [Settings] MetricsBackend: "direct" (Win32 calls only),
+    "helper" (one streaming PowerShell process), "proc" (Linux), or "auto":
+    direct calls with the helpers filling in what they can't read (GPU).
+    """
+    kind = (kind or "auto").strip().lower()
+    if kind == "proc" or (kind == "auto" and sys.platform != "win32"):
+        return ChainBackend([ProcBackend(), NvidiaSmiStream()])
+    if kind == "direct":
+        return ChainBackend([Win32Backend()])
+    if kind == "helper":
+        return ChainBackend([PowerShellCounters(drive), Win32Backend()])
+    return ChainBackend([Win32Backend(), PowerShellCounters(drive), NvidiaSmiStream()])
@@ -0,0 +1,129 @@
+import math
+import time
+from array import array
+
+# Tier resolutions in seconds; each point is the average of the samples
+# taken in its time bucket.
+RESOLUTIONS = (1, 10, 60)
+# Points kept per tier: 10 minutes at 1 s, an hour at 10 s, a day at 1 min.
+CAPACITY = {1: 600, 10: 360, 60: 1440}
+# Buckets with no sample repeat the last value across gaps up to this long
+# (the sampler's slower pace while no graph is watched); longer gaps, such
+# as while sampling is parked, are marked with NaN.
+MAX_HOLD_S = 10
+# History name -> key in a UsageSampler payload.
+METRIC_KEYS = {
+    "cpu": "cpu",
+    "ram": "ram",
+    "gpu": "gpu",
+    "net": "net_percent",
+    "disk": "disk_percent",
+}
+
+
+class RingBuffer:
+    """
+    Fixed-size ring of numbers in a typed array: appends never allocate and
+    the oldest value is overwritten once full. appended counts every value
+    ever added, so readers can tell how many are new since they last looked.
+    """
+
+    def __init__(self, capacity, typecode="f"):
+        self.capacity = max(1, int(capacity))
+        self._data = array(typecode, [0]) * self.capacity
+        self._head = 0
+        self._count = 0
+        self.appended = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        self.appended += 1
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+    def last(self, count=None):
+        """The newest count values (all by default), oldest first, as an array."""
+        count = self._count if count is None else max(0, min(int(count), self._count))
+        start = (self._head - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._data[start:start + count]
+        return self._data[start:] + self._data[:start + count - self.capacity]
+
+    def latest(self):
+        if not self._count:
+            return None
+        return self._data[(self._head - 1) % self.capacity]
+
+    def nbytes(self):
+        return self._data.itemsize * self.capacity
+
+
+class MetricSeries:
+    """
+    One metric at every resolution in RESOLUTIONS, one point per bucket of
+    wall time. A bucket is written once a sample lands in a later one.
+    """
+
+    def __init__(self):
+        self.tiers = {res: RingBuffer(CAPACITY[res]) for res in RESOLUTIONS}
+        # Open bucket per tier: [bucket index, sum, count].
+        self._buckets = {res: None for res in RESOLUTIONS}
+
+    def add(self, value, now):
+        for res in RESOLUTIONS:
+            index = int(now // res)
+            bucket = self._buckets[res]
+            if bucket is not None and bucket[0] != index:
+                tier = self.tiers[res]
+                average = bucket[1] / bucket[2]
+                tier.append(average)
+                skipped = min(index - bucket[0] - 1, tier.capacity)
+                if skipped > 0:
+                    fill = average if skipped * res <= MAX_HOLD_S else math.nan
+                    for _ in range(skipped):
+                        tier.append(fill)
+                bucket = None
+            if bucket is None:
+                bucket = self._buckets[res] = [index, 0.0, 0]
+            bucket[1] += value
+            bucket[2] += 1
+
+
+class MetricsHistory:
+    """
+    Session history of the About page metrics, fed from UsageSampler
+    payloads. It lives as long as the sampler does, so graphs reopened
+    later in the session start from what was already recorded.
+    """
+
+    def __init__(self):
+        self.metrics = {name: MetricSeries() for name in METRIC_KEYS}
+
+    def record(self, payload, now=None):
+        now = time.time() if now is None else now
+        for name, key in METRIC_KEYS.items():
+            value = payload.get(key)
+            if value is None:
+                continue
+            try:
+                value = min(100.0, max(0.0, float(value)))
+            except (TypeError, ValueError):
+                continue
+            self.metrics[name].add(value, now)
+
+    def tier(self, name, resolution=RESOLUTIONS[0]):
+        return self.metrics[name].tiers[resolution]
+
+    def series(self, name, resolution=RESOLUTIONS[0], count=None):
+        return self.tier(name, resolution).last(count)
+
+    def nbytes(self):
+        return sum(ring.nbytes() for series in self.metrics.values() for ring in series.tiers.values())
@@ -0,0 +1,357 @@
+import os
+import sys
+import json
+import time
+import ctypes
+from PySide6.QtCore import QObject, QTimer
+from config import *
+import settings_store
+import job_pool
+
+HISTORY_FILENAME = "launch_history.json"
+
+# [Prefetch] defaults: Enabled, MaxMB (per session), RateMBps, Apps.
+DEFAULT_MAX_MB = 256
+DEFAULT_RATE_MBPS = 4
+DEFAULT_APPS = 6
+# Per app: the main exe plus this many of the largest files under App\...
+FILES_PER_APP = 8
+# ...within this many bytes.
+APP_BUDGET_BYTES = 96 * 1024 * 1024
+# Directory entries looked at per app when hunting for its largest files.
+MAX_WALK_ENTRIES = 4000
+CHUNK_BYTES = 1024 * 1024
+
+# Start this long after the window went to the tray; retry this long after a pause.
+START_DELAY_MS = 20000
+RETRY_DELAY_MS = 60000
+# The user counts as active if they touched mouse or keyboard this recently.
+USER_IDLE_MS = 5000
+# A launch within this long of its files being read counts as warm.
+WARM_WINDOW_S = 30 * 60
+# Launch history decays with this half-life when ranking apps.
+HISTORY_HALF_LIFE_DAYS = 14.0
+MAX_LATENCY_SAMPLES = 20
+
+
+class _LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+
+class _SYSTEM_POWER_STATUS(ctypes.Structure):
+    _fields_ = [
+        ("ACLineStatus", ctypes.c_ubyte),
+        ("BatteryFlag", ctypes.c_ubyte),
+        ("BatteryLifePercent", ctypes.c_ubyte),
+        ("SystemStatusFlag", ctypes.c_ubyte),
+        ("BatteryLifeTime", ctypes.c_ulong),
+        ("BatteryFullLifeTime", ctypes.c_ulong),
+    ]
+
+
+def user_idle_ms():
+    """Milliseconds since the last keyboard/mouse input anywhere, or None if unknown."""
+    if sys.platform != "win32":
+        return None
+    try:
+        info = _LASTINPUTINFO()
+        info.cbSize = ctypes.sizeof(info)
+        if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):
+            return None
+        return (ctypes.windll.kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF
+    except Exception:
+        return None
+
+
+def on_battery():
+    """True when running on battery power (False if unknown or plugged in)."""
+    if sys.platform == "win32":
+        try:
+            status = _SYSTEM_POWER_STATUS()
+            if ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status)):
+                return status.ACLineStatus == 0
+        except Exception:
+            pass
+    try:
+        import psutil  # type: ignore
+        battery = psutil.sensors_battery()
+        return battery is not None and battery.power_plugged is False
+    except Exception:
+        return False
+
+
+def pause_reason():
+    """Why background reads should stop right now, or "" if they may go on."""
+    idle = user_idle_ms()
+    if idle is not None and idle < USER_IDLE_MS:
+        return "user active"
+    if on_battery():
+        return "on battery"
+    return ""
+
+
+def _mean(values):
+    return sum(values) / len(values) if values else None
+
+
+class LaunchHistory:
+    """
+    Per-app launch counts and measured start-up times, kept in the Data
+    dir as JSON. Start-up times are split into cold launches and warm ones
+    (files read ahead shortly before) so the prefetcher's effect shows.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_data_dir(), HISTORY_FILENAME)
+        self.apps = {}
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and isinstance(data.get("apps"), dict):
+                self.apps = data["apps"]
+        except (OSError, ValueError):
+            self.apps = {}
+
+    def _entry(self, key):
+        return self.apps.setdefault(key, {"count": 0, "last": 0, "cold_ms": [], "warm_ms": []})
+
+    def record_launch(self, key):
+        entry = self._entry(key)
+        entry["count"] += 1
+        entry["last"] = int(time.time())
+        self.save()
+
+    def record_latency(self, key, ms, warm):
+        samples = self._entry(key)["warm_ms" if warm else "cold_ms"]
+        samples.append(round(ms, 1))
+        del samples[:-MAX_LATENCY_SAMPLES]
+        self.save()
+
+    def score(self, key, now=None):
+        entry = self.apps.get(key)
+        if not entry:
+            return 0.0
+        age_days = max(0.0, ((now or time.time()) - entry.get("last", 0)) / 86400.0)
+        return entry.get("count", 0) * 0.5 ** (age_days / HISTORY_HALF_LIFE_DAYS)
+
+    def improvement(self):
+        """{"cold_ms", "warm_ms", "cold_samples", "warm_samples"} over apps with both kinds."""
+        cold, warm = [], []
+        for entry in self.apps.values():
+            if entry.get("cold_ms") and entry.get("warm_ms"):
+                cold.append(_mean(entry["cold_ms"]))
+                warm.append(_mean(entry["warm_ms"]))
+        return {
+            "cold_ms": _mean(cold),
+            "warm_ms": _mean(warm),
+            "cold_samples": sum(len(e.get("cold_ms", [])) for e in self.apps.values()),
+            "warm_samples": sum(len(e.get("warm_ms", [])) for e in self.apps.values()),
+        }
+
+    def save(self):
+        self._dirty = True
+        payload = json.dumps({"version": 1, "apps": self.apps})
+        job = job_pool.submit(self._write, self.path, payload, name="launch_history", key="launch_history")
+        job.finished.connect(self._on_saved)
+
+    def _on_saved(self, _result):
+        self._dirty = False
+
+    def flush(self):
+        """Write now if a save is still queued (at exit, when queued jobs are dropped)."""
+        if self._dirty:
+            try:
+                self._write(self.path, json.dumps({"version": 1, "apps": self.apps}))
+                self._dirty = False
+            except OSError as e:
+                print(f"Error writing launch history: {e}")
+
+    @staticmethod
+    def _write(path, payload):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+
+def _app_files(exe_path):
+    """The main exe plus the largest files under its App folder, within APP_BUDGET_BYTES."""
+    files = []
+    try:
+        files.append((exe_path, os.path.getsize(exe_path)))
+    except OSError:
+        return []
+    app_dir = os.path.join(os.path.dirname(exe_path), "App")
+    found = []
+    seen = 0
+    for root, dirs, names in os.walk(app_dir, onerror=lambda e: None):
+        for name in names:
+            seen += 1
+            path = os.path.join(root, name)
+            try:
+                found.append((path, os.path.getsize(path)))
+            except OSError:
+                pass
+        if seen >= MAX_WALK_ENTRIES:
+            break
+    found.sort(key=lambda item: item[1], reverse=True)
+    budget = APP_BUDGET_BYTES - files[0][1]
+    for path, size in found:
+        if len(files) > FILES_PER_APP:
+            break
+        if 0 < size <= budget:
+            files.append((path, size))
+            budget -= size
+    return files
+
+
+def read_ahead(candidates, done, max_bytes, rate_bytes, token=None):
+    """
+    Read candidates' files (see _app_files) so they land in the OS page
+    cache, at most rate_bytes per second and max_bytes in total, skipping
+    the (path, size) pairs in done. Stops early, with a reason, on
+    cancellation, user activity or battery power.
+    """
+    buffer = bytearray(CHUNK_BYTES)
+    view = memoryview(buffer)
+    read_files = []
+    total = 0
+    started = time.perf_counter()
+    for exe_path in candidates:
+        for path, size in _app_files(exe_path):
+            if (path, size) in done:
+                continue
+            if total + size > max_bytes:
+                return {"files": read_files, "bytes": total, "stopped": "budget"}
+            try:
+                with open(path, "rb", buffering=0) as f:
+                    while True:
+                        if token is not None and token.is_cancelled():
+                            return {"files": read_files, "bytes": total, "stopped": "cancelled"}
+                        reason = pause_reason()
+                        if reason:
+                            return {"files": read_files, "bytes": total, "stopped": reason}
+                        count = f.readinto(view)
+                        if not count:
+                            break
+                        total += count
+                        # Stay under the I/O budget so a launch still gets the drive.
+                        ahead = total / float(rate_bytes) - (time.perf_counter() - started)
+                        if ahead > 0:
+                            time.sleep(ahead)
+            except OSError:
+                continue
+            read_files.append((path, size, exe_path))
+    return {"files": read_files, "bytes": total, "stopped": ""}
+
+
+class Prefetcher(QObject):
+    """
+    Warms the OS page cache with the files of the apps most likely to be
+    launched next (favorites and launch history) while the window sits in
+    the tray. Runs as an idle-priority job-pool job under [Prefetch] byte
+    and rate budgets, stops when the user becomes active or the machine is
+    on battery, and records cold vs warm start-up times from launches.
+    """
+
+    def __init__(self, launcher, parent=None):
+        super().__init__(parent)
+        self.launcher = launcher
+        self.history = LaunchHistory()
+        self.job = None
+        self.bytes_read = 0
+        self._apps = []
+        self._active = False
+        self._done = set()
+        # exe path key -> when its files were last read ahead
+        self._warmed = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._start)
+        launcher.launched.connect(self._on_launched)
+        launcher.settled.connect(self._on_settled)
+
+    def schedule(self, apps, delay_ms=None):
+        """The window went to the tray: read ahead for apps (scan dicts) after delay_ms."""
+        self._apps = [(app.get("exe", ""), bool(app.get("is_favorite"))) for app in apps or [] if app.get("exe")]
+        self._active = True
+        self._timer.start(START_DELAY_MS if delay_ms is None else delay_ms)
+
+    def pause(self):
+        self._active = False
+        self._timer.stop()
+        if self.job is not None:
+            self.job.cancel()
+
+    def _key(self, exe_path):
+        try:
+            return os.path.relpath(exe_path, get_base_dir()).replace("\\", "/")
+        except ValueError:
+            return exe_path.replace("\\", "/")
+
+    def _candidates(self, limit):
+        now = time.time()
+        ranked = []
+        for exe_path, favorite in self._apps:
+            score = self.history.score(self._key(exe_path), now) + (2.0 if favorite else 0.0)
+            if score > 0:
+                ranked.append((score, exe_path))
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        return [exe_path for _, exe_path in ranked[:limit]]
+
+    def _start(self):
+        if not self._active or self.job is not None:
+            return
+        config = settings_store.load_settings()
+        if not config.getboolean("Prefetch", "Enabled", fallback=True):
+            return
+        try:
+            max_bytes = int(config.get("Prefetch", "MaxMB", fallback=str(DEFAULT_MAX_MB))) * 1024 * 1024
+            rate_bytes = max(1, int(config.get("Prefetch", "RateMBps", fallback=str(DEFAULT_RATE_MBPS)))) * 1024 * 1024
+            limit = int(config.get("Prefetch", "Apps", fallback=str(DEFAULT_APPS)))
+        except ValueError:
+            max_bytes, rate_bytes, limit = DEFAULT_MAX_MB * 1024 * 1024, DEFAULT_RATE_MBPS * 1024 * 1024, DEFAULT_APPS
+        remaining = max_bytes - self.bytes_read
+        candidates = self._candidates(limit)
+        if remaining <= 0 or not candidates:
+            return
+        self.job = job_pool.submit(
+            read_ahead, candidates, frozenset(self._done), remaining, rate_bytes,
+            priority=job_pool.PRIORITY_IDLE, name="prefetch", pass_token=True,
+        )
+        self.job.finished.connect(self._on_done)
+        self.job.failed.connect(self._on_stopped)
+        self.job.cancelled.connect(self._on_stopped)
+
+    def _on_done(self, result):
+        self.job = None
+        now = time.time()
+        for path, size, exe_path in result["files"]:
+            self._done.add((path, size))
+            self._warmed[os.path.normcase(exe_path)] = now
+        self.bytes_read += result["bytes"]
+        if result["stopped"] in ("user active", "on battery") and self._active:
+            self._timer.start(RETRY_DELAY_MS)
+
+    def _on_stopped(self, *_args):
+        self.job = None
+
+    def _on_launched(self, record):
+        self.history.record_launch(self._key(record.app_path))
+
+    def _on_settled(self, record):
+        warmed_at = self._warmed.get(os.path.normcase(record.app_path))
+        warm = warmed_at is not None and record.started_at - warmed_at <= WARM_WINDOW_S
+        self.history.record_latency(self._key(record.app_path), record.idle_ms, warm)
+
+    def summary(self):
+        """One line on the measured effect, or "" before there is anything to compare."""
+        stats = self.history.improvement()
+        if stats["cold_ms"] is None or stats["warm_ms"] is None:
+            return ""
+        return (
+            f"Prefetch: cold start {stats['cold_ms']:.0f} ms vs warm {stats['warm_ms']:.0f} ms "
+            f"({stats['cold_samples']} cold / {stats['warm_samples']} warm samples); "
+            f"{self.bytes_read / (1024 * 1024):.1f} MB read this session"
+        )
@@ -0,0 +1,630 @@
+import os
+import io
+import sys
+import time
+import atexit
+import sqlite3
+import threading
+import configparser
+
+from config import get_settings_path
+
+# Changes submitted within this window are coalesced into a single write.
+DEFAULT_WRITE_DELAY = 0.35
+# Continuous changes (dragging a slider) still hit the disk at least this often.
+MAX_WRITE_DELAY = 2.0
+# Give up on a write that keeps failing (e.g. the stick was pulled).
+MAX_WRITE_RETRIES = 3
+
+# Per-app sections keyed by relative exe path. With thousands of apps these
+# dominate settings.ini, so they can live in an indexed SQLite file instead.
+INDEXED_SECTIONS = ("Favorites", "Hidden", "Renames", "Categories")
+INDEX_FILENAME = "settings.db"
+
+
+def new_config():
+    config = configparser.ConfigParser()
+    config.optionxform = str  # Preserve case
+    return config
+
+
+def render_config(config):
+    buf = io.StringIO()
+    config.write(buf)
+    return buf.getvalue()
+
+
+def parse_config(text, source="<settings>"):
+    config = new_config()
+    if text:
+        config.read_string(text, source=source)
+    return config
+
+
+def split_config(config):
+    """Split a config into (config without INDEXED_SECTIONS, {section: {key: value}})."""
+    stripped = new_config()
+    rows = {}
+    for section in config.sections():
+        values = dict(config.items(section, raw=True))
+        if section in INDEXED_SECTIONS:
+            rows[section] = values
+        else:
+            stripped[section] = values
+    return stripped, rows
+
+
+class AppStateIndex:
+    """
+    SQLite table holding the INDEXED_SECTIONS rows, one row per key, so a
+    single favourite/rename is an upsert instead of a whole-file rewrite.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS app_state ("
+            "section TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "PRIMARY KEY (section, key)) WITHOUT ROWID"
+        )
+
+    def load(self):
+        rows = {}
+        with self._lock:
+            cursor = self._conn.execute("SELECT section, key, value FROM app_state")
+            for section, key, value in cursor:
+                rows.setdefault(section, {})[key] = value
+        return rows
+
+    def apply(self, ops):
+        """Apply {(section, key): value-or-None} in one transaction; None deletes."""
+        upserts = [(s, k, v) for (s, k), v in ops.items() if v is not None]
+        deletes = [(s, k) for (s, k), v in ops.items() if v is None]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT INTO app_state (section, key, value) VALUES (?, ?, ?) "
+                        "ON CONFLICT (section, key) DO UPDATE SET value = excluded.value",
+                        upserts,
+                    )
+                if deletes:
+                    self._conn.executemany("DELETE FROM app_state WHERE section = ? AND key = ?", deletes)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+class SettingsWriter:
+    """
+    Write-behind writer for settings.ini.
+
+    The GUI submits full config snapshots; the latest one wins. A background
+    thread writes it once the submit window goes quiet, via a temp file and
+    os.replace so the file on the stick is never left half-written. Reads are
+    served from the pending/last written text and only go back to disk when
+    the file was changed by someone else.
+
+    With an AppStateIndex attached, INDEXED_SECTIONS are kept out of the INI:
+    submits are diffed against an in-memory mirror of the table and only the
+    changed keys are upserted. Callers still see one merged ConfigParser.
+    """
+
+    def __init__(self, path, delay=DEFAULT_WRITE_DELAY, max_delay=MAX_WRITE_DELAY, index_path=None):
+        self.path = path
+        self.delay = float(delay)
+        self.max_delay = float(max_delay)
+        self.bytes_written = 0
+        self.write_count = 0
+        self.submit_count = 0
+        self.skipped_count = 0
+        self.index_write_count = 0
+        self.last_error = ""
+        # Bumped whenever the settings readers see change; lets consumers
+        # (the app scan) tell whether a result still reflects current settings.
+        self.generation = 0
+        self._cond = threading.Condition()
+        self._pending = None
+        self._inflight = None
+        self._deadline = 0.0
+        self._first_submit = 0.0
+        self._retries = 0
+        self._cached_text = None
+        self._cached_stat = None
+        self._thread = None
+        self._closed = False
+        self.index = None
+        self._rows = {}
+        self._pending_ops = {}
+        self._inflight_ops = None
+        if index_path:
+            self.attach_index(index_path)
+
+    @property
+    def indexed(self):
+        return self.index is not None
+
+    def attach_index(self, index_path):
+        index = AppStateIndex(index_path)
+        rows = index.load()
+        with self._cond:
+            self.index = index
+            self._rows = rows
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, getattr(st, "st_ino", 0))
+
+    def _busy(self):
+        return (
+            self._pending is not None
+            or self._inflight is not None
+            or bool(self._pending_ops)
+            or self._inflight_ops is not None
+        )
+
+    def _read_ini_text(self):
+        with self._cond:
+            if self._pending is not None:
+                return self._pending
+            if self._inflight is not None:
+                return self._inflight
+            stat = self._stat()
+            if self._cached_text is not None and stat == self._cached_stat:
+                return self._cached_text
+        if stat is None:
+            text = ""
+        else:
+            with open(self.path, "r") as f:
+                text = f.read()
+        with self._cond:
+            if self._pending is None and self._inflight is None:
+                if self._cached_text is not None and text != self._cached_text:
+                    # Edited behind our back.
+                    self.generation += 1
+                self._cached_text = text
+                self._cached_stat = stat
+                if self.index is not None and _has_indexed_section(text):
+                    # Hand edit, import or first run after enabling: fold the
+                    # sections found in the INI into the index.
+                    self._submit_locked(parse_config(text, self.path), replace_missing=False)
+                    return self._pending if self._pending is not None else text
+        return text
+
+    def read_text(self):
+        """Full settings text, including any indexed sections."""
+        with self._cond:
+            if self.index is None:
+                return self._read_ini_text()
+            return render_config(self.load())
+
+    def load(self):
+        config = parse_config(self._read_ini_text(), self.path)
+        with self._cond:
+            if self.index is not None:
+                for section, values in self._rows.items():
+                    if values:
+                        config[section] = values
+        return config
+
+    def submit(self, config, replace_missing=True):
+        """
+        Queue a full settings snapshot for writing. With the index attached,
+        an indexed section missing from `config` is cleared unless
+        replace_missing is False.
+        """
+        with self._cond:
+            self._submit_locked(config, replace_missing)
+
+    def _submit_locked(self, config, replace_missing=True):
+        ops = None
+        if self.index is not None:
+            if isinstance(config, str):
+                config = parse_config(config, self.path)
+            stripped, rows = split_config(config)
+            ops = self._diff_rows(rows, replace_missing)
+            text = render_config(stripped)
+        else:
+            text = config if isinstance(config, str) else render_config(config)
+        if self._closed:
+            self.generation += 1
+            if ops:
+                self._apply_ops(ops)
+            self._write_now(text)
+            return
+        if self._pending is None and self._inflight is None:
+            if text == self._cached_text and self._stat() == self._cached_stat:
+                text = None
+        if text is None and not ops:
+            self.skipped_count += 1
+            return
+        self._schedule_locked(text, ops)
+
+    def _schedule_locked(self, text, ops):
+        now = time.monotonic()
+        self.generation += 1
+        if not self._busy():
+            self._first_submit = now
+        if ops:
+            self._pending_ops.update(ops)
+        if text is not None:
+            self._pending = text
+        self._retries = 0
+        self.submit_count += 1
+        self._deadline = min(now + self.delay, self._first_submit + self.max_delay)
+        self._ensure_thread()
+        self._cond.notify_all()
+
+    def update_values(self, changes):
+        """
+        Set or remove individual keys: {(section, key): value-or-None}.
+
+        With the index attached, keys in INDEXED_SECTIONS become row upserts
+        without touching (or even rendering) the INI; anything else goes
+        through a normal load/modify/submit.
+        """
+        rest = changes
+        with self._cond:
+            if self.index is not None and not self._closed:
+                ops = {}
+                rest = {}
+                for (section, key), value in changes.items():
+                    if section not in INDEXED_SECTIONS:
+                        rest[(section, key)] = value
+                        continue
+                    rows = self._rows.setdefault(section, {})
+                    if value is None:
+                        if rows.pop(key, None) is not None:
+                            ops[(section, key)] = None
+                    elif rows.get(key) != str(value):
+                        rows[key] = str(value)
+                        ops[(section, key)] = str(value)
+                if ops:
+                    self._schedule_locked(None, ops)
+                if not rest:
+                    return
+        config = self.load()
+        for (section, key), value in rest.items():
+            if value is None:
+                if config.has_section(section):
+                    config.remove_option(section, key)
+            else:
+                if not config.has_section(section):
+                    config.add_section(section)
+                config.set(section, key, str(value))
+        self.submit(config)
+
+    def _diff_rows(self, rows, replace_missing):
+        """
+        Row ops turning the index into rows. With replace_missing False
+        (folding in a hand-edited or imported INI) the keys in rows are only
+        upserted: rows already in the index are never deleted.
+        """
+        ops = {}
+        for section in INDEXED_SECTIONS:
+            new = rows.get(section)
+            if new is None:
+                if not replace_missing:
+                    continue
+                new = {}
+            old = self._rows.get(section, {})
+            for key, value in new.items():
+                if old.get(key) != value:
+                    ops[(section, key)] = value
+            if not replace_missing:
+                self._rows[section] = dict(old, **new)
+                continue
+            for key in old:
+                if key not in new:
+                    ops[(section, key)] = None
+            self._rows[section] = new
+        return ops
+
+    def has_pending(self):
+        with self._cond:
+            return self._busy()
+
+    def flush(self, timeout=5.0):
+        """Write any pending snapshot now. Returns False if it did not land in time."""
+        end = time.monotonic() + timeout
+        with self._cond:
+            if not self._busy():
+                return True
+            self._deadline = 0.0
+            self._ensure_thread()
+            self._cond.notify_all()
+            while self._busy():
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def invalidate(self):
+        """Forget the cached text, e.g. after the file was replaced externally."""
+        with self._cond:
+            self._cached_text = None
+            self._cached_stat = None
+            self.generation += 1
+
+    def close(self, timeout=5.0):
+        ok = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return ok
+
+    def stats(self):
+        with self._cond:
+            return {
+                "bytes_written": self.bytes_written,
+                "writes": self.write_count,
+                "submits": self.submit_count,
+                "skipped": self.skipped_count,
+                "index_writes": self.index_write_count,
+                "index_rows": sum(len(v) for v in self._rows.values()),
+                "pending": self._busy(),
+                "last_error": self.last_error,
+            }
+
+    def _ensure_thread(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="SettingsWriter", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._pending_ops and not self._closed:
+                    self._cond.wait()
+                if self._pending is None and not self._pending_ops:
+                    return
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                text = self._pending
+                ops = self._pending_ops
+                self._pending = None
+                self._pending_ops = {}
+                self._inflight = text
+                self._inflight_ops = ops
+            stat = None
+            error = ""
+            try:
+                # Index first: a crash in between leaves the keys in both
+                # places, which the next read folds back together.
+                if ops:
+                    self._apply_ops(ops)
+                    ops = None
+                if text is not None:
+                    stat = self._write_now(text)
+            except Exception as e:
+                error = str(e)
+            with self._cond:
+                self._inflight = None
+                self._inflight_ops = None
+                if error:
+                    self.last_error = error
+                    print(f"Error writing settings: {error}")
+                    if self._retries < MAX_WRITE_RETRIES:
+                        self._retries += 1
+                        if ops:
+                            ops.update(self._pending_ops)
+                            self._pending_ops = ops
+                        if self._pending is None:
+                            self._pending = text
+                        self._deadline = time.monotonic() + self.max_delay
+                elif text is not None:
+                    self._cached_text = text
+                    self._cached_stat = stat
+                self._cond.notify_all()
+
+    def _apply_ops(self, ops):
+        self.index.apply(ops)
+        self.index_write_count += 1
+
+    def _write_now(self, text):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        stat = self._stat()
+        if stat is not None:
+            self.bytes_written += stat[1]
+        self.write_count += 1
+        return stat
+
+
+def _has_indexed_section(text):
+    for section in INDEXED_SECTIONS:
+        if f"[{section}]" in text:
+            return True
+    return False
+
+
+_WRITERS = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def get_index_path(path=None):
+    path = os.path.abspath(path or get_settings_path())
+    return os.path.join(os.path.dirname(path), INDEX_FILENAME)
+
+
+def get_settings_writer(path=None):
+    path = os.path.abspath(path or get_settings_path())
+    key = os.path.normcase(path)
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            # The indexed store is opt-in; its file existing is the switch.
+            index_path = get_index_path(path)
+            if not os.path.exists(index_path):
+                index_path = None
+            try:
+                writer = SettingsWriter(path, index_path=index_path)
+            except sqlite3.Error as e:
+                print(f"Error opening {index_path}: {e}")
+                writer = SettingsWriter(path)
+            _WRITERS[key] = writer
+        return writer
+
+
+def is_indexed(path=None):
+    return get_settings_writer(path).indexed
+
+
+def set_indexed(enabled, path=None):
+    """
+    Move the per-app sections into settings.db (enabled) or back into
+    settings.ini (disabled). Either way nothing is lost: the merged settings
+    are re-submitted through the new layout and flushed.
+    """
+    writer = get_settings_writer(path)
+    if bool(enabled) == writer.indexed:
+        return True
+    writer.flush()
+    config = writer.load()
+    index_path = get_index_path(writer.path)
+    if enabled:
+        writer.attach_index(index_path)
+        writer.submit(config)
+        return writer.flush()
+    with writer._cond:
+        index = writer.index
+        writer.index = None
+        writer._rows = {}
+    writer.submit(config)
+    ok = writer.flush()
+    if index is not None:
+        index.close()
+    if ok:
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(index_path + suffix)
+            except OSError:
+                pass
+    return ok
+
+
+def export_text(path=None):
+    """Full settings as INI text, whichever layout is in use."""
+    return render_config(load_settings(path))
+
+
+def import_text(text, path=None):
+    """Replace all settings with `text` (INI) and write it out now."""
+    writer = get_settings_writer(path)
+    writer.submit(parse_config(text))
+    return writer.flush()
+
+
+def generation(path=None):
+    """Counter that changes whenever the settings do (see SettingsWriter.generation)."""
+    return get_settings_writer(path).generation
+
+
+def load_settings(path=None):
+    return get_settings_writer(path).load()
+
+
+def save_settings(config, path=None):
+    get_settings_writer(path).submit(config)
+
+
+def update_values(changes, path=None):
+    get_settings_writer(path).update_values(changes)
+
+
+def flush_all(timeout=5.0):
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+    ok = True
+    for writer in writers:
+        ok = writer.flush(timeout) and ok
+    return ok
+
+
+atexit.register(flush_all)
+
+
+def benchmark(keys=10000, updates=50, directory=None):
+    """
+    Compare load and single-key update costs for the INI-only and indexed
+    layouts with `keys` entries per indexed section. Returns a dict of
+    timings in milliseconds.
+    """
+    import tempfile
+    import shutil
+
+    root = tempfile.mkdtemp(prefix="portablex-bench-", dir=directory)
+    results = {}
+    try:
+        seed = new_config()
+        seed["Settings"] = {"ViewMode": "list", "Theme": "dark"}
+        for section in INDEXED_SECTIONS:
+            seed[section] = {f"PortableApps/App{i}Portable/App{i}Portable.exe": f"value{i}" for i in range(keys)}
+        text = render_config(seed)
+        for mode in ("ini", "indexed"):
+            folder = os.path.join(root, mode)
+            os.makedirs(folder)
+            path = os.path.join(folder, "settings.ini")
+            with open(path, "w") as f:
+                f.write(text)
+            writer = SettingsWriter(path, delay=0, max_delay=0)
+            if mode == "indexed":
+                writer.attach_index(os.path.join(folder, INDEX_FILENAME))
+                writer.submit(writer.load(), replace_missing=False)
+                writer.flush(60)
+            writer.invalidate()
+
+            start = time.perf_counter()
+            writer.load()
+            results[f"{mode}_cold_load_ms"] = (time.perf_counter() - start) * 1000
+
+            # Leave the one-off migration write out of the per-update figures.
+            bytes_before = writer.bytes_written
+            index_writes_before = writer.index_write_count
+            start = time.perf_counter()
+            for i in range(updates):
+                writer.update_values({("Favorites", f"PortableApps/App{i}Portable/App{i}Portable.exe"): "true"})
+                writer.flush(60)
+            results[f"{mode}_update_ms"] = (time.perf_counter() - start) * 1000 / updates
+            results[f"{mode}_bytes_per_update"] = (writer.bytes_written - bytes_before) / updates
+            # Row upserts go to settings.db rather than rewriting the INI.
+            results[f"{mode}_index_writes_per_update"] = (writer.index_write_count - index_writes_before) / updates
+            results[f"{mode}_ini_bytes"] = os.path.getsize(path)
+            if writer.index is not None:
+                writer.index.close()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for name, value in benchmark(count).items():
+        print(f"{name}: {value:.3f}" if name.endswith(("_ms", "_per_update")) else f"{name}: {value:.0f}")
@@ -0,0 +1,244 @@
+import os
+import sys
+import time
+import ctypes
+from PySide6.QtCore import QObject, QTimer, Signal
+from config import stats_enabled
+import settings_store
+import drive_benchmark
+
+# [Startup] settings. The launch order is the order of Settings/StartupApps.
+DEFAULT_DELAY_MS = 750          # gap before each app after the first
+DEFAULT_IDLE_TIMEOUT_MS = 15000 # stop waiting for a busy app after this long
+# Without an idle signal from the backend, an app counts as starting for this long.
+SETTLE_MS = 2000
+POLL_MS = 100
+
+DRIVE_REMOVABLE = 2
+DRIVE_FIXED = 3
+DRIVE_REMOTE = 4
+
+
+def medium_concurrency(base_dir):
+    """
+    How many startup apps may be loading at once from the drive holding
+    base_dir: one on sticks and network shares, where parallel reads
+    thrash, two on fixed disks. A drive benchmark result overrides the
+    guess from the drive type.
+    """
+    measured = drive_benchmark.parallelism(base_dir)
+    if measured is not None:
+        return min(measured, 2)
+    if sys.platform != "win32":
+        return 2
+    try:
+        drive = os.path.splitdrive(os.path.abspath(base_dir))[0] + "\\"
+        kind = ctypes.windll.kernel32.GetDriveTypeW(drive)
+    except Exception:
+        return 1
+    return 2 if kind == DRIVE_FIXED else 1
+
+
+def load_plan(keys, base_dir, show_hidden, config=None):
+    """
+    Resolve the startup app keys into an ordered plan plus options, from
+    [Startup] (DelayMs, MaxConcurrent = auto|n, WaitForIdle, IdleTimeoutMs)
+    and per-app gaps in [StartupDelays] (app key = ms).
+    """
+    if config is None:
+        config = settings_store.load_settings()
+
+    def _int(key, default):
+        try:
+            return max(0, int(config.get("Startup", key, fallback=str(default))))
+        except ValueError:
+            return default
+
+    delay_ms = _int("DelayMs", DEFAULT_DELAY_MS)
+    concurrency = config.get("Startup", "MaxConcurrent", fallback="auto").strip().lower()
+    if concurrency.isdigit() and int(concurrency) > 0:
+        max_concurrent = int(concurrency)
+    else:
+        max_concurrent = medium_concurrency(base_dir)
+    wait_for_idle = config.getboolean("Startup", "WaitForIdle", fallback=False)
+    options = {
+        "max_concurrent": 1 if wait_for_idle else max_concurrent,
+        "wait_for_idle": wait_for_idle,
+        "idle_timeout_ms": _int("IdleTimeoutMs", DEFAULT_IDLE_TIMEOUT_MS),
+    }
+
+    plan = []
+    seen = set()
+    for key in keys or []:
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        if not show_hidden and config.getboolean("Hidden", key, fallback=False):
+            continue
+        exe_path = key if os.path.isabs(key) else os.path.normpath(os.path.join(base_dir, key))
+        try:
+            gap = max(0, int(config.get("StartupDelays", key, fallback=str(delay_ms))))
+        except ValueError:
+            gap = delay_ms
+        plan.append({"key": key, "exe": exe_path, "delay_ms": gap if plan else 0})
+    return plan, options
+
+
+class StartupOrchestrator(QObject):
+    """
+    Starts the startup apps in order, one gap apart and with at most
+    max_concurrent of them still loading at a time (or strictly one after
+    another when WaitForIdle is on). Pacing runs on a GUI-thread timer;
+    each app is started like a click would start it, through TurboManager
+    when turbo is on for it and LauncherService otherwise, so only the
+    short spawn jobs use the job pool. An app counts as loading until the
+    launcher reports it settled or exited (or, when the backend cannot
+    tell, for SETTLE_MS). Each app's latencies are reported through
+    app_started and, for the whole run, finished.
+    """
+
+    app_started = Signal(dict)
+    finished = Signal(list)
+
+    def __init__(self, launcher, turbo=None, parent=None):
+        super().__init__(parent)
+        self.launcher = launcher
+        self.turbo = turbo
+        self.report = []
+        self._plan = []
+        self._options = None
+        self._began = 0.0
+        self._last_start = None
+        # normcase(exe) -> (entry, queued at), waiting for the process to start...
+        self._spawning = {}
+        # ...then (entry, record) until it has settled.
+        self._loading = {}
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_MS)
+        self._timer.timeout.connect(self._tick)
+        launcher.launched.connect(self._on_launched)
+        launcher.failed.connect(self._on_failed)
+        launcher.settled.connect(self._on_settled)
+        launcher.exited.connect(self._on_exited)
+
+    def is_running(self):
+        return self._timer.isActive()
+
+    def start(self, keys, base_dir, show_hidden):
+        if self.is_running() or not keys:
+            return False
+        self._plan, self._options = load_plan(list(keys), base_dir, bool(show_hidden))
+        self.report = []
+        self._spawning = {}
+        self._loading = {}
+        self._began = time.perf_counter()
+        self._last_start = None
+        self._timer.start()
+        self._tick()
+        return True
+
+    def cancel(self):
+        """Start no more apps; those already started keep running."""
+        if self.is_running():
+            self._plan = []
+            self._finish()
+
+    def _tick(self):
+        now = time.perf_counter()
+        timeout = self._options["idle_timeout_ms"] / 1000.0
+        for key, (_entry, record) in list(self._loading.items()):
+            elapsed = time.time() - record.started_at
+            # The launcher stops watching an app it cannot read; give it SETTLE_MS then.
+            unknown = not self.launcher.is_settling(record) and elapsed * 1000.0 >= SETTLE_MS
+            if unknown or elapsed >= timeout:
+                del self._loading[key]
+        while self._plan:
+            item = self._plan[0]
+            if self._last_start is not None and now < self._last_start + item["delay_ms"] / 1000.0:
+                break
+            if len(self._spawning) + len(self._loading) >= self._options["max_concurrent"]:
+                break
+            self._plan.pop(0)
+            self._launch(item, now)
+            now = time.perf_counter()
+        if not self._plan and not self._spawning and not self._loading:
+            self._finish()
+
+    def _launch(self, item, now):
+        self._last_start = now
+        entry = {"key": item["key"], "exe": item["exe"], "queued_ms": (now - self._began) * 1000.0,
+                 "spawn_ms": None, "idle_ms": None, "error": ""}
+        key = os.path.normcase(os.path.normpath(item["exe"]))
+        if not os.path.isfile(item["exe"]):
+            self._fail(entry, f"{item['exe']} does not exist")
+            return
+        if self.turbo is not None and self.turbo.is_enabled(item["exe"]):
+            job = self.turbo.launch(item["exe"])
+        else:
+            job = self.launcher.launch(item["exe"])
+        if job is None:
+            self._fail(entry, "already starting")
+            return
+        self._spawning[key] = (entry, now)
+        job.cancelled.connect(lambda key=key: self._on_cancelled(key))
+
+    def _on_launched(self, record):
+        key = os.path.normcase(os.path.normpath(record.app_path))
+        spawning = self._spawning.pop(key, None)
+        if spawning is None:
+            return
+        entry, queued_at = spawning
+        entry["spawn_ms"] = (time.perf_counter() - queued_at) * 1000.0
+        self._add_report(entry)
+        if record.running:
+            self._loading[key] = (entry, record)
+
+    def _on_failed(self, app_path, error):
+        spawning = self._spawning.pop(os.path.normcase(os.path.normpath(app_path)), None)
+        if spawning is not None:
+            self._fail(spawning[0], error)
+
+    def _on_cancelled(self, key):
+        spawning = self._spawning.pop(key, None)
+        if spawning is not None:
+            self._fail(spawning[0], "cancelled")
+
+    def _on_settled(self, record):
+        loading = self._loading.pop(os.path.normcase(os.path.normpath(record.app_path)), None)
+        if loading is not None and loading[1] is record:
+            loading[0]["idle_ms"] = record.idle_ms
+
+    def _on_exited(self, record):
+        self._loading.pop(os.path.normcase(os.path.normpath(record.app_path)), None)
+
+    def _fail(self, entry, error):
+        entry["error"] = str(error)
+        print(f"Error launching startup app {entry['exe']}: {entry['error']}")
+        self._add_report(entry)
+
+    def _add_report(self, entry):
+        self.report.append(entry)
+        self.app_started.emit(entry)
+
+    def summary(self):
+        """One line on the last run's latencies, or "" before anything started."""
+        parts = []
+        for entry in self.report:
+            name = os.path.basename(entry["exe"])
+            if entry["error"]:
+                parts.append(f"{name} failed")
+                continue
+            text = f"{name} at +{entry['queued_ms']:.0f} ms (spawn {entry['spawn_ms']:.0f} ms"
+            if entry["idle_ms"] is not None:
+                text += f", idle after {entry['idle_ms']:.0f} ms"
+            parts.append(text + ")")
+        return "Startup apps: " + "; ".join(parts) if parts else ""
+
+    def _finish(self):
+        self._timer.stop()
+        self._spawning = {}
+        self._loading = {}
+        summary = self.summary()
+        if summary and stats_enabled():
+            print(summary)
+        self.finished.emit(list(self.report))
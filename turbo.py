@@ -0,0 +1,437 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+from PySide6.QtCore import QObject, Signal
+from config import *
+import settings_store
+import job_pool
+from host_cache import host_cache_root, volume_id
+
+# [Turbo] holds the opted-in apps (app key = true); [Settings] TurboVerify picks
+# how mirrored files are compared: "mtime" (size + mtime) or "hash" (sha1 when
+# the size matches but the mtime moved, e.g. FAT's DST shifts).
+TURBO_SECTION = "Turbo"
+MANIFEST_VERSION = 1
+DATA_DIR = "Data"
+CHUNK_BYTES = 1024 * 1024
+# Keep this much free on the local drive after mirroring.
+FREE_SPACE_MARGIN = 512 * 1024 * 1024
+# Mirrors not used for this long are removed.
+MIRROR_MAX_AGE_DAYS = 30
+
+
+def mirror_root():
+    return os.path.join(host_cache_root(), "Turbo")
+
+
+def mirror_paths(exe_path, base_dir):
+    """(app_dir, mirror_dir, manifest_path) for the app owning exe_path."""
+    app_dir = os.path.dirname(os.path.abspath(exe_path))
+    try:
+        rel = os.path.relpath(app_dir, base_dir).replace("\\", "/")
+    except ValueError:
+        rel = app_dir.replace("\\", "/")
+    digest = hashlib.sha1(f"{volume_id(app_dir)}|{rel.lower()}".encode("utf-8")).hexdigest()[:16]
+    mirror_dir = os.path.join(mirror_root(), f"{os.path.basename(app_dir)}-{digest}")
+    return app_dir, mirror_dir, mirror_dir + ".json"
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _sha1(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy(src, dst):
+    """Copy src over dst atomically, keeping its timestamps; returns the sha1 of the data."""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp_path = dst + ".turbo-tmp"
+    digest = hashlib.sha1()
+    with open(src, "rb") as fin, open(tmp_path, "wb") as fout:
+        for chunk in iter(lambda: fin.read(CHUNK_BYTES), b""):
+            digest.update(chunk)
+            fout.write(chunk)
+    shutil.copystat(src, tmp_path)
+    os.replace(tmp_path, dst)
+    return digest.hexdigest()
+
+
+def _walk(root):
+    """{relative path: absolute path} for every file under root."""
+    files = {}
+    for current, dirs, names in os.walk(root, onerror=lambda e: None):
+        for name in names:
+            if name.endswith(".turbo-tmp"):
+                continue
+            path = os.path.join(current, name)
+            files[os.path.relpath(path, root).replace("\\", "/")] = path
+    return files
+
+
+def _is_data(rel):
+    return rel.split("/", 1)[0].lower() == DATA_DIR.lower()
+
+
+def _conflict_name(path):
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.conflict-{time.strftime('%Y%m%d-%H%M%S')}{ext}"
+
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict) and manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "files": {}, "open": False}
+
+
+def save_manifest(manifest_path, manifest):
+    manifest["last_used"] = int(time.time())
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def sync_to_mirror(exe_path, base_dir, verify="mtime", token=None):
+    """
+    Bring the local mirror of exe_path's app folder up to date and return
+    {"exe", "copied", "bytes", "removed", "conflicts"}, or None if cancelled.
+    Unchanged files (by size + mtime, or by sha1 with verify="hash") are
+    kept; a session left open by a crash is synced back first.
+    """
+    app_dir, mirror_dir, manifest_path = mirror_paths(exe_path, base_dir)
+    if not os.path.isfile(exe_path):
+        raise FileNotFoundError(f"{exe_path} does not exist")
+    os.makedirs(mirror_dir, exist_ok=True)
+    manifest = load_manifest(manifest_path)
+    conflicts = []
+    if manifest.get("open"):
+        conflicts = sync_back(exe_path, base_dir)["conflicts"]
+        manifest = load_manifest(manifest_path)
+    entries = manifest["files"]
+    source = _walk(app_dir)
+
+    # Size everything that has to be copied before touching the disk.
+    pending = []
+    for rel, src in source.items():
+        src_stat = _stat(src)
+        if src_stat is None:
+            continue
+        entry = entries.get(rel)
+        dst_stat = _stat(os.path.join(mirror_dir, rel))
+        if entry and dst_stat == entry.get("dst"):
+            if src_stat == entry.get("src"):
+                continue
+            if verify == "hash" and src_stat[0] == entry["src"][0] and entry.get("sha1"):
+                if token is not None and token.is_cancelled():
+                    return None
+                if _sha1(src) == entry["sha1"]:
+                    entry["src"] = src_stat
+                    continue
+        pending.append((rel, src, src_stat))
+    needed = sum(src_stat[0] for _, _, src_stat in pending)
+    if needed and shutil.disk_usage(mirror_dir).free < needed + FREE_SPACE_MARGIN:
+        raise OSError(f"Not enough local space to mirror {os.path.basename(app_dir)} ({needed // (1024 * 1024)} MB)")
+
+    copied = 0
+    for rel, src, src_stat in pending:
+        if token is not None and token.is_cancelled():
+            save_manifest(manifest_path, manifest)
+            return None
+        dst = os.path.join(mirror_dir, rel)
+        sha1 = _copy(src, dst)
+        entries[rel] = {"src": src_stat, "dst": _stat(dst), "sha1": sha1}
+        copied += src_stat[0]
+
+    removed = 0
+    for rel in list(entries):
+        if rel not in source:
+            try:
+                os.remove(os.path.join(mirror_dir, rel))
+            except OSError:
+                pass
+            del entries[rel]
+            removed += 1
+    # From here the mirror's Data may change; sync_back() closes the session.
+    manifest["open"] = True
+    save_manifest(manifest_path, manifest)
+    return {
+        "exe": os.path.join(mirror_dir, os.path.relpath(exe_path, app_dir)),
+        "copied": len(pending),
+        "bytes": copied,
+        "removed": removed,
+        "conflicts": conflicts,
+    }
+
+
+def sync_back(exe_path, base_dir, token=None):
+    """
+    Copy what the app changed in its mirrored Data folder back to the stick.
+    A file also changed on the stick since it was mirrored is a conflict:
+    the stick copy stays and the local one is saved next to it as
+    name.conflict-<time>.ext. Returns {"copied", "removed", "conflicts"}.
+    """
+    app_dir, mirror_dir, manifest_path = mirror_paths(exe_path, base_dir)
+    manifest = load_manifest(manifest_path)
+    entries = manifest["files"]
+    local_data = {rel: path for rel, path in _walk(mirror_dir).items() if _is_data(rel)}
+    copied, removed, conflicts = 0, 0, []
+
+    for rel, local in local_data.items():
+        if token is not None and token.is_cancelled():
+            break
+        entry = entries.get(rel)
+        local_stat = _stat(local)
+        if local_stat is None or (entry and local_stat == entry.get("dst")):
+            continue
+        stick = os.path.join(app_dir, rel)
+        stick_stat = _stat(stick)
+        stick_unchanged = stick_stat == entry.get("src") if entry else stick_stat is None
+        if stick_unchanged:
+            sha1 = _copy(local, stick)
+            entries[rel] = {"src": _stat(stick), "dst": local_stat, "sha1": sha1}
+            copied += 1
+        elif stick_stat is not None and stick_stat[0] == local_stat[0] and _sha1(stick) == _sha1(local):
+            entries[rel] = {"src": stick_stat, "dst": local_stat, "sha1": entry.get("sha1") if entry else None}
+        else:
+            target = _conflict_name(stick)
+            _copy(local, target)
+            conflicts.append(os.path.relpath(target, app_dir))
+            # The stick wins; the next sync_to_mirror() brings its copy over.
+            entries.pop(rel, None)
+
+    for rel in [rel for rel in entries if _is_data(rel) and rel not in local_data]:
+        stick = os.path.join(app_dir, rel)
+        # Deleted locally: drop it from the stick too, unless it changed there.
+        if _stat(stick) == entries[rel].get("src"):
+            try:
+                os.remove(stick)
+                removed += 1
+            except OSError as e:
+                print(f"Error removing {stick}: {e}")
+        del entries[rel]
+
+    if token is None or not token.is_cancelled():
+        manifest["open"] = False
+    save_manifest(manifest_path, manifest)
+    return {"copied": copied, "removed": removed, "conflicts": conflicts}
+
+
+def prune_mirrors(max_age_days=MIRROR_MAX_AGE_DAYS, keep=()):
+    """Delete closed mirrors not used for max_age_days; returns how many went."""
+    root = mirror_root()
+    cutoff = time.time() - max_age_days * 86400
+    keep = {os.path.normcase(path) for path in keep}
+    count = 0
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return 0
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        manifest_path = os.path.join(root, name)
+        mirror_dir = manifest_path[:-len(".json")]
+        manifest = load_manifest(manifest_path)
+        if manifest.get("open") or manifest.get("last_used", 0) > cutoff or os.path.normcase(mirror_dir) in keep:
+            continue
+        shutil.rmtree(mirror_dir, ignore_errors=True)
+        try:
+            os.remove(manifest_path)
+        except OSError:
+            pass
+        count += 1
+    return count
+
+
+class TurboManager(QObject):
+    """
+    Opt-in "turbo" launches: the app folder is mirrored to host_cache_root()
+    on this machine and started from there, and its Data folder is synced
+    back to the stick once the last instance exits (or at quit, see
+    finish()). Mirrors stay on the host between sessions, so later launches
+    only copy what changed. Mirrored launches are never elevated: an app
+    that needs admin rights could not be tracked to its exit, so turbo is
+    turned off for it and it starts from the stick instead.
+    """
+
+    # Short user-facing notes (sync results, conflicts, fallbacks).
+    status = Signal(str)
+
+    def __init__(self, launcher, parent=None):
+        super().__init__(parent)
+        self.launcher = launcher
+        # normcase(app key) -> app key as stored in [Turbo].
+        self.enabled = {}
+        self._busy = set()
+        # normcase(app exe) -> (app exe, mirror exe) while its mirror may be in use.
+        self._sessions = {}
+        self._back_jobs = {}
+        self.reload()
+        launcher.exited.connect(self._on_exited)
+        launcher.failed.connect(self._on_launch_failed)
+        launcher.elevation_required.connect(self._on_elevation_required)
+        job_pool.submit(prune_mirrors, priority=job_pool.PRIORITY_IDLE, name="turbo_prune")
+
+    def reload(self):
+        """Re-read the opted-in apps from [Turbo] (e.g. after app rows were removed)."""
+        self.enabled = {}
+        config = settings_store.load_settings()
+        if config.has_section(TURBO_SECTION):
+            for key in config.options(TURBO_SECTION):
+                if config.getboolean(TURBO_SECTION, key, fallback=False):
+                    self.enabled[os.path.normcase(key)] = key
+
+    def _key(self, exe_path):
+        # Same case-preserving relative form as the other per-app sections.
+        try:
+            return os.path.relpath(exe_path, get_base_dir()).replace("\\", "/")
+        except ValueError:
+            return exe_path.replace("\\", "/")
+
+    def is_enabled(self, exe_path):
+        return os.path.normcase(self._key(exe_path)) in self.enabled
+
+    def set_enabled(self, exe_path, enabled):
+        key = self._key(exe_path)
+        stored = self.enabled.pop(os.path.normcase(key), None)
+        changes = {}
+        if stored and stored != key:
+            # Written in another case (by hand or an older version).
+            changes[(TURBO_SECTION, stored)] = None
+        if enabled:
+            self.enabled[os.path.normcase(key)] = key
+        changes[(TURBO_SECTION, key)] = "true" if enabled else None
+        settings_store.update_values(changes)
+
+    def is_busy(self, exe_path):
+        return self._key(exe_path) in self._busy
+
+    def launch(self, exe_path):
+        """Mirror exe_path's app and start the mirror; falls back to the stick if mirroring fails."""
+        key = self._key(exe_path)
+        if key in self._busy:
+            self.status.emit(f"{os.path.basename(exe_path)} is still syncing, try again in a moment.")
+            return None
+        session = self._sessions.get(os.path.normcase(exe_path))
+        if session and self.launcher.is_running(exe_path):
+            # Another instance is using the mirror; don't sync under it.
+            return self.launcher.launch(session[1], app_path=exe_path, elevate=False)
+        config = settings_store.load_settings()
+        verify = config.get("Settings", "TurboVerify", fallback="mtime").strip().lower()
+        self._busy.add(key)
+        job = job_pool.submit(
+            sync_to_mirror, exe_path, get_base_dir(), verify,
+            priority=job_pool.PRIORITY_UI, name="turbo_sync", pass_token=True,
+        )
+        job.finished.connect(lambda result, exe_path=exe_path: self._on_mirrored(exe_path, result))
+        job.failed.connect(lambda error, exe_path=exe_path: self._on_mirror_failed(exe_path, error))
+        job.cancelled.connect(lambda key=key: self._busy.discard(key))
+        return job
+
+    def _on_mirrored(self, exe_path, result):
+        self._busy.discard(self._key(exe_path))
+        if result is None:
+            return
+        if result["conflicts"]:
+            self._report_conflicts(exe_path, result["conflicts"])
+        self._sessions[os.path.normcase(exe_path)] = (exe_path, result["exe"])
+        self.launcher.launch(result["exe"], app_path=exe_path, elevate=False)
+
+    def _on_mirror_failed(self, exe_path, error):
+        self._busy.discard(self._key(exe_path))
+        self.status.emit(f"Turbo launch unavailable, starting from the drive: {error}")
+        self.launcher.launch(exe_path)
+
+    def _on_exited(self, record):
+        self._close_session(record.app_path)
+
+    def _on_launch_failed(self, app_path, _error):
+        # The mirror never started (or the exe vanished); nothing to wait for.
+        self._close_session(app_path)
+
+    def _on_elevation_required(self, record):
+        exe_path = record.app_path
+        if os.path.normcase(exe_path) not in self._sessions:
+            return
+        self._close_session(exe_path)
+        self.set_enabled(exe_path, False)
+        self.status.emit(f"{os.path.basename(exe_path)} needs administrator rights, so Turbo Launch was turned off for it. Starting it from the drive.")
+        self.launcher.launch(exe_path)
+
+    def _close_session(self, exe_path):
+        session = os.path.normcase(exe_path)
+        if session not in self._sessions or self.launcher.is_running(exe_path):
+            return
+        exe_path = self._sessions.pop(session)[0]
+        key = self._key(exe_path)
+        self._busy.add(key)
+        job = job_pool.submit(sync_back, exe_path, get_base_dir(), name="turbo_sync_back")
+        self._back_jobs[session] = (exe_path, job)
+        job.finished.connect(lambda result, exe_path=exe_path: self._on_synced_back(exe_path, result))
+        job.failed.connect(lambda _error, exe_path=exe_path: self._on_synced_back(exe_path, None))
+        job.cancelled.connect(lambda exe_path=exe_path: self._on_synced_back(exe_path, None))
+
+    def _on_synced_back(self, exe_path, result):
+        self._busy.discard(self._key(exe_path))
+        self._back_jobs.pop(os.path.normcase(exe_path), None)
+        if result and result["conflicts"]:
+            self._report_conflicts(exe_path, result["conflicts"])
+
+    def _report_conflicts(self, exe_path, conflicts):
+        name = os.path.basename(exe_path)
+        print(f"Turbo sync conflicts for {name}: {', '.join(conflicts)}")
+        self.status.emit(f"{name}: {len(conflicts)} file(s) changed on both the drive and this PC; local copies saved as .conflict files.")
+
+    def pending(self):
+        """Apps whose mirrored Data has not been synced back yet."""
+        return [exe_path for exe_path, _ in self._sessions.values()] + [exe_path for exe_path, _ in self._back_jobs.values()]
+
+    def running(self):
+        """Apps still running from their mirror, whose Data cannot be synced back yet."""
+        return [exe_path for exe_path, _ in self._sessions.values() if self.launcher.is_running(exe_path)]
+
+    def finish(self):
+        """
+        Sync back everything that can be at quit, on this thread: sessions
+        whose app has ended and sync-backs the (already shut down) job pool
+        did not run. Returns the apps left running from their mirror; their
+        Data is synced back at their next turbo launch on this PC.
+        """
+        todo = []
+        for session, (exe_path, job) in list(self._back_jobs.items()):
+            if job.started_at is None:
+                job.cancel()
+                todo.append(exe_path)
+            elif job.ended_at is None:
+                print(f"Turbo sync-back of {exe_path} still running at quit")
+        self._back_jobs.clear()
+        still_running = self.running()
+        for session, (exe_path, _) in list(self._sessions.items()):
+            if exe_path not in still_running:
+                del self._sessions[session]
+                todo.append(exe_path)
+        for exe_path in todo:
+            try:
+                result = sync_back(exe_path, get_base_dir())
+                if result["conflicts"]:
+                    print(f"Turbo sync conflicts for {os.path.basename(exe_path)}: {', '.join(result['conflicts'])}")
+            except Exception as e:
+                print(f"Error syncing {exe_path} back to the drive: {e}")
+        return still_running
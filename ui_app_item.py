@@ -1,9 +1,13 @@
 import os
-from PySide6.QtCore import Qt, QPoint, QPropertyAnimation, QEasingCurve, QRect, Signal, QFileInfo, QTimer
+from PySide6.QtCore import Qt, QObject, QPoint, QRect, Signal, QFileInfo, QTimer
 from PySide6.QtGui import QColor, QPainter, QFont, QPixmap, QCursor, QIcon
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGraphicsDropShadowEffect, QMenu, QFileIconProvider
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QMenu, QFileIconProvider
 from config import *
 from ui_base import AnimatableWidget
+from ui_theme import ThemeLabel, TEXT_MAIN, TEXT_SUB
+import ui_styles
+import ui_chrome
+import host_cache
 
 _ICON_CACHE = {}
 
@@ -15,8 +19,26 @@ def _load_icon_pixmap(path, size, fallback_path=None):
         return _ICON_CACHE[cache_key]
 
     def _try_path(p):
-        if not p or not os.path.exists(p):
+        if not p:
             return None
+        # A PNG in the host-local tier saves decoding the exe/.ico off the stick.
+        cached = host_cache.icon_cache_path(p, size)
+        if cached is None:
+            return None
+        if os.path.exists(cached):
+            pix = QPixmap(cached)
+            if not pix.isNull():
+                return pix
+        pix = _decode(p)
+        if pix is not None:
+            try:
+                os.makedirs(os.path.dirname(cached), exist_ok=True)
+                pix.save(cached, "PNG")
+            except Exception:
+                pass
+        return pix
+
+    def _decode(p):
         icon = QIcon(p)
         if not icon.isNull():
             pix = icon.pixmap(size, size)
@@ -46,13 +68,16 @@ def _load_icon_pixmap(path, size, fallback_path=None):
     return None
 
 class AppTooltip(QWidget):
-    def __init__(self, name, version, description, parent=None):
+    # Transparent space (left, top, right, bottom) the painted shadow falls into.
+    SHADOW_MARGINS = (6, 4, 6, 8)
+
+    def __init__(self, name="", version="", description="", parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setContentsMargins(*self.SHADOW_MARGINS)
         
         frame = QFrame()
         frame.setStyleSheet("""
@@ -76,34 +101,110 @@ class AppTooltip(QWidget):
         header_layout = QHBoxLayout()
         header_layout.setSpacing(8)
         
-        name_lbl = QLabel(name)
-        name_lbl.setFont(QFont(FONT_FAMILY, 9, QFont.Bold))
-        header_layout.addWidget(name_lbl)
+        self.name_lbl = QLabel()
+        self.name_lbl.setFont(QFont(FONT_FAMILY, 9, QFont.Bold))
+        header_layout.addWidget(self.name_lbl)
         
-        if version:
-            ver_lbl = QLabel(f"v{version}")
-            ver_lbl.setFont(QFont(FONT_FAMILY, 8))
-            ver_lbl.setStyleSheet("color: #888888;")
-            header_layout.addWidget(ver_lbl)
+        self.ver_lbl = QLabel()
+        self.ver_lbl.setFont(QFont(FONT_FAMILY, 8))
+        self.ver_lbl.setStyleSheet("color: #888888;")
+        header_layout.addWidget(self.ver_lbl)
             
         header_layout.addStretch()
         frame_layout.addLayout(header_layout)
         
-        if description:
-            desc_lbl = QLabel(description)
-            desc_lbl.setFont(QFont(FONT_FAMILY, 9))
-            desc_lbl.setWordWrap(True)
-            desc_lbl.setStyleSheet("color: #cccccc;")
-            desc_lbl.setMaximumWidth(300)
-            frame_layout.addWidget(desc_lbl)
+        self.desc_lbl = QLabel()
+        self.desc_lbl.setFont(QFont(FONT_FAMILY, 9))
+        self.desc_lbl.setWordWrap(True)
+        self.desc_lbl.setStyleSheet("color: #cccccc;")
+        self.desc_lbl.setMaximumWidth(300)
+        frame_layout.addWidget(self.desc_lbl)
             
         layout.addWidget(frame)
         
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 2)
-        frame.setGraphicsEffect(shadow)
+        # Cached 9-slice shadow instead of a QGraphicsDropShadowEffect on the frame.
+        self._shadow = ui_chrome.ShadowPainter(self, 5, QColor(0, 0, 0, 80), radius=4, offset=(0, 2), margins=self.SHADOW_MARGINS)
+        self.set_content(name, version, description)
+
+    def set_content(self, name, version="", description=""):
+        """Refill the labels so one window can serve every app."""
+        self.name_lbl.setText(name)
+        self.ver_lbl.setText(f"v{version}" if version else "")
+        self.ver_lbl.setVisible(bool(version))
+        self.desc_lbl.setText(description or "")
+        self.desc_lbl.setVisible(bool(description))
+        self.adjustSize()
+
+    def show_at(self, pos):
+        """Show with the visible frame (not the shadow margin) at pos."""
+        self.move(pos - QPoint(self.SHADOW_MARGINS[0], self.SHADOW_MARGINS[1]))
+        self.show()
+
+
+# How long the pointer has to rest on an app before its tooltip appears.
+TOOLTIP_DELAY_MS = 1500
+
+_app_tooltips = None
+
+
+def app_tooltips():
+    """The application-wide AppTooltipController (created on first use)."""
+    global _app_tooltips
+    if _app_tooltips is None:
+        _app_tooltips = AppTooltipController(QApplication.instance())
+    return _app_tooltips
+
+
+class AppTooltipController(QObject):
+    """
+    One delay timer and one reusable AppTooltip window for every app item.
+    Items report hover()/leave(); only the item under the pointer is
+    remembered, so rows own no timer or tooltip window of their own.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._owner = None
+        self._window = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(TOOLTIP_DELAY_MS)
+        self._timer.timeout.connect(self._show)
+
+    def hover(self, item):
+        self.hide()
+        self._owner = item
+        self._timer.start()
+
+    def leave(self, item):
+        if item is self._owner:
+            self._owner = None
+            self.hide()
+
+    def hide(self):
+        self._timer.stop()
+        if self._window is not None and self._window.isVisible():
+            self._window.hide()
+
+    def _show(self):
+        item = self._owner
+        if item is None:
+            return
+        try:
+            if not item.isVisible():
+                return
+            desc = item.description
+            if (not desc or not desc.strip()) and item.exe_path:
+                desc = QFileInfo(item.exe_path).fileName()
+            name, version = item.name, item.version
+        except RuntimeError:
+            self._owner = None
+            return
+        if self._window is None:
+            self._window = AppTooltip()
+        self._window.set_content(name, version, desc)
+        self._window.show_at(QCursor.pos() + QPoint(10, 10))
+
 
 class AppListItem(AnimatableWidget):
     """
@@ -121,13 +222,9 @@ class AppListItem(AnimatableWidget):
         self.version = version
         self.description = description
         self.icon_pixmap = None
+        self._selected = False
+        self._running = False
         
-        self.tooltip_win = None
-        self.hover_timer = QTimer(self)
-        self.hover_timer.setSingleShot(True)
-        self.hover_timer.setInterval(1500)
-        self.hover_timer.timeout.connect(self.show_tooltip)
-
         # Load Icon
         self.icon_pixmap = _load_icon_pixmap(icon_path, 32, fallback_path=self.exe_path)
         
@@ -151,51 +248,18 @@ class AppListItem(AnimatableWidget):
         # We will draw the icon in paintEvent or use a pixmap. 
         # For simplicity/no-assets, we draw in paintEvent of this widget.
         
-        self.text_label = QLabel(name)
+        self.text_label = ThemeLabel(name, role=TEXT_SUB if self.is_hidden else TEXT_MAIN)
         self.text_label.setFont(QFont(FONT_FAMILY, 9))
-        if self.is_hidden:
-            self.text_label.setStyleSheet(f"color: {COLOR_TEXT_SUB.name()}; background: transparent;")
-        else:
-            self.text_label.setStyleSheet(f"color: {COLOR_TEXT_MAIN.name()}; background: transparent;")
         
         layout.addWidget(self.icon_label)
         layout.addWidget(self.text_label)
         layout.addStretch()
 
-        # Animation setup
-        self.anim = QPropertyAnimation(self, b"bg_color")
-        self.anim.setDuration(150)
-        self.anim.setEasingCurve(QEasingCurve.OutQuad)
-
     def contextMenuEvent(self, event):
         menu = QMenu(self)
-        effective = getattr(self.window(), "effective_theme", "dark")
-        dark = effective == "dark"
-        bg = "#1b1f26" if dark else "#FDFDFD"
-        fg = COLOR_TEXT_MAIN.name()
-        border = "rgba(255, 255, 255, 0.2)" if dark else "rgba(0, 0, 0, 0.2)"
-        def _apply_style():
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background-color: {bg};
-                    color: {COLOR_TEXT_MAIN.name()};
-                    border: 1px solid {border};
-                }}
-                QMenu::item {{
-                    padding: 5px 20px;
-                    color: {COLOR_TEXT_MAIN.name()};
-                }}
-                QMenu::item:selected {{
-                    background-color: {COLOR_ACCENT.name()};
-                    color: #ffffff;
-                }}
-            """)
-        _apply_style()
-        if getattr(self.window(), "text_color", "") == "__rainbow__":
-            timer = QTimer(menu)
-            timer.timeout.connect(_apply_style)
-            timer.start(120)
-            menu.aboutToHide.connect(timer.stop)
+        window = self.window()
+        if hasattr(window, "style_menu"):
+            window.style_menu(menu, ui_styles.MENU_ROLE_ITEM)
 
         # Actions
         fav_action = menu.addAction("Favourite")
@@ -211,6 +275,11 @@ class AppListItem(AnimatableWidget):
         cat_action = menu.addAction("Change Category")
         cat_action.triggered.connect(lambda: self.window().request_category(self.exe_path))
 
+        turbo_action = menu.addAction("Turbo Launch")
+        turbo_action.setCheckable(True)
+        turbo_action.setChecked(bool(getattr(window, "is_turbo", lambda _exe: False)(self.exe_path)))
+        turbo_action.triggered.connect(lambda: self.window().toggle_turbo(self.exe_path))
+
         menu.addSeparator()
 
         refresh_action = menu.addAction("Refresh")
@@ -229,46 +298,45 @@ class AppListItem(AnimatableWidget):
         show_hidden_action.setChecked(self.window().show_hidden)
         show_hidden_action.triggered.connect(lambda: self.window().toggle_show_hidden())
 
+        menu.addSeparator()
+
+        select_action = menu.addAction("Select Multiple")
+        select_action.setCheckable(True)
+        select_action.setChecked(bool(getattr(self.window(), "_bulk_select_mode", False)))
+        select_action.triggered.connect(lambda checked: self.window().set_bulk_select_mode(checked, self.exe_path))
+
         menu.exec(event.globalPos())
 
     def enterEvent(self, event):
-        self.anim.stop()
-        self.anim.setStartValue(self._bg_color)
-        self.anim.setEndValue(COLOR_HOVER)
-        self.anim.start()
-        self.hover_timer.start()
+        self.fade_bg_color(COLOR_HOVER)
+        app_tooltips().hover(self)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        self.anim.stop()
-        self.anim.setStartValue(self._bg_color)
-        self.anim.setEndValue(QColor(0, 0, 0, 0))
-        self.anim.start()
-        self.hover_timer.stop()
-        if self.tooltip_win:
-            self.tooltip_win.close()
-            self.tooltip_win = None
+        self.fade_bg_color(QColor(0, 0, 0, 0))
+        app_tooltips().leave(self)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
-        if self.tooltip_win:
-            self.tooltip_win.close()
-            self.tooltip_win = None
+        app_tooltips().hide()
         if event.button() == Qt.LeftButton:
+            self.stop_bg_fade()
             self._bg_color = COLOR_PRESSED
             self.update()
             self.clicked.emit(self.exe_path)
         super().mousePressEvent(event)
 
-    def show_tooltip(self):
-        if not self.tooltip_win:
-            desc = self.description
-            if (not desc or not desc.strip()) and self.exe_path:
-                desc = QFileInfo(self.exe_path).fileName()
-            self.tooltip_win = AppTooltip(self.name, self.version, desc)
-            cursor_pos = QCursor.pos()
-            self.tooltip_win.move(cursor_pos + QPoint(10, 10))
-            self.tooltip_win.show()
+    def set_selected(self, selected):
+        selected = bool(selected)
+        if selected != self._selected:
+            self._selected = selected
+            self.update()
+
+    def set_running(self, running):
+        running = bool(running)
+        if running != self._running:
+            self._running = running
+            self.update()
 
     def mouseReleaseEvent(self, event):
         # Return to hover state
@@ -286,6 +354,13 @@ class AppListItem(AnimatableWidget):
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(self.rect(), 8, 8)
 
+        if self._selected:
+            fill = QColor(COLOR_ACCENT)
+            fill.setAlpha(60)
+            painter.setBrush(fill)
+            painter.setPen(COLOR_ACCENT)
+            painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 8, 8)
+
         # Draw Icon
         if self.icon_pixmap and not self.icon_pixmap.isNull():
             painter.setRenderHint(QPainter.SmoothPixmapTransform)
@@ -309,6 +384,11 @@ class AppListItem(AnimatableWidget):
             painter.setFont(QFont(FONT_FAMILY, 9, QFont.Bold))
             painter.drawText(icon_rect, Qt.AlignCenter, self.name[0])
 
+        if self._running:
+            painter.setBrush(COLOR_ACCENT)
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(QRect(self.width() - 16, (self.height() - 6) // 2, 6, 6))
+
 
 class AppGridItem(AnimatableWidget):
     """
@@ -327,12 +407,8 @@ class AppGridItem(AnimatableWidget):
         self.version = version
         self.description = description
         self.icon_pixmap = None
-
-        self.tooltip_win = None
-        self.hover_timer = QTimer(self)
-        self.hover_timer.setSingleShot(True)
-        self.hover_timer.setInterval(1500)
-        self.hover_timer.timeout.connect(self.show_tooltip)
+        self._selected = False
+        self._running = False
 
         # Load Icon
         self.icon_pixmap = _load_icon_pixmap(icon_path, 48, fallback_path=self.exe_path)
@@ -358,7 +434,7 @@ class AppGridItem(AnimatableWidget):
         self.icon_label.setPixmap(self.icon_pixmap)
         self.icon_label.setAlignment(Qt.AlignCenter)
 
-        self.text_label = QLabel(self.display_name)
+        self.text_label = ThemeLabel(self.display_name, role=TEXT_SUB if self.is_hidden else TEXT_MAIN)
         if font_size is None:
             if tile_width <= 60:
                 font_size = 6
@@ -371,19 +447,11 @@ class AppGridItem(AnimatableWidget):
         self.text_label.setFont(QFont(FONT_FAMILY, int(font_size)))
         self.text_label.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
         self.text_label.setWordWrap(True)
-        if self.is_hidden:
-            self.text_label.setStyleSheet(f"color: {COLOR_TEXT_SUB.name()}; background: transparent;")
-        else:
-            self.text_label.setStyleSheet(f"color: {COLOR_TEXT_MAIN.name()}; background: transparent;")
 
         layout.addWidget(self.icon_label, 0, Qt.AlignHCenter)
         layout.addWidget(self.text_label, 0, Qt.AlignHCenter)
         layout.addStretch()
 
-        self.anim = QPropertyAnimation(self, b"bg_color")
-        self.anim.setDuration(150)
-        self.anim.setEasingCurve(QEasingCurve.OutQuad)
-
     def _make_fallback_icon(self, size):
         pix = QPixmap(size, size)
         pix.fill(Qt.transparent)
@@ -402,34 +470,9 @@ class AppGridItem(AnimatableWidget):
 
     def contextMenuEvent(self, event):
         menu = QMenu(self)
-        effective = getattr(self.window(), "effective_theme", "dark")
-        dark = effective == "dark"
-        bg = "#1b1f26" if dark else "#FDFDFD"
-        border = "rgba(255, 255, 255, 0.2)" if dark else "rgba(0, 0, 0, 0.2)"
-
-        def _apply_style():
-            menu.setStyleSheet(f"""
-                QMenu {{
-                    background-color: {bg};
-                    color: {COLOR_TEXT_MAIN.name()};
-                    border: 1px solid {border};
-                }}
-                QMenu::item {{
-                    padding: 5px 20px;
-                    color: {COLOR_TEXT_MAIN.name()};
-                }}
-                QMenu::item:selected {{
-                    background-color: {COLOR_ACCENT.name()};
-                    color: #ffffff;
-                }}
-            """)
-
-        _apply_style()
-        if getattr(self.window(), "text_color", "") == "__rainbow__":
-            timer = QTimer(menu)
-            timer.timeout.connect(_apply_style)
-            timer.start(120)
-            menu.aboutToHide.connect(timer.stop)
+        window = self.window()
+        if hasattr(window, "style_menu"):
+            window.style_menu(menu, ui_styles.MENU_ROLE_ITEM)
 
         fav_action = menu.addAction("Favourite")
         fav_action.setCheckable(True)
@@ -444,6 +487,11 @@ class AppGridItem(AnimatableWidget):
         cat_action = menu.addAction("Change Category")
         cat_action.triggered.connect(lambda: self.window().request_category(self.exe_path))
 
+        turbo_action = menu.addAction("Turbo Launch")
+        turbo_action.setCheckable(True)
+        turbo_action.setChecked(bool(getattr(window, "is_turbo", lambda _exe: False)(self.exe_path)))
+        turbo_action.triggered.connect(lambda: self.window().toggle_turbo(self.exe_path))
+
         menu.addSeparator()
 
         refresh_action = menu.addAction("Refresh")
@@ -462,32 +510,29 @@ class AppGridItem(AnimatableWidget):
         show_hidden_action.setChecked(self.window().show_hidden)
         show_hidden_action.triggered.connect(lambda: self.window().toggle_show_hidden())
 
+        menu.addSeparator()
+
+        select_action = menu.addAction("Select Multiple")
+        select_action.setCheckable(True)
+        select_action.setChecked(bool(getattr(self.window(), "_bulk_select_mode", False)))
+        select_action.triggered.connect(lambda checked: self.window().set_bulk_select_mode(checked, self.exe_path))
+
         menu.exec(event.globalPos())
 
     def enterEvent(self, event):
-        self.anim.stop()
-        self.anim.setStartValue(self._bg_color)
-        self.anim.setEndValue(COLOR_HOVER)
-        self.anim.start()
-        self.hover_timer.start()
+        self.fade_bg_color(COLOR_HOVER)
+        app_tooltips().hover(self)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        self.anim.stop()
-        self.anim.setStartValue(self._bg_color)
-        self.anim.setEndValue(QColor(0, 0, 0, 0))
-        self.anim.start()
-        self.hover_timer.stop()
-        if self.tooltip_win:
-            self.tooltip_win.close()
-            self.tooltip_win = None
+        self.fade_bg_color(QColor(0, 0, 0, 0))
+        app_tooltips().leave(self)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
-        if self.tooltip_win:
-            self.tooltip_win.close()
-            self.tooltip_win = None
+        app_tooltips().hide()
         if event.button() == Qt.LeftButton:
+            self.stop_bg_fade()
             self._bg_color = COLOR_PRESSED
             self.update()
             self.clicked.emit(self.exe_path)
@@ -498,15 +543,17 @@ class AppGridItem(AnimatableWidget):
         self.update()
         super().mouseReleaseEvent(event)
 
-    def show_tooltip(self):
-        if not self.tooltip_win:
-            desc = self.description
-            if (not desc or not desc.strip()) and self.exe_path:
-                desc = QFileInfo(self.exe_path).fileName()
-            self.tooltip_win = AppTooltip(self.name, self.version, desc)
-            cursor_pos = QCursor.pos()
-            self.tooltip_win.move(cursor_pos + QPoint(10, 10))
-            self.tooltip_win.show()
+    def set_selected(self, selected):
+        selected = bool(selected)
+        if selected != self._selected:
+            self._selected = selected
+            self.update()
+
+    def set_running(self, running):
+        running = bool(running)
+        if running != self._running:
+            self._running = running
+            self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -515,3 +562,13 @@ class AppGridItem(AnimatableWidget):
             painter.setBrush(self._bg_color)
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(self.rect(), 10, 10)
+        if self._selected:
+            fill = QColor(COLOR_ACCENT)
+            fill.setAlpha(60)
+            painter.setBrush(fill)
+            painter.setPen(COLOR_ACCENT)
+            painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 10, 10)
+        if self._running:
+            painter.setBrush(COLOR_ACCENT)
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(QRect(self.width() - 12, 6, 6, 6))
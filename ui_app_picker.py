@@ -0,0 +1,224 @@
+import os
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex, QSortFilterProxyModel, QTimer, Signal
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QTreeView, QHeaderView
+from config import *
+
+# internalId of category rows; app rows store their category row + 1.
+_CATEGORY_ID = 0
+
+
+class AppPickerModel(QAbstractItemModel):
+    """
+    Category -> app tree over catalog dicts. Nothing is built per app up
+    front: rows are served straight from the grouped lists, icons are created
+    the first time a row is painted and check state is a set of app keys.
+    """
+
+    def __init__(self, key_fn, columns=None, parent=None):
+        super().__init__(parent)
+        self._key_fn = key_fn
+        # Extra columns: [(header, fn(app) -> str)]
+        self._columns = list(columns or [])
+        self._categories = []
+        self._apps = []
+        self._keys = []
+        self._checked = set()
+        self._icons = {}
+
+    def set_apps(self, apps, category_order=None):
+        grouped = {}
+        for app in apps or []:
+            cat = app.get("category", "No Category") or "No Category"
+            grouped.setdefault(cat, []).append(app)
+        order = [c for c in (category_order or []) if c in grouped]
+        order += sorted(c for c in grouped if c not in order)
+        self.beginResetModel()
+        self._categories = order
+        self._apps = [grouped[c] for c in order]
+        self._keys = [[self._key_fn(a.get("exe", "")) for a in grouped[c]] for c in order]
+        self.endResetModel()
+
+    def set_checked(self, keys):
+        self.beginResetModel()
+        self._checked = set(keys or [])
+        self.endResetModel()
+
+    def checked_keys(self):
+        return [key for keys in self._keys for key in keys if key in self._checked]
+
+    def checked_apps(self):
+        result = []
+        for apps, keys in zip(self._apps, self._keys):
+            for app, key in zip(apps, keys):
+                if key in self._checked:
+                    result.append((app, key))
+        return result
+
+    def app_count(self):
+        return sum(len(apps) for apps in self._apps)
+
+    # QAbstractItemModel
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, _CATEGORY_ID)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == _CATEGORY_ID:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, _CATEGORY_ID)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._categories)
+        if parent.internalId() == _CATEGORY_ID and parent.column() == 0:
+            return len(self._apps[parent.row()])
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1 + len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            if section == 0:
+                return "App"
+            if section - 1 < len(self._columns):
+                return self._columns[section - 1][0]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalId() == _CATEGORY_ID:
+            return Qt.ItemIsEnabled
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if index.internalId() == _CATEGORY_ID:
+            cat = self._categories[index.row()]
+            if column != 0:
+                return None
+            if role == Qt.DisplayRole:
+                return cat
+            if role == Qt.DecorationRole:
+                return self._icon(get_category_icon_path(cat))
+            return None
+        cat_row = index.internalId() - 1
+        app = self._apps[cat_row][index.row()]
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return app.get("name", "")
+            return self._columns[column - 1][1](app)
+        if column != 0:
+            return None
+        if role == Qt.CheckStateRole:
+            key = self._keys[cat_row][index.row()]
+            return Qt.Checked if key in self._checked else Qt.Unchecked
+        if role == Qt.DecorationRole:
+            return self._icon(app.get("icon", ""))
+        if role == Qt.ToolTipRole:
+            return app.get("description", "") or None
+        if role == Qt.UserRole:
+            return app
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or index.internalId() == _CATEGORY_ID:
+            return False
+        key = self._keys[index.internalId() - 1][index.row()]
+        checked = value == Qt.Checked or value == Qt.Checked.value
+        if checked:
+            self._checked.add(key)
+        else:
+            self._checked.discard(key)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def _icon(self, path):
+        if not path:
+            return None
+        icon = self._icons.get(path)
+        if icon is None:
+            icon = QIcon(path) if os.path.exists(path) else QIcon()
+            self._icons[path] = icon
+        return icon if not icon.isNull() else None
+
+
+class AppPicker(QWidget):
+    """
+    Search box + checkable category tree for choosing apps from the cached
+    catalog. Typing filters incrementally; a category whose name matches
+    keeps all of its apps.
+    """
+
+    checked_changed = Signal()
+
+    FILTER_DELAY_MS = 120
+
+    def __init__(self, key_fn, columns=None, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Search")
+        self.search.setClearButtonEnabled(True)
+        layout.addWidget(self.search)
+
+        self.model = AppPickerModel(key_fn, columns, self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy.setRecursiveFilteringEnabled(True)
+        self.proxy.setAutoAcceptChildRows(True)
+        self.proxy.setFilterKeyColumn(0)
+
+        self.tree = QTreeView()
+        self.tree.setModel(self.proxy)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setIndentation(14)
+        self.tree.setHeaderHidden(not columns)
+        self.tree.setTextElideMode(Qt.ElideRight if columns else Qt.ElideNone)
+        self.tree.header().setStretchLastSection(False)
+        self.tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, self.model.columnCount()):
+            self.tree.header().setSectionResizeMode(column, QHeaderView.Fixed)
+            self.tree.setColumnWidth(column, 160)
+        layout.addWidget(self.tree)
+
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.search.textChanged.connect(lambda _text: self._filter_timer.start())
+        self.model.dataChanged.connect(lambda *_: self.checked_changed.emit())
+
+    def set_apps(self, apps, category_order=None):
+        # Check state is keyed by app, so it survives a catalog refresh.
+        self.model.set_apps(apps, category_order)
+        self.tree.expandAll()
+
+    def set_checked(self, keys):
+        self.model.set_checked(keys)
+        self.tree.expandAll()
+
+    def checked_keys(self):
+        return self.model.checked_keys()
+
+    def checked_apps(self):
+        return self.model.checked_apps()
+
+    def _apply_filter(self):
+        self.proxy.setFilterFixedString(self.search.text().strip())
+        self.tree.expandAll()
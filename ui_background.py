@@ -0,0 +1,153 @@
+import os
+import hashlib
+from PySide6.QtCore import Qt, QObject, QTimer, QSize, QRect, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+from config import *
+import job_pool
+
+# Longest edge kept when a background image is imported into the Data dir.
+MAX_STORED_EDGE = 2048
+# Resizes (show/hide animations, dragging a screen edge) arrive in bursts.
+RENDER_DELAY_MS = 60
+
+BACKGROUNDS_DIRNAME = "backgrounds"
+
+
+def _expanded_size(source, target):
+    """Size source scaled to cover target (Qt.KeepAspectRatioByExpanding)."""
+    return source.scaled(target, Qt.KeepAspectRatioByExpanding)
+
+
+def decode_background(path, size):
+    """
+    Decode path straight to `size` pixels, covering and centre-cropped like
+    the old per-paint scale. Runs off the GUI thread, so it returns a QImage.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source = reader.size()
+    if source.isValid() and size.isValid():
+        # Let the decoder downsample (JPEG decodes at 1/2, 1/4, 1/8 for free).
+        reader.setScaledSize(_expanded_size(source, size))
+    image = reader.read()
+    if image.isNull():
+        return QImage()
+    # Also fixes up EXIF-rotated images, whose decoded size is transposed.
+    if size.isValid() and image.size() != size:
+        scaled = image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        x = (scaled.width() - size.width()) // 2
+        y = (scaled.height() - size.height()) // 2
+        image = scaled.copy(QRect(x, y, size.width(), size.height()))
+    return image
+
+
+def import_background_image(path, data_dir=None):
+    """
+    Store a downsampled copy of a large background image in the Data dir and
+    return its path. Small images (and ones already imported) are returned
+    unchanged, as is the original path if the copy cannot be written.
+    """
+    if not path or not os.path.isfile(path):
+        return path
+    target_dir = os.path.join(data_dir or get_data_dir(), BACKGROUNDS_DIRNAME)
+    try:
+        if os.path.commonpath([os.path.abspath(path), os.path.abspath(target_dir)]) == os.path.abspath(target_dir):
+            return path
+    except ValueError:
+        pass
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source = reader.size()
+    if not source.isValid() or max(source.width(), source.height()) <= MAX_STORED_EDGE:
+        return path
+    try:
+        stat = os.stat(path)
+        digest = hashlib.sha1(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8")).hexdigest()[:16]
+    except OSError:
+        return path
+    reader.setScaledSize(source.scaled(QSize(MAX_STORED_EDGE, MAX_STORED_EDGE), Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return path
+    ext = ".png" if image.hasAlphaChannel() else ".jpg"
+    out_path = os.path.join(target_dir, f"background_{digest}{ext}")
+    if os.path.exists(out_path):
+        return out_path
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+        if not image.save(out_path, None, 90):
+            return path
+    except OSError:
+        return path
+    return out_path
+
+
+class BackgroundImageCache(QObject):
+    """
+    The window background as a pixmap already at the container's device
+    pixel size. Paints only blit it; a new decode runs as a job-pool job
+    when the image, size or pixel ratio changes, and until it lands the last
+    pixmap is stretched over the new rect.
+    """
+
+    changed = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._key = None
+        self._pixmap = None
+        self._wanted = None
+        self._failed = set()
+        self._job = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(RENDER_DELAY_MS)
+        self._timer.timeout.connect(self._start_render)
+
+    def pixmap(self, path, size, dpr=1.0):
+        """Best pixmap for path at size (logical pixels), or None if there is none yet."""
+        if not path or size.isEmpty():
+            return None
+        key = (path, size.width(), size.height(), round(float(dpr), 2))
+        if key != self._key and key != self._wanted and key not in self._failed:
+            self._wanted = key
+            self._timer.start(0 if self._pixmap is None or self._key[0] != path else RENDER_DELAY_MS)
+        if self._pixmap is not None and self._key[0] == path:
+            return self._pixmap
+        return None
+
+    def invalidate(self):
+        self._key = None
+        self._pixmap = None
+        self._wanted = None
+        self._failed.clear()
+
+    def _start_render(self):
+        if self._job is not None or self._wanted is None:
+            return
+        key = self._wanted
+        path, width, height, dpr = key
+        if not os.path.isfile(path):
+            self._failed.add(key)
+            self._wanted = None
+            return
+        size = QSize(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        # UI priority: the window is showing a stretched placeholder until this lands.
+        self._job = job_pool.submit(decode_background, path, size, priority=job_pool.PRIORITY_UI, name="background_render")
+        self._job.finished.connect(lambda image, key=key: self._on_rendered(key, image))
+        self._job.failed.connect(lambda _error, key=key: self._on_rendered(key, QImage()))
+
+    def _on_rendered(self, key, image):
+        self._job = None
+        if image.isNull():
+            self._failed.add(key)
+        elif key == self._wanted or self._key is None or self._key[0] == key[0]:
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(key[3])
+            self._key = key
+            self._pixmap = pixmap
+        if key == self._wanted:
+            self._wanted = None
+        elif self._wanted is not None:
+            self._timer.start(0)
+        self.changed.emit()
@@ -1,7 +1,81 @@
-from PySide6.QtCore import Qt, Property
-from PySide6.QtGui import QColor, QPainter, QPen
-from PySide6.QtWidgets import QWidget
+import time
+from PySide6.QtCore import Qt, Property, QObject, QTimer
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtWidgets import QApplication, QWidget
 from config import *
+import ui_chrome
+
+# Hover fade length and frame interval for HoverAnimator.
+HOVER_FADE_MS = 150
+HOVER_FRAME_MS = 16
+
+_hover_animator = None
+
+
+def hover_animator():
+    """The application-wide HoverAnimator (created on first use)."""
+    global _hover_animator
+    if _hover_animator is None:
+        _hover_animator = HoverAnimator(QApplication.instance())
+    return _hover_animator
+
+
+class HoverAnimator(QObject):
+    """
+    Drives every background colour fade from one timer. Only widgets that
+    are fading right now are tracked (one or two while the mouse moves over
+    a list), so rows need no QPropertyAnimation of their own and the timer
+    stops as soon as the last fade ends.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # widget -> (start colour, end colour, start time, duration in s)
+        self._running = {}
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(HOVER_FRAME_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def animate(self, widget, end_color, duration_ms=HOVER_FADE_MS):
+        """Fade widget's bg_color from its current value to end_color (OutQuad)."""
+        start = QColor(widget.get_bg_color())
+        end = QColor(end_color)
+        if start == end or duration_ms <= 0:
+            self._running.pop(widget, None)
+            widget.set_bg_color(end)
+            return
+        self._running[widget] = (start, end, time.monotonic(), duration_ms / 1000.0)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self, widget):
+        self._running.pop(widget, None)
+
+    def is_running(self, widget):
+        return widget in self._running
+
+    def _tick(self):
+        now = time.monotonic()
+        for widget, (start, end, started, duration) in list(self._running.items()):
+            t = min(1.0, (now - started) / duration)
+            eased = 1.0 - (1.0 - t) * (1.0 - t)
+            color = QColor(
+                round(start.red() + (end.red() - start.red()) * eased),
+                round(start.green() + (end.green() - start.green()) * eased),
+                round(start.blue() + (end.blue() - start.blue()) * eased),
+                round(start.alpha() + (end.alpha() - start.alpha()) * eased),
+            )
+            if t >= 1.0:
+                self._running.pop(widget, None)
+            try:
+                widget.set_bg_color(end if t >= 1.0 else color)
+            except RuntimeError:
+                # Deleted mid-fade (list rebuilt under the mouse).
+                self._running.pop(widget, None)
+        if not self._running:
+            self._timer.stop()
+
 
 class GlassPanel(QWidget):
     """
@@ -14,20 +88,11 @@ class GlassPanel(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Glass Background
+        # Fill and border are static per size/theme; blit the pre-rendered layer.
         bg_color = QColor(255, 255, 255, int(255 * self.base_opacity))
-        painter.setBrush(bg_color)
-        
-        # Glass Border
-        pen = QPen(COLOR_GLASS_BORDER)
-        pen.setWidth(1)
-        painter.setPen(pen)
-        
-        rect = self.rect().adjusted(1, 1, -1, -1)
-        painter.drawRoundedRect(rect, self.radius, self.radius)
+        layer = ui_chrome.rounded_panel(self.size(), self.devicePixelRatioF(), self.radius, bg_color, COLOR_GLASS_BORDER)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, layer)
 
 class AnimatableWidget(QWidget):
     """
@@ -45,4 +110,14 @@ class AnimatableWidget(QWidget):
         self._bg_color = color
         self.update()
 
-    bg_color = Property(QColor, get_bg_color, set_bg_color)
\ No newline at end of file
+    bg_color = Property(QColor, get_bg_color, set_bg_color)
+
+    def fade_bg_color(self, color, duration_ms=HOVER_FADE_MS):
+        """Fade to color on the shared HoverAnimator."""
+        hover_animator().animate(self, color, duration_ms)
+
+    def stop_bg_fade(self):
+        hover_animator().stop(self)
+
+    def bg_fading(self):
+        return _hover_animator is not None and _hover_animator.is_running(self)
\ No newline at end of file
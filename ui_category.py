@@ -4,7 +4,10 @@ from PySide6.QtGui import QColor, QPainter, QPen, QFont, QIcon, QPixmap
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QDialog, QComboBox, QDialogButtonBox
 from config import *
 from ui_base import AnimatableWidget
+from ui_theme import ThemeLabel, TEXT_SUB
 from ui_app_item import AppListItem
+import ui_chrome
+import ui_scheduler
 
 class CategorySelectionDialog(QDialog):
     def __init__(self, categories, current_category, parent=None):
@@ -93,42 +96,31 @@ class CategoryHeader(AnimatableWidget):
             self.icon_pixmap = QPixmap(icon_path)
             self.icon_pixmap = self.icon_pixmap.scaled(18, 18, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             
-        self.text_label = QLabel(name)
+        self.text_label = ThemeLabel(name)
         self.text_label.setFont(QFont(FONT_FAMILY, 10, QFont.Bold))
-        self.text_label.setStyleSheet(f"color: {COLOR_TEXT_MAIN.name()}; background: transparent;")
         
-        self.arrow_label = QLabel("▶")
+        self.arrow_label = ThemeLabel("▶", role=TEXT_SUB)
         self.arrow_label.setFont(QFont(FONT_FAMILY, 8))
-        self.arrow_label.setStyleSheet(f"color: {COLOR_TEXT_SUB.name()}; background: transparent;")
         
         layout.addWidget(self.icon_label)
         layout.addWidget(self.text_label)
         layout.addStretch()
         layout.addWidget(self.arrow_label)
-        
-        self.anim = QPropertyAnimation(self, b"bg_color")
-        self.anim.setDuration(150)
-        self.anim.setEasingCurve(QEasingCurve.OutQuad)
 
     def set_expanded(self, expanded):
         self.arrow_label.setText("▼" if expanded else "▶")
 
     def enterEvent(self, event):
-        self.anim.stop()
-        self.anim.setStartValue(self._bg_color)
-        self.anim.setEndValue(COLOR_HOVER)
-        self.anim.start()
+        self.fade_bg_color(COLOR_HOVER)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        self.anim.stop()
-        self.anim.setStartValue(self._bg_color)
-        self.anim.setEndValue(QColor(0, 0, 0, 0))
-        self.anim.start()
+        self.fade_bg_color(QColor(0, 0, 0, 0))
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            self.stop_bg_fade()
             self._bg_color = COLOR_PRESSED
             self.update()
             self.clicked.emit()
@@ -144,9 +136,14 @@ class CategoryHeader(AnimatableWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         if self._bg_color.alpha() > 0:
-            painter.setBrush(self._bg_color)
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(self.rect(), 8, 8)
+            if self.bg_fading():
+                # Every frame of a fade is a new colour; not worth caching.
+                painter.setBrush(self._bg_color)
+                painter.setPen(Qt.NoPen)
+                painter.drawRoundedRect(self.rect(), 8, 8)
+            else:
+                layer = ui_chrome.rounded_panel(self.size(), self.devicePixelRatioF(), 8, self._bg_color, inset=0)
+                painter.drawPixmap(0, 0, layer)
 
         if self.icon_pixmap and not self.icon_pixmap.isNull():
             painter.setRenderHint(QPainter.SmoothPixmapTransform)
@@ -172,6 +169,12 @@ class CategoryItem(QWidget):
         self.apps_data = apps
         self.expanded = False
         self._items_built = False
+        # Scheduler job still adding rows (see schedule_items).
+        self._build_job = None
+        # Shared set of selected exe paths while bulk-select mode is active.
+        self.selection = None
+        # Callable exe_path -> bool for the running-app marker, set by the window.
+        self.is_running = None
         
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -197,21 +200,85 @@ class CategoryItem(QWidget):
         self.header.set_expanded(False)
 
     def _ensure_items(self):
-        if self._items_built:
+        if self._items_built and self._build_job is None:
             return
+        if self._build_job is not None:
+            # Finish a scheduled build now (search, animated expand).
+            ui_scheduler.build_scheduler().cancel_job(self._build_job)
+            self._build_job = None
         self._items_built = True
-        for app in self.apps_data:
-            item = AppListItem(app["name"], app["icon"], app["exe"], app["is_favorite"], app["is_hidden"], app["category"], app["version"], app["description"])
-            item.clicked.connect(self.app_clicked.emit)
+        while self._add_next_item():
+            pass
+
+    def _add_next_item(self):
+        """Build the first app row not built yet; returns True while more remain."""
+        index = len(self.app_items)
+        if index < len(self.apps_data):
+            item = self._make_item(self.apps_data[index])
             self.content_layout.addWidget(item)
             self.app_items.append(item)
+        return len(self.app_items) < len(self.apps_data)
+
+    def schedule_items(self, token=None, priority=ui_scheduler.PRIORITY_NORMAL):
+        """Build the rows as frame-budgeted scheduler steps instead of all at once."""
+        if self._items_built:
+            return
+        self._items_built = True
+        job = ui_scheduler.build_scheduler().submit(
+            self._add_next_item, token=token, priority=priority, on_done=self._on_items_built
+        )
+        self._build_job = job
+        self.destroyed.connect(lambda *_: ui_scheduler.build_scheduler().cancel_job(job))
+
+    def _on_items_built(self):
+        self._build_job = None
+
+    def _make_item(self, app):
+        item = AppListItem(app["name"], app["icon"], app["exe"], app["is_favorite"], app["is_hidden"], app["category"], app["version"], app["description"])
+        item.clicked.connect(self.app_clicked.emit)
+        if self.selection:
+            item.set_selected(item.exe_path in self.selection)
+        if self.is_running:
+            item.set_running(self.is_running(item.exe_path))
+        return item
+
+    def insert_app(self, app, sort_key):
+        """Insert one app at its sorted position without rebuilding the category."""
+        key = sort_key(app)
+        index = len(self.apps_data)
+        for i, existing in enumerate(self.apps_data):
+            if sort_key(existing) > key:
+                index = i
+                break
+        self.apps_data.insert(index, app)
+        if self._items_built and (self._build_job is None or index < len(self.app_items)):
+            item = self._make_item(app)
+            self.content_layout.insertWidget(index, item)
+            self.app_items.insert(index, item)
+            if self.expanded and self.content_widget.isVisible():
+                self.content_widget.setMaximumHeight(16777215)
+
+    def remove_app(self, exe_path):
+        """Drop one app's row. Returns True if the app was in this category."""
+        found = False
+        for i, app in enumerate(self.apps_data):
+            if app.get("exe") == exe_path:
+                del self.apps_data[i]
+                found = True
+                break
+        for item in list(self.app_items):
+            if item.exe_path == exe_path:
+                self.app_items.remove(item)
+                self.content_layout.removeWidget(item)
+                item.deleteLater()
+        return found
 
     def _set_content_visible(self, visible, animate=False):
         if self._content_anim:
             self._content_anim.stop()
             self._content_anim = None
 
-        if visible:
+        if visible and (animate or self._build_job is None):
             self._ensure_items()
         if not animate:
             if visible:
@@ -259,7 +326,8 @@ class CategoryItem(QWidget):
     def set_expanded(self, expanded, animate=False):
         self.expanded = expanded
         self.header.set_expanded(expanded)
-        if expanded:
+        # A scheduled build keeps streaming rows into an unanimated expand.
+        if expanded and (animate or self._build_job is None):
             self._ensure_items()
         self._set_content_visible(self.expanded, animate=animate)
 
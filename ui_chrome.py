@@ -0,0 +1,221 @@
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QObject, QEvent, QRect, QRectF, QSize
+from PySide6.QtGui import QColor, QImage, QPainter, QPainterPath, QPen, QPixmap
+
+# Pixmaps for panels, borders and shadows, keyed by size/colours/pixel ratio.
+MAX_CACHED_PIXMAPS = 96
+
+_cache = OrderedDict()
+# Bumped by invalidate() so ChromeLayer slots notice too.
+_generation = 0
+
+
+def invalidate():
+    """Drop every pre-rendered layer (theme switch, screen change)."""
+    global _generation
+    _cache.clear()
+    _generation += 1
+
+
+def color_key(color):
+    return QColor(color).rgba()
+
+
+def cached_pixmap(kind, key, size, dpr, draw):
+    """
+    Return a transparent pixmap of `size` logical pixels at `dpr`, painted by
+    draw(painter, QRect) the first time (kind, key, size, dpr) is asked for.
+    """
+    full_key = (kind, size.width(), size.height(), round(float(dpr), 2)) + tuple(key)
+    pixmap = _cache.get(full_key)
+    if pixmap is not None:
+        _cache.move_to_end(full_key)
+        return pixmap
+    pixmap = QPixmap(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    try:
+        painter.setRenderHint(QPainter.Antialiasing)
+        draw(painter, QRect(0, 0, size.width(), size.height()))
+    finally:
+        painter.end()
+    _cache[full_key] = pixmap
+    if len(_cache) > MAX_CACHED_PIXMAPS:
+        _cache.popitem(last=False)
+    return pixmap
+
+
+def rounded_panel(size, dpr, radius, fill, border=None, border_width=1, inset=1):
+    """A filled, optionally bordered rounded rect (glass panels, search bar)."""
+    def _draw(painter, rect):
+        painter.setBrush(fill)
+        if border is not None:
+            pen = QPen(border)
+            pen.setWidth(border_width)
+            painter.setPen(pen)
+        else:
+            painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(rect.adjusted(inset, inset, -inset, -inset), radius, radius)
+    key = (radius, color_key(fill), color_key(border) if border is not None else None, border_width, inset)
+    return cached_pixmap("panel", key, size, dpr, _draw)
+
+
+def circle_pixmap(source, size, dpr, source_key, scale=0.96, inset=1):
+    """source scaled into a circle of `size`, as ProfilePicture draws it."""
+    def _draw(painter, rect):
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        path = QPainterPath()
+        path.addEllipse(QRectF(rect))
+        painter.setClipPath(path)
+        safe = int(min(rect.width(), rect.height()) * scale)
+        target = QSize(max(1, safe - inset * 2), max(1, safe - inset * 2))
+        scaled = source.scaled(target * dpr, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        scaled.setDevicePixelRatio(dpr)
+        logical = scaled.deviceIndependentSize().toSize()
+        x = (rect.width() - logical.width()) // 2
+        y = (rect.height() - logical.height()) // 2
+        painter.drawPixmap(x, y, scaled)
+    return cached_pixmap("circle", (source_key, scale, inset), size, dpr, _draw)
+
+
+class ChromeLayer:
+    """
+    Single-slot cache for one large layer (the window body). Only the
+    current key is kept, so a resize does not pile window-sized pixmaps
+    into the shared cache.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._pixmap = None
+
+    def invalidate(self):
+        self._key = None
+        self._pixmap = None
+
+    def pixmap(self, key, size, dpr, draw):
+        full_key = (size.width(), size.height(), round(float(dpr), 2), _generation) + tuple(key)
+        if full_key != self._key:
+            pixmap = QPixmap(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            try:
+                painter.setRenderHint(QPainter.Antialiasing)
+                draw(painter, QRect(0, 0, size.width(), size.height()))
+            finally:
+                painter.end()
+            self._key = full_key
+            self._pixmap = pixmap
+        return self._pixmap
+
+
+# --- 9-slice shadows ----------------------------------------------------------
+
+def _blur_alpha(image, radius):
+    """Cheap box blur (three passes approximate a gaussian) on an ARGB32 image's alpha."""
+    width, height = image.width(), image.height()
+    for _ in range(3):
+        for horizontal in (True, False):
+            small = image.scaled(
+                max(1, width // radius) if horizontal else width,
+                height if horizontal else max(1, height // radius),
+                Qt.IgnoreAspectRatio, Qt.SmoothTransformation,
+            )
+            image = small.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+def shadow_tile(blur, color, radius, dpr=1.0):
+    """
+    The source for a 9-slice drop shadow: a blurred rounded rect just big
+    enough for its corners, with `blur` px of falloff on every side.
+    """
+    edge = blur + radius
+    size = QSize(edge * 2 + 1, edge * 2 + 1)
+    key = (blur, color_key(color), radius)
+    full_key = ("shadow", size.width(), size.height(), round(float(dpr), 2)) + key
+    pixmap = _cache.get(full_key)
+    if pixmap is not None:
+        _cache.move_to_end(full_key)
+        return pixmap
+    scale = max(1.0, float(dpr))
+    image = QImage(round(size.width() * scale), round(size.height() * scale), QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(color)
+    painter.scale(scale, scale)
+    painter.drawRoundedRect(QRectF(blur, blur, size.width() - blur * 2, size.height() - blur * 2), radius, radius)
+    painter.end()
+    if blur > 0:
+        image = _blur_alpha(image, max(2, round(blur * scale / 2)))
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(scale)
+    _cache[full_key] = pixmap
+    if len(_cache) > MAX_CACHED_PIXMAPS:
+        _cache.popitem(last=False)
+    return pixmap
+
+
+def draw_nine_slice(painter, target, pixmap, edge):
+    """Stretch pixmap over target keeping `edge` logical px corners intact."""
+    src_w = pixmap.deviceIndependentSize().width()
+    src_h = pixmap.deviceIndependentSize().height()
+    dpr = pixmap.devicePixelRatio()
+    edge = min(edge, target.width() // 2, target.height() // 2)
+    if edge <= 0:
+        return
+    x_src = (0, edge, src_w - edge, src_w)
+    y_src = (0, edge, src_h - edge, src_h)
+    x_dst = (target.left(), target.left() + edge, target.right() + 1 - edge, target.right() + 1)
+    y_dst = (target.top(), target.top() + edge, target.bottom() + 1 - edge, target.bottom() + 1)
+    for row in range(3):
+        for col in range(3):
+            dst = QRectF(x_dst[col], y_dst[row], x_dst[col + 1] - x_dst[col], y_dst[row + 1] - y_dst[row])
+            if dst.width() <= 0 or dst.height() <= 0:
+                continue
+            src = QRectF(x_src[col] * dpr, y_src[row] * dpr, (x_src[col + 1] - x_src[col]) * dpr, (y_src[row + 1] - y_src[row]) * dpr)
+            painter.drawPixmap(dst, pixmap, src)
+
+
+def draw_shadow(painter, rect, blur, color, radius, offset=(0, 0), dpr=1.0):
+    """Paint a soft shadow for a rounded rect `rect` using the cached 9-slice tile."""
+    tile = shadow_tile(blur, color, radius, dpr)
+    target = QRect(rect).adjusted(-blur, -blur, blur, blur).translated(offset[0], offset[1])
+    draw_nine_slice(painter, target, tile, blur + radius)
+
+
+class ShadowPainter(QObject):
+    """
+    Event filter that paints a cached 9-slice shadow under a widget's
+    contents, replacing QGraphicsDropShadowEffect (which re-renders the
+    widget off-screen and blurs it on every update). The widget keeps
+    `margins` of transparent space around its contents for the shadow.
+    """
+
+    def __init__(self, widget, blur, color, radius=4, offset=(0, 0), margins=None):
+        super().__init__(widget)
+        self.blur = blur
+        self.color = QColor(color)
+        self.radius = radius
+        self.offset = offset
+        # left, top, right, bottom space around the shadowed rect
+        self.margins = margins or (blur, blur, blur, blur)
+        widget.setAttribute(Qt.WA_TranslucentBackground)
+        widget.installEventFilter(self)
+
+    def content_rect(self, widget):
+        left, top, right, bottom = self.margins
+        return widget.rect().adjusted(left, top, -right, -bottom)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            painter = QPainter(obj)
+            try:
+                draw_shadow(painter, self.content_rect(obj), self.blur, self.color, self.radius, self.offset, obj.devicePixelRatioF())
+            finally:
+                painter.end()
+        return False
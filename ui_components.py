@@ -1,6 +1,5 @@
 import os
 import shutil
-import configparser
 from PySide6.QtCore import (
     Qt, QSize, QPoint, QPropertyAnimation, QEasingCurve, 
     QParallelAnimationGroup, QRect, Property, Signal, QObject, QStorageInfo, QFileInfo, QTimer
@@ -16,6 +15,7 @@ from PySide6.QtWidgets import (
     QFileDialog, QMenu, QInputDialog, QDialog, QComboBox, QDialogButtonBox
 )
 from config import *
+import settings_store
 
 class GlassPanel(QWidget):
     """
@@ -528,9 +528,7 @@ class ProfilePicture(QWidget):
             fallback_path = os.path.join(base_dir, "PortableApps", "PortableX", "Graphics", "profilepic", "profile.png")
             loaded_pixmap = None
             if os.path.exists(settings_path):
-                config = configparser.ConfigParser()
-                config.optionxform = str
-                config.read(settings_path)
+                config = settings_store.load_settings(settings_path)
                 if "User" in config and "ProfilePic" in config["User"]:
                     path = config["User"]["ProfilePic"]
                     if not os.path.isabs(path):
@@ -590,17 +588,14 @@ class ProfilePicture(QWidget):
         except Exception:
             saved_path = path
 
-        config = configparser.ConfigParser()
-        config.optionxform = str
-        config.read(settings_path)
+        config = settings_store.load_settings(settings_path)
         if "User" not in config:
             config["User"] = {}
         rel_path = os.path.relpath(saved_path, base_dir).replace("\\", "/")
         config["User"]["ProfilePic"] = rel_path
         if config.has_option("User", "profilepic"):
             config.remove_option("User", "profilepic")
-        with open(settings_path, 'w') as f:
-            config.write(f)
+        settings_store.save_settings(config, settings_path)
         return saved_path
 
     def paintEvent(self, event):
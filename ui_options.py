@@ -1,14 +1,15 @@
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, Property, QRect, QPointF, QPoint, QSize, QFileInfo, QTimer, QSequentialAnimationGroup, QThread, QObject, QEvent
-from PySide6.QtGui import QFont, QKeySequence, QColor, QPainter, QImage, QPixmap, QLinearGradient, QPainterPath, QIcon, QBrush, QPalette, QCursor, QPen
+from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, Property, QRect, QRectF, QPointF, QPoint, QSize, QFileInfo, QTimer, QSequentialAnimationGroup, QObject, QEvent
+from PySide6.QtGui import QFont, QKeySequence, QColor, QPainter, QImage, QPixmap, QLinearGradient, QPainterPath, QIcon, QBrush, QPalette, QCursor, QPen, QRegion
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QFrame,
     QPushButton, QButtonGroup, QSizePolicy, QComboBox, QColorDialog, QFileDialog, QLineEdit,
     QGridLayout, QListView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect,
-    QGraphicsDropShadowEffect, QGraphicsOpacityEffect, QStyledItemDelegate, QStyle, QDialog, QDialogButtonBox, QCheckBox, QApplication,
+    QGraphicsOpacityEffect, QStyledItemDelegate, QStyle, QDialog, QDialogButtonBox, QCheckBox, QApplication,
     QFileIconProvider, QToolTip, QInputDialog, QMessageBox, QProgressBar
 )
 import hashlib
 import json
+import math
 import shutil
 import subprocess
 import ctypes
@@ -16,22 +17,21 @@ import socket
 import time
 import re
 
-_ACTIVE_THREADS = set()
-
-def _track_thread(thread):
-    if not thread:
-        return
-    _ACTIVE_THREADS.add(thread)
-    try:
-        thread.finished.connect(lambda: _ACTIVE_THREADS.discard(thread))
-    except Exception:
-        pass
 from config import *
 from app_info import get_app_about_text, get_app_display_name
 from ui_base import GlassPanel, AnimatableWidget
 from ui_search import SearchBar
 import os
 from ui_sidebar import QuickAccessButton
+import ui_rainbow
+import ui_chrome
+import ui_scheduler
+import job_pool
+import drive_benchmark
+import settings_store
+import metrics_backends
+import metrics_history
+from ui_theme import ThemeLabel, TEXT_ACCENT
 
 def _no_window_kwargs():
     if os.name != "nt":
@@ -677,6 +677,10 @@ class ThemedComboView(QListView):
         super().paintEvent(event)
 
 class ThemedComboBox(QComboBox):
+    # Space (left, top, right, bottom) around the popup list for its shadow;
+    # none on top, where the list meets the combo box.
+    POPUP_SHADOW_MARGINS = (16, 0, 16, 24)
+
     def __init__(self, settings, parent=None):
         super().__init__(parent)
         self._popup_anim = None
@@ -686,11 +690,12 @@ class ThemedComboBox(QComboBox):
         self.view().setSpacing(2)
         self.view().setMouseTracking(True)
 
-    def set_rainbow_text_color(self, color_hex):
-        self._rainbow_override = color_hex
-        if color_hex:
-            self.setStyleSheet(combo_style().replace(COLOR_TEXT_MAIN.name(), color_hex).replace(COLOR_TEXT_SUB.name(), color_hex))
+    def set_rainbow_text_color(self, color):
+        self._rainbow_override = color
+        if color:
+            ui_rainbow.apply_palette_color(self, QColor(color))
         else:
+            self.setPalette(QPalette())
             self.setStyleSheet(combo_style())
 
     def showPopup(self):
@@ -701,11 +706,10 @@ class ThemedComboBox(QComboBox):
         if popup:
             popup.setWindowFlags(Qt.Popup | Qt.FramelessWindowHint)
             popup.setAttribute(Qt.WA_TranslucentBackground)
-            shadow = QGraphicsDropShadowEffect(popup)
-            shadow.setBlurRadius(36)
-            shadow.setOffset(0, 12)
-            shadow.setColor(QColor(0, 0, 0, 140))
-            popup.setGraphicsEffect(shadow)
+            # Painted from a cached 9-slice tile into margins around the list,
+            # instead of a QGraphicsDropShadowEffect re-blurring every update.
+            if not getattr(popup, "_px_shadow", None):
+                popup._px_shadow = ui_chrome.ShadowPainter(popup, 16, QColor(0, 0, 0, 120), radius=8, offset=(0, 6), margins=self.POPUP_SHADOW_MARGINS)
 
             palette = combo_palette()
             popup.setStyleSheet(f"""
@@ -720,7 +724,13 @@ class ThemedComboBox(QComboBox):
                 }}
             """)
 
-            popup.setFixedWidth(self.width())
+            # Qt sized the popup for the list alone; grow it by the shadow space.
+            left, top, right, bottom = self.POPUP_SHADOW_MARGINS
+            if popup.layout() is not None:
+                popup.layout().setContentsMargins(left, top, right, bottom)
+            geometry = popup.geometry()
+            popup.setFixedWidth(self.width() + left + right)
+            popup.setGeometry(geometry.x() - left, geometry.y() - top, self.width() + left + right, geometry.height() + top + bottom)
             popup.setWindowOpacity(0.0)
             self._popup_anim = QPropertyAnimation(popup, b"windowOpacity", popup)
             self._popup_anim.setDuration(140)
@@ -821,19 +831,59 @@ class InfoCard(QFrame):
         return QPixmap.fromImage(img)
 
 class UsageGraph(QWidget):
+    """
+    Scrolling 0-100 line graph. The frame and grid are cached in one pixmap
+    and the line in another; a new value scrolls the line pixmap left by
+    one step and draws only the new segment, so an update costs the same
+    however many points are shown. Both are rebuilt on resize or a colour
+    change. bind() feeds the graph from a MetricsHistory series instead of
+    add_value()'s argument; clicking it then steps through the resolutions.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.values = []
         self.max_points = 60
+        self.values = metrics_history.RingBuffer(self.max_points)
         self._insets = (6, 6, 6, 6)
+        self._frame = None
+        self._frame_key = None
+        self._plot = None
+        self._scroll_error = 0.0
+        self._history = None
+        self._metric = None
+        self._resolution = metrics_history.RESOLUTIONS[0]
+        self._seen = 0
         self.setMinimumHeight(60)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
     def set_insets(self, left, top, right, bottom):
         self._insets = (int(left), int(top), int(right), int(bottom))
+        self._invalidate()
+
+    def bind(self, history, metric):
+        """Show history's metric series, starting with what it already holds."""
+        self._history = history
+        self._metric = metric
+        self._reload()
+
+    def _invalidate(self):
+        self._frame = None
+        self._plot = None
         self.update()
 
+    def _reload(self):
+        self.values.clear()
+        if self._history is not None:
+            tier = self._history.tier(self._metric, self._resolution)
+            for val in tier.last(self.max_points):
+                self.values.append(val)
+            self._seen = tier.appended
+        self._invalidate()
+
     def add_value(self, value):
+        if self._history is not None:
+            self._sync_history()
+            return
         try:
             val = float(value)
         except Exception:
@@ -842,19 +892,68 @@ class UsageGraph(QWidget):
             val = 0.0
         if val > 100:
             val = 100.0
-        self.values.append(val)
-        if len(self.values) > self.max_points:
-            self.values = self.values[-self.max_points:]
+        self._append(val)
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        left, top, right, bottom = self._insets
-        rect = self.rect().adjusted(left, top, -right, -bottom)
-        if rect.width() <= 0 or rect.height() <= 0:
+    def _sync_history(self):
+        tier = self._history.tier(self._metric, self._resolution)
+        new = tier.appended - self._seen
+        if new <= 0:
+            return
+        if new >= self.max_points:
+            self._reload()
+            return
+        self._seen = tier.appended
+        for val in tier.last(new):
+            self._append(val)
+        self.update()
+
+    def mousePressEvent(self, event):
+        if self._history is None or event.button() != Qt.LeftButton:
+            super().mousePressEvent(event)
             return
+        resolutions = metrics_history.RESOLUTIONS
+        self._resolution = resolutions[(resolutions.index(self._resolution) + 1) % len(resolutions)]
+        self._reload()
+        event.accept()
+
+    def resizeEvent(self, event):
+        self._frame = None
+        self._plot = None
+        super().resizeEvent(event)
+
+    def _plot_rect(self):
+        left, top, right, bottom = self._insets
+        return self.rect().adjusted(left, top, -right, -bottom)
+
+    def _span_text(self):
+        seconds = self.max_points * self._resolution
+        if seconds >= 3600:
+            return f"{seconds // 3600} h"
+        if seconds >= 60:
+            return f"{seconds // 60} min"
+        return f"{seconds} s"
+
+    def _new_pixmap(self, size):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(size.width() * ratio)), max(1, round(size.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
 
+    def _y(self, rect, val):
+        return rect.height() - (val / 100.0) * rect.height()
+
+    def _line_pen(self):
+        pen = QPen(COLOR_ACCENT)
+        pen.setWidthF(1.6)
+        pen.setCapStyle(Qt.RoundCap)
+        return pen
+
+    def _render_frame(self, rect):
+        self._frame = self._new_pixmap(self.size())
+        painter = QPainter(self._frame)
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setPen(Qt.NoPen)
         painter.setBrush(QColor(255, 255, 255, 8))
         painter.drawRoundedRect(rect, 6, 6)
@@ -878,23 +977,92 @@ class UsageGraph(QWidget):
             x = rect.left() + (rect.width() * i / 6.0)
             painter.drawLine(x, rect.top(), x, rect.bottom())
 
-        if len(self.values) < 2:
-            return
+        if self._history is not None and rect.height() >= 30:
+            painter.setPen(border_color)
+            font = painter.font()
+            font.setPixelSize(9)
+            painter.setFont(font)
+            painter.drawText(rect.adjusted(5, 2, -5, -2), Qt.AlignTop | Qt.AlignLeft, self._span_text())
+        painter.end()
 
-        step = rect.width() / max(1, (len(self.values) - 1))
+    def _render_plot(self, rect):
+        # Newest point on the right edge, one step per point to its left.
+        self._plot = self._new_pixmap(rect.size())
+        self._scroll_error = 0.0
+        values = self.values.last()
+        if len(values) < 2:
+            return
+        step = rect.width() / max(1, self.max_points - 1)
+        right = float(rect.width())
         path = QPainterPath()
-        for idx, val in enumerate(self.values):
-            x = rect.left() + (idx * step)
-            y = rect.bottom() - (val / 100.0) * rect.height()
-            if idx == 0:
-                path.moveTo(x, y)
-            else:
+        drawing = False
+        for idx, val in enumerate(values):
+            if math.isnan(val):
+                # No samples then (sampling was parked): leave a gap.
+                drawing = False
+                continue
+            x = right - (len(values) - 1 - idx) * step
+            y = self._y(rect, val)
+            if drawing:
                 path.lineTo(x, y)
-
-        pen = QPen(COLOR_ACCENT)
-        pen.setWidthF(1.6)
-        painter.setPen(pen)
+            else:
+                path.moveTo(x, y)
+                drawing = True
+        painter = QPainter(self._plot)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._line_pen())
         painter.drawPath(path)
+        painter.end()
+
+    def _append(self, val):
+        previous = self.values.latest()
+        self.values.append(val)
+        if self._plot is None or previous is None:
+            self._plot = None
+            return
+        rect = self._plot_rect()
+        if rect.size() != self._plot.deviceIndependentSize().toSize():
+            self._plot = None
+            return
+        step = rect.width() / max(1, self.max_points - 1)
+        ratio = self._plot.devicePixelRatio()
+        # Pixmaps scroll by whole device pixels; carry the remainder over.
+        self._scroll_error += step * ratio
+        shift = int(self._scroll_error)
+        self._scroll_error -= shift
+        if shift:
+            self._plot.scroll(-shift, 0, self._plot.rect(), QRegion())
+        painter = QPainter(self._plot)
+        painter.setCompositionMode(QPainter.CompositionMode_Clear)
+        exposed = shift / ratio
+        painter.fillRect(QRectF(rect.width() - exposed, 0, exposed + 1, rect.height()), QColor(0, 0, 0, 0))
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        if not (math.isnan(previous) or math.isnan(val)):
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self._line_pen())
+            right = float(rect.width())
+            painter.drawLine(QPointF(right - step, self._y(rect, previous)), QPointF(right, self._y(rect, val)))
+        painter.end()
+
+    def paintEvent(self, event):
+        rect = self._plot_rect()
+        if rect.width() <= 0 or rect.height() <= 0:
+            return
+        key = (self.size(), self.devicePixelRatioF(), QColor(COLOR_ACCENT).rgba(), QColor(COLOR_TEXT_SUB).rgba(), self._resolution)
+        if self._frame is None or key != self._frame_key:
+            self._frame_key = key
+            self._render_frame(rect)
+            self._plot = None
+        if self._plot is None:
+            self._render_plot(rect)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(0, 0, self._frame)
+        clip = QPainterPath()
+        clip.addRoundedRect(QRectF(rect), 6, 6)
+        painter.setClipPath(clip)
+        painter.drawPixmap(rect.topLeft(), self._plot)
 
 class MetricCard(QFrame):
     def __init__(self, title, icon, dark, parent=None, show_graph=True, show_usage=True, extra_widget=None):
@@ -1104,11 +1272,10 @@ class StorageDetailRow(QFrame):
     def set_values(self, used_bytes, format_bytes):
         self.value_label.setText(f"{format_bytes(used_bytes)}")
 
-class StorageDetailsWorker(QObject):
-    finished = Signal(list)
+class StorageDetailsWorker:
+    """Sizes the well-known top-level folders of a drive; run() returns None if stopped."""
 
     def __init__(self, root_path, used_total):
-        super().__init__()
         self.root_path = root_path
         self.used_total = used_total
         self._abort = False
@@ -1155,7 +1322,7 @@ class StorageDetailsWorker(QObject):
             results.append({"name": name, "size": size})
         other = max(self.used_total - total_known, 0)
         results.append({"name": "Other", "size": other})
-        self.finished.emit(results)
+        return results
 
 class StorageCard(QFrame):
     def __init__(self, dark, parent=None):
@@ -1166,8 +1333,8 @@ class StorageCard(QFrame):
         self.drive_root = "C:\\"
         self.details_loaded = False
         self.details_loading = False
-        self.details_thread = None
-        self.details_worker = None
+        self.details_job = None
+        self.bench_job = None
 
         self._bg_base = "rgba(255, 255, 255, 0.05)" if dark else "rgba(0, 0, 0, 0.04)"
         self._bg_hover = "rgba(255, 255, 255, 0.09)" if dark else "rgba(0, 0, 0, 0.08)"
@@ -1286,6 +1453,20 @@ class StorageCard(QFrame):
         details_row_layout.addWidget(self.io_container, 0, Qt.AlignLeft | Qt.AlignTop)
         details_row_layout.addStretch()
         self.details_layout.addWidget(self.details_row)
+        self.bench_row = QWidget()
+        bench_layout = QVBoxLayout(self.bench_row)
+        bench_layout.setContentsMargins(0, 2, 0, 0)
+        bench_layout.setSpacing(2)
+        self.bench_label = QLabel("")
+        self.bench_label.setWordWrap(True)
+        self.bench_label.setStyleSheet(f"color: {COLOR_TEXT_SUB.name()}; font-size: 10px; background: transparent; border: none;")
+        bench_layout.addWidget(self.bench_label)
+        self.bench_button = QPushButton("Run drive benchmark")
+        self.bench_button.setCursor(Qt.PointingHandCursor)
+        self.bench_button.setStyleSheet(self.details_button.styleSheet())
+        self.bench_button.clicked.connect(self._run_benchmark)
+        bench_layout.addWidget(self.bench_button, 0, Qt.AlignLeft)
+        self.details_layout.addWidget(self.bench_row)
         self.details_button_bottom = QPushButton("Hide details")
         self.details_button_bottom.setCursor(Qt.PointingHandCursor)
         self.details_button_bottom.setStyleSheet(self.details_button.styleSheet())
@@ -1400,7 +1581,7 @@ class StorageCard(QFrame):
             # Ensure only read/write details are shown.
             for i in reversed(range(self.details_layout.count())):
                 item = self.details_layout.itemAt(i)
-                if item and item.widget() in (self.details_row, self.details_button_bottom):
+                if item and item.widget() in (self.details_row, self.bench_row, self.details_button_bottom):
                     continue
                 item = self.details_layout.takeAt(i)
                 if item and item.widget():
@@ -1416,6 +1597,8 @@ class StorageCard(QFrame):
             self._update_graph_overlay()
             QTimer.singleShot(0, self._update_graph_overlay)
         self.details_container.setVisible(new_state)
+        if new_state:
+            self._show_benchmark()
         if hasattr(self, "details_button") and self.details_button:
             self.details_button.setText("See details")
         if hasattr(self, "details_button_bottom") and self.details_button_bottom:
@@ -1472,26 +1655,33 @@ class StorageCard(QFrame):
     def _load_details_async(self):
         if self.total_bytes <= 0:
             return
-        if self.details_thread and self.details_thread.isRunning():
+        if self.details_job is not None:
             return
         self.details_loading = True
-        self.details_thread = QThread()
-        _track_thread(self.details_thread)
-        self.details_worker = StorageDetailsWorker(self.drive_root, self.used_bytes)
-        self.details_worker.moveToThread(self.details_thread)
-        self.details_thread.started.connect(self.details_worker.run)
-        self.details_worker.finished.connect(self._apply_details)
-        self.details_worker.finished.connect(self.details_thread.quit)
-        self.details_worker.finished.connect(self.details_worker.deleteLater)
-        self.details_thread.finished.connect(self.details_thread.deleteLater)
-        self.details_thread.start()
+        worker = StorageDetailsWorker(self.drive_root, self.used_bytes)
+        self.details_job = job_pool.submit(worker.run, name="storage_details", key="storage_details")
+        self.details_job.token.on_cancel(worker.stop)
+        self.details_job.finished.connect(self._on_details_done)
+        self.details_job.failed.connect(self._on_details_cancelled)
+        self.details_job.cancelled.connect(self._on_details_cancelled)
+
+    def _on_details_done(self, details):
+        self.details_job = None
+        if details is None:
+            self.details_loading = False
+            return
+        self._apply_details(details)
+
+    def _on_details_cancelled(self, _error=None):
+        self.details_job = None
+        self.details_loading = False
 
     def _apply_details(self, details):
         self.details_loading = False
         self.details_loaded = True
         for i in reversed(range(self.details_layout.count())):
             item = self.details_layout.itemAt(i)
-            if item and item.widget() is self.io_container:
+            if item and item.widget() in (self.io_container, self.bench_row):
                 continue
             item = self.details_layout.takeAt(i)
             if item and item.widget():
@@ -1501,27 +1691,60 @@ class StorageCard(QFrame):
             row.set_values(entry["size"], self._format_gb)
             self.details_layout.addWidget(row)
 
+    def _show_benchmark(self, error=""):
+        if self.bench_job is not None:
+            return
+        results = drive_benchmark.history()
+        latest = results[-1] if results else None
+        previous = results[-2] if len(results) > 1 else None
+        text = drive_benchmark.summary(latest, previous)
+        if error:
+            text = f"Benchmark failed: {error}"
+        self.bench_label.setText(text)
+        self.bench_button.setText("Run drive benchmark" if latest is None else "Run again")
+        self.bench_button.setEnabled(True)
+
+    def _run_benchmark(self):
+        if self.bench_job is not None:
+            return
+        self.bench_label.setText("Measuring read/write speed (about 10 seconds)...")
+        self.bench_button.setEnabled(False)
+        self.bench_job = job_pool.submit(
+            drive_benchmark.run_benchmark, get_base_dir(),
+            priority=job_pool.PRIORITY_UI, name="drive_benchmark", key="drive_benchmark", pass_token=True,
+        )
+        self.bench_job.finished.connect(self._on_benchmark_done)
+        self.bench_job.failed.connect(self._on_benchmark_failed)
+        self.bench_job.cancelled.connect(self._on_benchmark_failed)
+
+    def _on_benchmark_done(self, result):
+        self.bench_job = None
+        if result:
+            drive_benchmark.save_result(result)
+        self._show_benchmark()
+
+    def _on_benchmark_failed(self, error=""):
+        self.bench_job = None
+        self._show_benchmark(error)
+
     def cleanup_threads(self):
-        if self.details_worker:
+        if self.details_job is not None:
             try:
-                self.details_worker.stop()
-            except Exception:
+                self.details_job.cancel()
+            except RuntimeError:
                 pass
-        if self.details_thread and self.details_thread.isRunning():
-            self.details_thread.quit()
-            if not self.details_thread.wait(1500):
-                try:
-                    self.details_thread.terminate()
-                except Exception:
-                    pass
-                self.details_thread.wait(500)
+            self.details_job = None
+        if self.bench_job is not None:
+            try:
+                self.bench_job.cancel()
+            except RuntimeError:
+                pass
+            self.bench_job = None
 
-class AboutInfoWorker(QObject):
-    finished = Signal(dict)
-    aborted = Signal()
+class AboutInfoWorker:
+    """Gathers the About page's system info; run() returns None if stopped."""
 
     def __init__(self, base_dir):
-        super().__init__()
         self.base_dir = base_dir
         self._abort = False
 
@@ -1586,7 +1809,7 @@ class AboutInfoWorker(QObject):
         data["ram_total"] = self._get_ram_total()
         if self._abort:
             return
-        self.finished.emit(data)
+        return data
 
     def _pick_gpu(self, data):
         if isinstance(data, dict):
@@ -1738,29 +1961,152 @@ class AboutInfoWorker(QObject):
             pass
         return ""
 
+# How much the About page's viewers need fresh readings (see UsageSampler.attach).
+DEMAND_NONE = 0     # nothing on screen: sampling is parked
+DEMAND_NUMBERS = 1  # the page is visible but its graphs are collapsed
+DEMAND_GRAPH = 2    # a graph or live rate is being looked at
+# Sampling interval while only collapsed cards are on screen.
+IDLE_INTERVAL_S = 5.0
+# A parked sampler lets its backend (and helper processes) go after this long.
+RELEASE_AFTER_S = 120.0
+
+_usage_sampler = None
+
+
+def shared_usage_sampler():
+    """The application-wide UsageSampler; About panels attach to it instead of owning one."""
+    global _usage_sampler
+    if _usage_sampler is None:
+        app = QApplication.instance()
+        _usage_sampler = UsageSampler(interval=1.0, parent=app)
+        app.aboutToQuit.connect(_usage_sampler.stop)
+    return _usage_sampler
+
+
 class UsageSampler(QObject):
+    """
+    Live CPU/RAM/GPU/network/disk readings for the About page. Viewers
+    attach() a callable reporting their demand; a one-second GUI heartbeat
+    samples every tick while a graph is watched, every IDLE_INTERVAL_S
+    while only the page is visible, and not at all otherwise (parked: the
+    backend stays warm and the last reading is kept in latest). Each
+    sample is one job-pool job; readings come from a metrics_backends
+    backend picked by [Settings] MetricsBackend, and what collecting them
+    costs is tracked in collector_stats(). Every reading is also kept in
+    history for the rest of the session.
+    """
+
     updated = Signal(dict)
     aborted = Signal()
 
-    def __init__(self, interval=1.0, net_link_bps=0):
-        super().__init__()
+    def __init__(self, interval=1.0, net_link_bps=0, parent=None):
+        super().__init__(parent)
         self.interval = max(0.5, float(interval))
         self.net_link_bps = float(net_link_bps or 0)
         self.drive_letter = ""
         self._abort = False
-        self._last_cpu = None
-        self._last_net = None
-        self._last_time = None
-        self._last_gpu_check = 0.0
-        self._psutil = None
-        try:
-            import psutil  # type: ignore
-            self._psutil = psutil
-        except Exception:
-            self._psutil = None
+        self.backend_kind = settings_store.load_settings().get("Settings", "MetricsBackend", fallback="auto")
+        self.backend = None
+        self._backend_drive = None
+        self._cost = {"samples": 0, "wall_ms": 0.0, "cpu_ms": 0.0}
+        self._helper_base = None
+        self._job = None
+        self.latest = None
+        self.history = metrics_history.MetricsHistory()
+        self._watchers = []
+        self._last_submit = 0.0
+        self._parked_since = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(self.interval * 1000))
+        self._timer.timeout.connect(self._tick)
+
+    def start(self):
+        self._abort = False
+        self._tick()
+
+    def attach(self, watcher):
+        """watcher() -> DEMAND_*; sampling follows the highest demand of all watchers."""
+        if watcher not in self._watchers:
+            self._watchers.append(watcher)
+        self.poke()
+
+    def detach(self, watcher):
+        if watcher in self._watchers:
+            self._watchers.remove(watcher)
+        self.poke()
+
+    def poke(self):
+        """Re-check demand now (a viewer was shown, hidden or expanded)."""
+        if not self._abort:
+            self._tick()
+
+    def demand(self):
+        level = DEMAND_NONE
+        for watcher in list(self._watchers):
+            try:
+                level = max(level, int(watcher()))
+            except RuntimeError:
+                # The widget behind it is gone.
+                self._watchers.remove(watcher)
+        return level
+
+    def _tick(self):
+        if self._abort:
+            return
+        level = self.demand()
+        now = time.monotonic()
+        if level == DEMAND_NONE:
+            if self._parked_since is None:
+                self._parked_since = now
+            if now - self._parked_since >= RELEASE_AFTER_S and self._job is None and self.backend is not None:
+                self.backend.close()
+                self.backend = None
+            if not self._watchers and self.backend is None:
+                self._timer.stop()
+            elif not self._timer.isActive():
+                self._timer.start()
+            return
+        self._parked_since = None
+        if not self._timer.isActive():
+            self._timer.start()
+        interval = self.interval if level >= DEMAND_GRAPH else max(self.interval, IDLE_INTERVAL_S)
+        if now - self._last_submit >= interval - 0.05:
+            self._submit_sample()
 
     def stop(self):
+        if self._abort:
+            return
         self._abort = True
+        self._timer.stop()
+        if self._job is not None:
+            try:
+                self._job.cancel()
+            except RuntimeError:
+                pass
+            self._job = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+        self.aborted.emit()
+
+    def _submit_sample(self):
+        if self._abort or self._job is not None:
+            return
+        self._last_submit = time.monotonic()
+        self._job = job_pool.submit(self.sample, name="usage_sample")
+        self._job.finished.connect(self._on_sample)
+        self._job.failed.connect(self._on_sample_failed)
+        self._job.cancelled.connect(self._on_sample_failed)
+
+    def _on_sample(self, payload):
+        self._job = None
+        if not self._abort:
+            self.latest = payload
+            self.history.record(payload)
+            self.updated.emit(payload)
+
+    def _on_sample_failed(self, _error=None):
+        self._job = None
 
     def set_net_link_bps(self, bps):
         try:
@@ -1774,353 +2120,76 @@ class UsageSampler(QObject):
         else:
             self.drive_letter = str(drive_letter).replace("\\", "").strip()
 
-    def run(self):
-        self._last_time = time.monotonic()
-        if self._psutil:
-            try:
-                counters = self._psutil.net_io_counters()
-                self._last_net = (counters.bytes_sent, counters.bytes_recv)
-            except Exception:
-                self._last_net = None
-
-        while not self._abort:
-            now = time.monotonic()
-            cpu = self._get_cpu_usage()
-            ram = self._get_ram_usage()
-            gpu = self._get_gpu_usage(now)
-            net = self._get_network_usage(now)
-            disk = self._get_disk_io()
-
-            payload = {
-                "cpu": cpu,
-                "ram": ram,
-                "gpu": gpu,
-                "net_total_bps": net.get("total_bps"),
-                "net_up_bps": net.get("up_bps"),
-                "net_down_bps": net.get("down_bps"),
-                "net_percent": net.get("percent"),
-                "disk_read_bps": disk.get("read_bps"),
-                "disk_write_bps": disk.get("write_bps"),
-                "disk_percent": disk.get("percent"),
-            }
-            self.updated.emit(payload)
-
-            step = 0.1
-            elapsed = 0.0
-            while elapsed < self.interval and not self._abort:
-                time.sleep(step)
-                elapsed += step
-
-        self.aborted.emit()
-
-    def _get_cpu_usage(self):
-        times = self._get_cpu_times()
-        if not times:
-            return None
-        if self._last_cpu is None:
-            self._last_cpu = times
-            return None
-        idle, kernel, user = times
-        last_idle, last_kernel, last_user = self._last_cpu
-        self._last_cpu = times
-        idle_delta = idle - last_idle
-        total_delta = (kernel + user) - (last_kernel + last_user)
-        if total_delta <= 0:
-            return None
-        usage = (total_delta - idle_delta) / float(total_delta) * 100.0
-        if usage < 0:
-            usage = 0.0
-        if usage > 100:
-            usage = 100.0
-        return usage
-
-    def _get_cpu_times(self):
-        try:
-            class FILETIME(ctypes.Structure):
-                _fields_ = [
-                    ("dwLowDateTime", ctypes.c_uint32),
-                    ("dwHighDateTime", ctypes.c_uint32),
-                ]
-            idle = FILETIME()
-            kernel = FILETIME()
-            user = FILETIME()
-            if not ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
-                return None
-            def _ft_to_int(ft):
-                return (ft.dwHighDateTime << 32) + ft.dwLowDateTime
-            return _ft_to_int(idle), _ft_to_int(kernel), _ft_to_int(user)
-        except Exception:
-            return None
-
-    def _get_ram_usage(self):
-        try:
-            class MEMORYSTATUSEX(ctypes.Structure):
-                _fields_ = [
-                    ("dwLength", ctypes.c_ulong),
-                    ("dwMemoryLoad", ctypes.c_ulong),
-                    ("ullTotalPhys", ctypes.c_ulonglong),
-                    ("ullAvailPhys", ctypes.c_ulonglong),
-                    ("ullTotalPageFile", ctypes.c_ulonglong),
-                    ("ullAvailPageFile", ctypes.c_ulonglong),
-                    ("ullTotalVirtual", ctypes.c_ulonglong),
-                    ("ullAvailVirtual", ctypes.c_ulonglong),
-                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
-                ]
-            status = MEMORYSTATUSEX()
-            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
-            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)) == 0:
-                return None
-            if status.ullTotalPhys == 0:
-                return None
-            used = 1.0 - (status.ullAvailPhys / float(status.ullTotalPhys))
-            usage = max(0.0, min(100.0, used * 100.0))
-            return usage
-        except Exception:
-            return None
-
-    def _get_gpu_usage(self, now):
-        if now - self._last_gpu_check < 1.2:
-            return None
-        self._last_gpu_check = now
-        usage = self._gpu_usage_taskmgr()
-        if usage is None:
-            usage = self._gpu_usage_nvidia()
-        if usage is None:
-            return None
-        return max(0.0, min(100.0, usage))
-
-    def _gpu_usage_nvidia(self):
-        exe = shutil.which("nvidia-smi")
-        if not exe:
-            candidate = os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "NVIDIA Corporation", "NVSMI", "nvidia-smi.exe")
-            if os.path.exists(candidate):
-                exe = candidate
-        if not exe:
-            return None
-        try:
-            out = subprocess.check_output(
-                [exe, "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
-                stderr=subprocess.DEVNULL,
-                text=True,
-                **_no_window_kwargs(),
-            ).strip()
-            if not out:
-                return None
-            first = out.splitlines()[0].strip()
-            return float(first)
-        except Exception:
-            return None
+    def _ensure_backend(self):
+        # Helpers are started per drive; a new drive letter means a new backend.
+        if self.backend is not None and self._backend_drive == self.drive_letter:
+            return self.backend
+        if self.backend is not None:
+            self.backend.close()
+        self.backend = metrics_backends.create_backend(self.backend_kind, self.drive_letter)
+        self._backend_drive = self.drive_letter
+        self._helper_base = None
+        return self.backend
+
+    def sample(self):
+        """One reading; runs on a pool thread. The first call only sets the baselines for rates."""
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        backend = self._ensure_backend()
+        cpu = backend.cpu_percent()
+        ram = backend.ram_percent()
+        gpu = backend.gpu_percent()
+        net = backend.net_rates()
+        disk = backend.disk(self.drive_letter) or {}
+        self._cost["samples"] += 1
+        self._cost["wall_ms"] += (time.perf_counter() - wall_started) * 1000.0
+        self._cost["cpu_ms"] += (time.thread_time() - cpu_started) * 1000.0
+
+        up_bps = down_bps = total_bps = percent = None
+        if net:
+            up_bps = net[0] * 8.0
+            down_bps = net[1] * 8.0
+            total_bps = up_bps + down_bps
+            if self.net_link_bps > 0:
+                percent = min(100.0, (total_bps / self.net_link_bps) * 100.0)
 
-    def _gpu_usage_taskmgr(self):
-        data = self._ps_json(
-            "(Get-Counter '\\\\GPU Engine(*)\\\\Utilization Percentage').CounterSamples "
-            "| Select-Object InstanceName,CookedValue | ConvertTo-Json -Compress"
-        )
-        if not data:
-            return None
-        if isinstance(data, dict):
-            data = [data]
-        candidates = []
-        fallback = []
-        for item in data:
-            try:
-                name = str(item.get("InstanceName", "")).lower()
-                value = float(item.get("CookedValue", 0.0))
-            except Exception:
-                continue
-            if "engtype_3d" in name or "engtype_graphics" in name:
-                candidates.append(value)
-            elif "engtype_copy" in name:
-                continue
-            else:
-                fallback.append(value)
-        if candidates:
-            return max(candidates)
-        if fallback:
-            return max(fallback)
-        return None
-
-    def _get_network_usage(self, now):
-        total_bps = None
-        up_bps = None
-        down_bps = None
-        if self._psutil:
-            try:
-                counters = self._psutil.net_io_counters()
-                sent = counters.bytes_sent
-                recv = counters.bytes_recv
-                if self._last_net is not None and self._last_time is not None:
-                    elapsed = max(0.5, now - self._last_time)
-                    delta_sent = max(0, sent - self._last_net[0])
-                    delta_recv = max(0, recv - self._last_net[1])
-                    up_bps = (delta_sent / elapsed) * 8.0
-                    down_bps = (delta_recv / elapsed) * 8.0
-                    total_bps = up_bps + down_bps
-                self._last_net = (sent, recv)
-                self._last_time = now
-            except Exception:
-                pass
-        else:
-            totals = self._get_net_totals()
-            if totals:
-                sent, recv = totals
-                if self._last_net is not None and self._last_time is not None:
-                    elapsed = max(0.5, now - self._last_time)
-                    delta_sent = max(0, sent - self._last_net[0])
-                    delta_recv = max(0, recv - self._last_net[1])
-                    up_bps = (delta_sent / elapsed) * 8.0
-                    down_bps = (delta_recv / elapsed) * 8.0
-                    total_bps = up_bps + down_bps
-                self._last_net = (sent, recv)
-                self._last_time = now
-            if total_bps is None or (up_bps == 0 and down_bps == 0 and total_bps == 0):
-                data = self._ps_json(
-                    "(Get-Counter '\\\\Network Interface(*)\\\\Bytes Sent/sec','\\\\Network Interface(*)\\\\Bytes Received/sec').CounterSamples "
-                    "| Select-Object Path,CookedValue | ConvertTo-Json -Compress"
-                )
-                if data:
-                    if isinstance(data, dict):
-                        data = [data]
-                    sent = 0.0
-                    recv = 0.0
-                    for item in data:
-                        try:
-                            path = str(item.get('Path', ''))
-                            value = float(item.get('CookedValue', 0.0))
-                        except Exception:
-                            continue
-                        if "Bytes Sent/sec" in path:
-                            sent += value
-                        elif "Bytes Received/sec" in path:
-                            recv += value
-                    up_bps = sent * 8.0
-                    down_bps = recv * 8.0
-                    total_bps = up_bps + down_bps
-                    self._last_time = now
-
-        percent = None
-        if total_bps is not None and self.net_link_bps > 0:
-            percent = min(100.0, (total_bps / self.net_link_bps) * 100.0)
         return {
-            "total_bps": total_bps,
-            "up_bps": up_bps,
-            "down_bps": down_bps,
-            "percent": percent,
+            "cpu": cpu,
+            "ram": ram,
+            "gpu": gpu,
+            "net_total_bps": total_bps,
+            "net_up_bps": up_bps,
+            "net_down_bps": down_bps,
+            "net_percent": percent,
+            "disk_read_bps": disk.get("read_bps"),
+            "disk_write_bps": disk.get("write_bps"),
+            "disk_percent": disk.get("percent"),
+            "collector": self.collector_stats(),
         }
 
-    def _get_disk_io(self):
-        drive = self.drive_letter or "_Total"
-        if drive != "_Total" and not drive.endswith(":"):
-            drive = drive + ":"
-
-        def _query_cim(target_drive):
-            cmd = (
-                "Get-CimInstance Win32_PerfFormattedData_PerfDisk_LogicalDisk "
-                f"-Filter \"Name='{target_drive}'\" "
-                "| Select-Object DiskReadBytesPerSec,DiskWriteBytesPerSec,PercentDiskTime "
-                "| ConvertTo-Json -Compress"
-            )
-            return self._ps_json(cmd)
-
-        def _query_counter(target_drive):
-            cmd = (
-                "Get-Counter -Counter @("
-                f"'\\\\LogicalDisk({target_drive})\\\\Disk Read Bytes/sec',"
-                f"'\\\\LogicalDisk({target_drive})\\\\Disk Write Bytes/sec') "
-                "| Select-Object -ExpandProperty CounterSamples "
-                "| Select-Object Path,CookedValue | ConvertTo-Json -Compress"
-            )
-            return self._ps_json(cmd)
-
-        data = _query_cim(drive)
-        if not data and drive != "_Total":
-            data = _query_cim("_Total")
-
-        read_bps = None
-        write_bps = None
-        percent = None
-        if data:
-            if isinstance(data, list):
-                data = data[0] if data else None
-            if isinstance(data, dict):
-                try:
-                    if data.get("DiskReadBytesPerSec") is not None:
-                        read_bps = float(data.get("DiskReadBytesPerSec"))
-                    if data.get("DiskWriteBytesPerSec") is not None:
-                        write_bps = float(data.get("DiskWriteBytesPerSec"))
-                    if data.get("PercentDiskTime") is not None:
-                        percent = float(data.get("PercentDiskTime"))
-                except Exception:
-                    pass
-
-        if read_bps is None and write_bps is None:
-            data = _query_counter(drive)
-            if not data and drive != "_Total":
-                data = _query_counter("_Total")
-            if data:
-                if isinstance(data, dict):
-                    data = [data]
-                for item in data:
-                    try:
-                        path = str(item.get("Path", ""))
-                        value = float(item.get("CookedValue", 0.0))
-                    except Exception:
-                        continue
-                    if "Disk Read Bytes/sec" in path:
-                        read_bps = value
-                    elif "Disk Write Bytes/sec" in path:
-                        write_bps = value
-
-        return {"read_bps": read_bps, "write_bps": write_bps, "percent": percent}
-
-    def _ps_scalar(self, command):
-        try:
-            out = subprocess.check_output(
-                ["powershell", "-NoProfile", "-Command", command],
-                stderr=subprocess.DEVNULL,
-                text=True,
-                **_no_window_kwargs(),
-            ).strip()
-            if not out:
-                return None
-            try:
-                return float(out)
-            except Exception:
-                return None
-        except Exception:
-            return None
-
-    def _ps_json(self, command):
-        try:
-            out = subprocess.check_output(
-                ["powershell", "-NoProfile", "-Command", command],
-                stderr=subprocess.DEVNULL,
-                text=True,
-                **_no_window_kwargs(),
-            ).strip()
-            if not out:
-                return []
-            return json.loads(out)
-        except Exception:
-            return []
-
-    def _get_net_totals(self):
-        data = self._ps_json(
-            "Get-NetAdapterStatistics | Select-Object SentBytes,ReceivedBytes | ConvertTo-Json -Compress"
-        )
-        if not data:
-            return None
-        if isinstance(data, dict):
-            data = [data]
-        sent = 0.0
-        recv = 0.0
-        for item in data:
-            try:
-                sent += float(item.get("SentBytes", 0.0))
-                recv += float(item.get("ReceivedBytes", 0.0))
-            except Exception:
-                continue
-        return sent, recv
+    def collector_stats(self):
+        """
+        What sampling costs: {"backend", "samples", "avg_wall_ms",
+        "avg_cpu_ms", "helper_cpu_percent"}; the CPU figures cover this
+        process's sampling thread and, separately, any helper processes.
+        """
+        samples = self._cost["samples"]
+        backend = self.backend
+        helper_percent = None
+        if backend is not None:
+            now = time.monotonic()
+            used = backend.helper_cpu_seconds()
+            if self._helper_base is None:
+                self._helper_base = (now, used)
+            elif now > self._helper_base[0]:
+                helper_percent = (used - self._helper_base[1]) / (now - self._helper_base[0]) * 100.0
+        return {
+            "backend": backend.name if backend is not None else "",
+            "samples": samples,
+            "avg_wall_ms": self._cost["wall_ms"] / samples if samples else 0.0,
+            "avg_cpu_ms": self._cost["cpu_ms"] / samples if samples else 0.0,
+            "helper_cpu_percent": helper_percent,
+        }
 
 
 
@@ -2202,28 +2271,28 @@ class AboutPanel(QWidget):
 
         self._start_loading()
         self.destroyed.connect(self._cleanup_threads)
-        self.usage_thread = None
         self.usage_sampler = None
         self._usage_running = False
         self.net_link_bps = 0.0
         self.drive_letter = ""
 
     def _start_loading(self):
-        self.worker_thread = QThread()
-        _track_thread(self.worker_thread)
-        self.worker = AboutInfoWorker(self.base_dir)
-        self.worker.moveToThread(self.worker_thread)
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self._apply_info)
-        self.worker.aborted.connect(self._handle_worker_aborted)
-        self.worker.finished.connect(self.worker_thread.quit)
-        self.worker.aborted.connect(self.worker_thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker.aborted.connect(self.worker.deleteLater)
-        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-        self.worker_thread.start()
-
-    def _handle_worker_aborted(self):
+        worker = AboutInfoWorker(self.base_dir)
+        self.info_job = job_pool.submit(worker.run, priority=job_pool.PRIORITY_UI, name="about_info")
+        self.info_job.token.on_cancel(worker.stop)
+        self.info_job.finished.connect(self._on_info_loaded)
+        self.info_job.failed.connect(self._handle_worker_aborted)
+        self.info_job.cancelled.connect(self._handle_worker_aborted)
+
+    def _on_info_loaded(self, data):
+        self.info_job = None
+        if data is None:
+            self._handle_worker_aborted()
+            return
+        self._apply_info(data)
+
+    def _handle_worker_aborted(self, _error=None):
+        self.info_job = None
         self.loading_bar.setVisible(False)
 
     def _cleanup_threads(self):
@@ -2232,39 +2301,18 @@ class AboutPanel(QWidget):
                 self.storage_card.cleanup_threads()
             except Exception:
                 pass
-        if hasattr(self, "worker") and self.worker:
+        if getattr(self, "info_job", None) is not None:
             try:
-                self.worker.stop()
-            except Exception:
-                pass
-        if hasattr(self, "worker_thread") and self.worker_thread:
-            try:
-                if self.worker_thread.isRunning():
-                    self.worker_thread.quit()
-                    if not self.worker_thread.wait(1500):
-                        try:
-                            self.worker_thread.terminate()
-                        except Exception:
-                            pass
-                        self.worker_thread.wait(500)
-            except Exception:
-                pass
-        if hasattr(self, "usage_sampler") and self.usage_sampler:
-            try:
-                self.usage_sampler.stop()
-            except Exception:
+                self.info_job.cancel()
+            except RuntimeError:
                 pass
-        if hasattr(self, "usage_thread") and self.usage_thread:
+            self.info_job = None
+        if getattr(self, "usage_sampler", None):
+            # The shared sampler parks once nothing watches it.
+            self.usage_sampler.detach(self._usage_demand)
             try:
-                if self.usage_thread.isRunning():
-                    self.usage_thread.quit()
-                    if not self.usage_thread.wait(1500):
-                        try:
-                            self.usage_thread.terminate()
-                        except Exception:
-                            pass
-                        self.usage_thread.wait(500)
-            except Exception:
+                self.usage_sampler.updated.disconnect(self._apply_usage)
+            except (RuntimeError, TypeError):
                 pass
 
     def _format_gb(self, bytes_value):
@@ -2311,24 +2359,6 @@ class AboutPanel(QWidget):
         self.net_link_bps = self._parse_link_speed_bps(net_speed)
         self._start_usage_sampler()
 
-        if hasattr(self, "worker") and self.worker:
-            try:
-                self.worker.stop()
-            except Exception:
-                pass
-        if hasattr(self, "worker_thread") and self.worker_thread:
-            try:
-                if self.worker_thread.isRunning():
-                    self.worker_thread.quit()
-                    if not self.worker_thread.wait(1500):
-                        try:
-                            self.worker_thread.terminate()
-                        except Exception:
-                            pass
-                        self.worker_thread.wait(500)
-            except Exception:
-                pass
-
     def _parse_link_speed_bps(self, text):
         if not text:
             return 0.0
@@ -2357,17 +2387,43 @@ class AboutPanel(QWidget):
                     pass
             return
         self._usage_running = True
-        self.usage_thread = QThread()
-        _track_thread(self.usage_thread)
-        self.usage_sampler = UsageSampler(interval=1.0, net_link_bps=self.net_link_bps)
+        self.usage_sampler = shared_usage_sampler()
+        self.usage_sampler.set_net_link_bps(self.net_link_bps)
         self.usage_sampler.set_drive_letter(self.drive_letter)
-        self.usage_sampler.moveToThread(self.usage_thread)
-        self.usage_thread.started.connect(self.usage_sampler.run)
         self.usage_sampler.updated.connect(self._apply_usage)
-        self.usage_sampler.aborted.connect(self.usage_thread.quit)
-        self.usage_sampler.aborted.connect(self.usage_sampler.deleteLater)
-        self.usage_thread.finished.connect(self.usage_thread.deleteLater)
-        self.usage_thread.start()
+        history = self.usage_sampler.history
+        for card, metric in ((self.cpu_card, "cpu"), (self.ram_card, "ram"), (self.gpu_card, "gpu"), (self.network_card, "net")):
+            if card.graph is not None:
+                card.graph.bind(history, metric)
+        self.storage_card.activity_graph.bind(history, "disk")
+        if self.usage_sampler.latest:
+            # Reopened: show the last reading right away (graphs already have it).
+            self._apply_usage(self.usage_sampler.latest)
+        self.usage_sampler.attach(self._usage_demand)
+
+    def _usage_demand(self):
+        window = self.window()
+        if not self.isVisible() or window is None or not window.isVisible() or window.isMinimized():
+            return DEMAND_NONE
+        if self.visibleRegion().isEmpty():
+            return DEMAND_NONE
+        for name in ("cpu_card", "ram_card", "gpu_card", "network_card"):
+            card = getattr(self, name, None)
+            if card is not None and getattr(card, "_expanded", False):
+                return DEMAND_GRAPH
+        if self.storage_card.details_container.isVisible():
+            return DEMAND_GRAPH
+        return DEMAND_NUMBERS
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.usage_sampler:
+            self.usage_sampler.poke()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.usage_sampler:
+            self.usage_sampler.poke()
 
     def _format_bps(self, bps):
         if bps is None:
@@ -2394,6 +2450,12 @@ class AboutPanel(QWidget):
 
         if hasattr(self, "cpu_card") and self.cpu_card:
             self.cpu_card.set_usage(cpu)
+            collector = data.get("collector") or {}
+            if collector.get("samples"):
+                tip = f"Sampling via {collector['backend']}: {collector['avg_cpu_ms']:.1f} ms CPU per sample"
+                if collector.get("helper_cpu_percent") is not None:
+                    tip += f", helpers {collector['helper_cpu_percent']:.1f}% CPU"
+                self.cpu_card.setToolTip(tip)
         if hasattr(self, "ram_card") and self.ram_card:
             self.ram_card.set_usage(ram)
         if hasattr(self, "gpu_card") and self.gpu_card:
@@ -2452,9 +2514,8 @@ class SettingRow(AnimatableWidget):
             layout.setContentsMargins(12, 0, 12, 0)
             layout.setSpacing(12)
 
-        self.label = QLabel(text)
+        self.label = ThemeLabel(text)
         self.label.setFont(QFont(FONT_FAMILY, 10))
-        self.label.setStyleSheet(f"color: {COLOR_TEXT_MAIN.name()}; background: transparent;")
         self.label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.label.setWordWrap(True)
         self.label.setMinimumHeight(20)
@@ -2471,18 +2532,11 @@ class SettingRow(AnimatableWidget):
                 else:
                     layout.addWidget(self.control, 0, Qt.AlignLeft | Qt.AlignVCenter)
 
-        self.anim = QPropertyAnimation(self, b"bg_color")
-        self.anim.setDuration(150)
-        self.anim.setEasingCurve(QEasingCurve.OutQuad)
-
     def enterEvent(self, event):
         if self.disable_hover:
             super().enterEvent(event)
             return
-        self.anim.stop()
-        self.anim.setStartValue(self._bg_color)
-        self.anim.setEndValue(COLOR_HOVER)
-        self.anim.start()
+        self.fade_bg_color(COLOR_HOVER)
         if isinstance(self.control, ToggleSwitch):
             self.control.set_hovered(True)
         if self._tooltip_text:
@@ -2493,10 +2547,7 @@ class SettingRow(AnimatableWidget):
         if self.disable_hover:
             super().leaveEvent(event)
             return
-        self.anim.stop()
-        self.anim.setStartValue(self._bg_color)
-        self.anim.setEndValue(QColor(0, 0, 0, 0))
-        self.anim.start()
+        self.fade_bg_color(QColor(0, 0, 0, 0))
         if isinstance(self.control, ToggleSwitch):
             self.control.set_hovered(False)
         self._tooltip_timer.stop()
@@ -2543,6 +2594,7 @@ class OptionsPanel(QWidget):
     software_notice_clicked = Signal()
     check_updates_clicked = Signal()
     updates_auto_check_toggled = Signal(bool)
+    indexed_settings_toggled = Signal(bool)
 
     hidden_toggled = Signal(bool)
     expand_default_toggled = Signal(bool)
@@ -2598,7 +2650,11 @@ class OptionsPanel(QWidget):
         self._all_rows_built = False
         self._has_rows_stretch = False
         self._build_queue = []
-        self._build_timer_active = False
+        self._build_job = None
+        # Scheduler token for this panel's background row builds.
+        self._build_token = object()
+        build_token = self._build_token
+        self.destroyed.connect(lambda *_: ui_scheduler.build_scheduler().cancel(build_token))
         self.base_dir = get_base_dir()
         self.background_type = self.settings.get("background_type", "theme")
         self.initial_category = self.settings.get("current_category", "Behavior")
@@ -2846,6 +2902,7 @@ class OptionsPanel(QWidget):
             "Export settings": "Save your current settings.ini to a file.",
             "Startup apps": "Apps that launch when the launcher starts.",
             "Fix settings": "Run the settings repair tool.",
+            "Store app settings in database": "Keep per-app favorites, renames and categories in settings.db (faster with many apps).",
             "Default browser": "Browser used for web searches.",
             "Restart app": "Restart the launcher.",
             "Exit application": "Close the launcher.",
@@ -2897,7 +2954,7 @@ class OptionsPanel(QWidget):
                 warning_row.disable_hover = True
                 warning_row.setCursor(Qt.ArrowCursor)
                 if hasattr(warning_row, "label") and warning_row.label:
-                    warning_row.label.setStyleSheet(f"color: {COLOR_ACCENT.name()}; background: transparent;")
+                    warning_row.label.set_text_role(TEXT_ACCENT)
                 self.add_row("Security", warning_row)
                 self.create_password_row = self.make_button_row(
                     "Create password",
@@ -3035,6 +3092,7 @@ class OptionsPanel(QWidget):
                 self.add_row("System", self.fix_settings_row)
                 self.add_row("System", self.make_button_row("Import settings", self.import_settings_clicked, button_text="Import", width=SMALL_CONTROL_WIDTH, height=SMALL_CONTROL_HEIGHT, font_size=SMALL_CONTROL_FONT_SIZE))
                 self.add_row("System", self.make_button_row("Export settings", self.export_settings_clicked, button_text="Export", width=SMALL_CONTROL_WIDTH, height=SMALL_CONTROL_HEIGHT, font_size=SMALL_CONTROL_FONT_SIZE))
+                self.add_row("System", self.make_toggle_row("Store app settings in database", self.settings.get("indexed_settings", False), self.indexed_settings_toggled, align_right=False))
                 self.add_row("System", self.make_browser_row(
                     self.settings.get("browser_choice", "system"),
                     self.settings.get("browser_path", "")
@@ -3079,19 +3137,26 @@ class OptionsPanel(QWidget):
                 continue
             if category not in self._build_queue:
                 self._build_queue.append(category)
-        if self._build_timer_active:
+        if self._build_job is not None:
             return
-        self._build_timer_active = True
-        QTimer.singleShot(0, self._process_build_queue)
+        # Rows only reachable through search: build them in frame-budgeted steps.
+        self._build_job = ui_scheduler.build_scheduler().submit(
+            self._build_next_category,
+            token=self._build_token,
+            priority=ui_scheduler.PRIORITY_BACKGROUND,
+            on_done=self._on_build_queue_done,
+        )
 
-    def _process_build_queue(self):
-        if not self._build_queue:
-            self._build_timer_active = False
-            return
-        category = self._build_queue.pop(0)
-        self.build_rows([category])
-        self.apply_category_filter(self.search_bar.input.text() if hasattr(self, "search_bar") else "")
-        QTimer.singleShot(0, self._process_build_queue)
+    def _build_next_category(self):
+        if self._build_queue:
+            category = self._build_queue.pop(0)
+            if category not in self._built_categories:
+                self.build_rows([category])
+                self.apply_category_filter(self.search_bar.input.text() if hasattr(self, "search_bar") else "")
+        return bool(self._build_queue)
+
+    def _on_build_queue_done(self):
+        self._build_job = None
 
     def _ensure_all_rows_built_async(self):
         if self._all_rows_built:
@@ -4095,50 +4160,25 @@ class OptionsPanel(QWidget):
             self._ensure_all_rows_built_async()
         self.apply_category_filter(text)
 
-    def apply_rainbow_text(self, color_hex):
-        for row in self.rows:
-            if hasattr(row, "label") and row.label:
-                row.label.setStyleSheet(f"color: {color_hex}; background: transparent;")
-        for btn in self.category_buttons.values():
-            if hasattr(btn, "label"):
-                btn.label.setStyleSheet(f"color: {color_hex}; background: transparent;")
-        if hasattr(self, "back_btn"):
-            self.back_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {qcolor_to_rgba(COLOR_GLASS_WHITE)};
-                    color: {color_hex};
-                    border: 1px solid {qcolor_to_rgba(COLOR_GLASS_BORDER)};
-                    border-radius: 6px;
-                    font-size: 12px;
-                }}
-                QPushButton:hover {{
-                    background: {qcolor_to_rgba(COLOR_HOVER)};
-                    border-color: {COLOR_ACCENT.name()};
-                    color: {color_hex};
-                }}
-            """)
-        if hasattr(self, "close_btn"):
-            self.close_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    color: {color_hex};
-                    border: none;
-                    font-weight: bold;
-                    font-size: 18px;
-                }}
-                QPushButton:hover {{
-                    color: {color_hex};
-                }}
-                QPushButton:pressed {{
-                    color: {COLOR_ACCENT.name()};
-                }}
-            """)
-        for btn, font_size in getattr(self, "_rainbow_buttons", []):
+    def apply_rainbow_text(self, color):
+        # Row and category labels repaint themselves from the rainbow driver;
+        # only the stylesheet-backed controls on screen follow via palette.
+        widgets = [getattr(self, "back_btn", None), getattr(self, "close_btn", None), getattr(self, "btn_keybind", None)]
+        if hasattr(self, "search_bar"):
+            widgets.append(self.search_bar.input)
+        widgets.extend(btn for btn, _font_size in getattr(self, "_rainbow_buttons", []))
+        for widget in widgets:
             try:
-                style = self.get_button_style(font_size=font_size).replace(COLOR_TEXT_MAIN.name(), color_hex)
-                btn.setStyleSheet(style)
-            except Exception:
+                if widget is not None and widget.isVisible():
+                    ui_rainbow.apply_palette_color(widget, color)
+            except RuntimeError:
                 pass
+        for combo in self.findChildren(ThemedComboBox):
+            if combo.isVisible():
+                combo.set_rainbow_text_color(color)
+        icon_lbl = getattr(getattr(self, "search_bar", None), "icon_lbl", None)
+        if icon_lbl is not None and icon_lbl.isVisible() and hasattr(icon_lbl, "set_color"):
+            icon_lbl.set_color(QColor(color))
 
     def _animate_back_btn_opacity(self, value):
         if not hasattr(self, "_back_btn_opacity") or not self._back_btn_opacity:
@@ -0,0 +1,113 @@
+import re
+import time
+import weakref
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
+from PySide6.QtGui import QColor, QPalette
+from config import *
+import ui_theme
+
+# ~30 fps; the hue moves 60 degrees a second, so faster ticks add nothing visible.
+FRAME_MS = 33
+
+# Colour of the current frame, or None while rainbow text is off.
+_current = None
+
+# `color:` declarations only (not background-color / selection-color).
+_COLOR_RULE = re.compile(r"(?<![\w-])color\s*:\s*[^;}]+;?")
+
+
+def current_color():
+    return _current
+
+
+def rainbow_color(now=None):
+    hue = int(((time.time() if now is None else now) * 60) % 360)
+    return QColor.fromHsv(hue, 255, 255)
+
+
+def strip_text_color(style):
+    """Drop text `color` rules from a stylesheet so the widget palette decides."""
+    return _COLOR_RULE.sub("", style)
+
+
+def set_text_palette(widget, color):
+    """Point every text role of widget's palette at color (no CSS involved)."""
+    palette = widget.palette()
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        palette.setColor(role, color)
+    widget.setPalette(palette)
+
+
+def apply_palette_color(widget, color):
+    """
+    Drive a widget's text colour through its palette. The stylesheet's
+    colour rules are stripped the first time (or after it was replaced), so
+    later frames are a palette swap instead of a CSS re-parse.
+    """
+    style = widget.styleSheet()
+    if style and widget.property("pxRainbowSheet") != style:
+        style = strip_text_color(style)
+        widget.setProperty("pxRainbowSheet", style)
+        widget.setStyleSheet(style)
+    set_text_palette(widget, color)
+
+
+class RainbowDriver(QObject):
+    """
+    The single clock behind rainbow text. Each frame it writes the colour into
+    the shared text colours, schedules a repaint of the shown ThemeLabels (Qt
+    folds those into one paint pass), recolours tracked widgets that are
+    visible and emits frame() for the few palette-driven controls left.
+    """
+
+    frame = Signal(QColor)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(FRAME_MS)
+        self._timer.timeout.connect(self._tick)
+        self._hue = None
+        self._tracked = weakref.WeakSet()
+
+    def track(self, widget):
+        """Follow the colour with widget's palette while it is visible (menus, popups)."""
+        self._tracked.add(widget)
+        if _current is not None:
+            apply_palette_color(widget, _current)
+
+    def is_active(self):
+        return self._timer.isActive()
+
+    def start(self):
+        if not self._timer.isActive():
+            self._timer.start()
+        self._tick()
+
+    def stop(self):
+        global _current
+        self._timer.stop()
+        self._hue = None
+        if _current is not None:
+            _current = None
+            ui_theme.repaint_labels()
+
+    def _tick(self):
+        global _current
+        color = rainbow_color()
+        if color.hue() == self._hue:
+            return
+        self._hue = color.hue()
+        _current = color
+        COLOR_TEXT_MAIN.setRgb(color.red(), color.green(), color.blue(), color.alpha())
+        COLOR_TEXT_SUB.setRgb(color.red(), color.green(), color.blue(), 160)
+        ui_theme.repaint_labels()
+        for widget in list(self._tracked):
+            try:
+                if widget.isVisible():
+                    apply_palette_color(widget, color)
+            except RuntimeError:
+                self._tracked.discard(widget)
+        self.frame.emit(color)
+
@@ -0,0 +1,105 @@
+import time
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+# Milliseconds of build work per event-loop pass; leaves the rest of a
+# 60 Hz frame for layout, paint and input.
+FRAME_BUDGET_MS = 8
+
+# Lower runs first. Rows that will be on screen go before the rest of a list,
+# which goes before work nobody is looking at yet (e.g. search-only rows).
+PRIORITY_VISIBLE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BACKGROUND = 2
+
+_build_scheduler = None
+
+
+def build_scheduler():
+    """The application-wide BuildScheduler (created on first use)."""
+    global _build_scheduler
+    if _build_scheduler is None:
+        _build_scheduler = BuildScheduler(QApplication.instance())
+    return _build_scheduler
+
+
+class BuildJob:
+    """
+    One incremental build. step() does a small unit of work and returns True
+    while more remains; on_done runs once when it has finished (never for a
+    cancelled job). priority may be changed while the job is queued.
+    """
+
+    def __init__(self, step, token=None, priority=PRIORITY_NORMAL, on_done=None, seq=0):
+        self.step = step
+        self.token = token
+        self.priority = priority
+        self.on_done = on_done
+        self.seq = seq
+        self.cancelled = False
+
+
+class BuildScheduler(QObject):
+    """
+    Runs BuildJobs cooperatively on the GUI thread. Each pass steps the most
+    urgent job (lowest priority, then oldest) until the frame budget is
+    spent, then yields to the event loop so the window can paint. Jobs
+    submitted with the same token can be cancelled together when the view
+    they build is replaced.
+    """
+
+    def __init__(self, parent=None, budget_ms=FRAME_BUDGET_MS):
+        super().__init__(parent)
+        self.budget_ms = budget_ms
+        self._jobs = []
+        self._seq = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run)
+
+    def submit(self, step, token=None, priority=PRIORITY_NORMAL, on_done=None):
+        self._seq += 1
+        job = BuildJob(step, token, priority, on_done, self._seq)
+        self._jobs.append(job)
+        if not self._timer.isActive():
+            self._timer.start()
+        return job
+
+    def cancel(self, token):
+        """Drop every queued job submitted with token."""
+        for job in self._jobs:
+            if job.token == token:
+                job.cancelled = True
+        self._jobs = [job for job in self._jobs if not job.cancelled]
+
+    def cancel_job(self, job):
+        job.cancelled = True
+        if job in self._jobs:
+            self._jobs.remove(job)
+
+    def pending(self, token=None):
+        return any(token is None or job.token == token for job in self._jobs)
+
+    def _run(self):
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        while self._jobs:
+            job = min(self._jobs, key=lambda j: (j.priority, j.seq))
+            try:
+                more = job.step()
+            except Exception as e:
+                print(f"Build job failed: {e}")
+                more = False
+            if not more and not job.cancelled:
+                # The step itself may have cancelled or replaced the job.
+                if job in self._jobs:
+                    self._jobs.remove(job)
+                if job.on_done:
+                    try:
+                        job.on_done()
+                    except Exception as e:
+                        print(f"Build job completion failed: {e}")
+            if time.perf_counter() >= deadline:
+                break
+        if self._jobs:
+            self._timer.start()
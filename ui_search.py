@@ -2,6 +2,8 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor, QPainter, QPen, QFont
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLineEdit
 from config import *
+import ui_chrome
+import ui_theme
 
 class SearchIcon(QWidget):
     def __init__(self, parent=None):
@@ -40,7 +42,7 @@ class SearchBar(QWidget):
         self.input = QLineEdit()
         self.input.setPlaceholderText("Search")
         self.input.setFont(QFont(FONT_FAMILY, 12))
-        self.input.setStyleSheet(f"""
+        ui_theme.bind_style(self.input, lambda: f"""
             QLineEdit {{
                 background: transparent;
                 border: none;
@@ -57,10 +59,7 @@ class SearchBar(QWidget):
         layout.addWidget(self.input)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
         # Draw the container shape
-        painter.setBrush(COLOR_GLASS_WHITE)
-        painter.setPen(QPen(COLOR_GLASS_BORDER, 1))
-        painter.drawRoundedRect(self.rect().adjusted(1,1,-1,-1), 6, 6)
+        layer = ui_chrome.rounded_panel(self.size(), self.devicePixelRatioF(), 6, COLOR_GLASS_WHITE, COLOR_GLASS_BORDER)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, layer)
@@ -1,11 +1,13 @@
 import os
 import shutil
-import configparser
-from PySide6.QtCore import Qt, QRect, QPropertyAnimation, QStorageInfo, Signal, QSize
+from PySide6.QtCore import Qt, QRect, QStorageInfo, Signal
 from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QFont, QPixmap, QLinearGradient, QIcon
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QFileDialog
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QFileDialog
 from config import *
 from ui_base import AnimatableWidget
+from ui_theme import ThemeLabel, TEXT_MAIN, TEXT_SUB
+import settings_store
+import ui_chrome
 
 class QuickAccessButton(AnimatableWidget):
     """
@@ -35,44 +37,40 @@ class QuickAccessButton(AnimatableWidget):
         # Icon Badge
         self.badge_color = QColor(255, 255, 255, 30)
         
-        self.label = QLabel(name)
+        self.label = ThemeLabel(name, role=TEXT_SUB)
         self.label.setFont(QFont(FONT_FAMILY, 10))
-        self.label.setStyleSheet(f"color: {COLOR_TEXT_SUB.name()}; background: transparent;")
         
         layout.addWidget(self.label)
         layout.addStretch()
 
-        self.anim = QPropertyAnimation(self, b"bg_color")
-        self.anim.setDuration(150)
-
     def enterEvent(self, event):
-        self.anim.stop()
+        self.stop_bg_fade()
         if not self._selected:
-            self.anim.setEndValue(COLOR_HOVER)
-            self.anim.start()
-            self.label.setStyleSheet(f"color: {COLOR_TEXT_MAIN.name()}; background: transparent;")
+            self.fade_bg_color(COLOR_HOVER)
+            self.label.set_text_role(TEXT_MAIN)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        self.anim.stop()
+        self.stop_bg_fade()
         if not self._selected:
-            self.anim.setEndValue(QColor(0, 0, 0, 0))
-            self.anim.start()
-            self.label.setStyleSheet(f"color: {COLOR_TEXT_SUB.name()}; background: transparent;")
+            self.fade_bg_color(QColor(0, 0, 0, 0))
+            self.label.set_text_role(TEXT_SUB)
         super().leaveEvent(event)
 
     def set_selected(self, selected):
+        self.stop_bg_fade()
         self._selected = selected
         if selected:
             self._bg_color = COLOR_HOVER
-            self.label.setStyleSheet(f"color: {COLOR_TEXT_MAIN.name()}; background: transparent;")
+            self.label.set_text_role(TEXT_MAIN)
         else:
             self._bg_color = QColor(0, 0, 0, 0)
-            self.label.setStyleSheet(f"color: {COLOR_TEXT_SUB.name()}; background: transparent;")
+            self.label.set_text_role(TEXT_SUB)
         self.update()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            self.stop_bg_fade()
             self._bg_color = COLOR_PRESSED
             self.update()
             self.clicked.emit(self.name)
@@ -170,13 +168,10 @@ class ProfilePicture(QWidget):
     def load_profile_pic(self):
         try:
             base_dir = get_base_dir()
-            settings_path = get_settings_path()
             fallback_path = os.path.join(base_dir, "PortableApps", "PortableX", "Graphics", "profilepic", "profile.png")
             loaded_pixmap = None
-            if os.path.exists(settings_path):
-                config = configparser.ConfigParser()
-                config.optionxform = str
-                config.read(settings_path)
+            config = settings_store.load_settings()
+            if config.sections():
                 if "User" in config and "ProfilePic" in config["User"]:
                     path = config["User"]["ProfilePic"]
                     if not os.path.isabs(path):
@@ -236,39 +231,29 @@ class ProfilePicture(QWidget):
         except Exception:
             saved_path = path
 
-        config = configparser.ConfigParser()
-        config.optionxform = str
-        config.read(settings_path)
+        config = settings_store.load_settings(settings_path)
         if "User" not in config:
             config["User"] = {}
         rel_path = os.path.relpath(saved_path, base_dir).replace("\\", "/")
         config["User"]["ProfilePic"] = rel_path
         if config.has_option("User", "profilepic"):
             config.remove_option("User", "profilepic")
-        with open(settings_path, 'w') as f:
-            config.write(f)
+        settings_store.save_settings(config, settings_path)
         return saved_path
 
     def paintEvent(self, event):
         painter = QPainter(self)
         try:
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            
-            # Clip to circle
-            path = QPainterPath()
-            path.addEllipse(0, 0, self.width(), self.height())
-            painter.setClipPath(path)
-
             if self.pixmap and not self.pixmap.isNull():
-                inset = 1
-                safe = int(min(self.width(), self.height()) * 0.96)
-                target = QSize(max(1, safe - inset * 2), max(1, safe - inset * 2))
-                scaled = self.pixmap.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                x = (self.width() - scaled.width()) // 2
-                y = (self.height() - scaled.height()) // 2
-                painter.drawPixmap(x, y, scaled)
+                # Scaled and clipped once per picture/size, not on every paint.
+                avatar = ui_chrome.circle_pixmap(self.pixmap, self.size(), self.devicePixelRatioF(), self.pixmap.cacheKey())
+                painter.drawPixmap(0, 0, avatar)
             else:
+                painter.setRenderHint(QPainter.Antialiasing)
+                path = QPainterPath()
+                path.addEllipse(0, 0, self.width(), self.height())
+                painter.setClipPath(path)
+
                 # Draw Circle Background
                 painter.setBrush(QColor(255, 255, 255, 30))
                 painter.setPen(Qt.NoPen)
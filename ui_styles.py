@@ -0,0 +1,122 @@
+from collections import OrderedDict
+
+# Rainbow text produces a new colour every tick; keep the cache bounded.
+MAX_CACHED_STYLES = 256
+
+_cache = OrderedDict()
+
+
+def invalidate():
+    """Drop every cached stylesheet (e.g. after the palette was replaced)."""
+    _cache.clear()
+
+
+def cached_style(kind, key, build):
+    """Return the stylesheet for (kind, *key), building it only on first use."""
+    full_key = (kind,) + tuple(key)
+    style = _cache.get(full_key)
+    if style is None:
+        style = build()
+        _cache[full_key] = style
+        if len(_cache) > MAX_CACHED_STYLES:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(full_key)
+    return style
+
+
+def _menu_palette(theme):
+    dark = theme == "dark"
+    bg = "#1b1f26" if dark else "#FDFDFD"
+    border = "rgba(255, 255, 255, 0.2)" if dark else "rgba(0, 0, 0, 0.2)"
+    return bg, border
+
+
+def _popup_rules(selector, theme, text_color, accent):
+    bg, border = _menu_palette(theme)
+    return f"""
+        {selector} {{
+            background-color: {bg};
+            color: {text_color};
+            border: 1px solid {border};
+            padding-left: 1px;
+        }}
+        {selector}::icon {{
+            margin-left: 1px;
+            margin-right: 4px;
+        }}
+        {selector}::item {{
+            padding: 6px 12px 6px 7px;
+            color: {text_color};
+        }}
+        {selector}::item:selected {{
+            background-color: {accent};
+            color: #ffffff;
+        }}
+    """
+
+
+def _item_rules(selector, theme, text_color, accent):
+    bg, border = _menu_palette(theme)
+    return f"""
+        {selector} {{
+            background-color: {bg};
+            color: {text_color};
+            border: 1px solid {border};
+        }}
+        {selector}::item {{
+            padding: 5px 20px;
+            color: {text_color};
+        }}
+        {selector}::item:selected {{
+            background-color: {accent};
+            color: #ffffff;
+        }}
+    """
+
+
+# Menus tagged with this dynamic property pick up the window-level rules.
+MENU_ROLE_PROPERTY = "pxMenu"
+MENU_ROLE_POPUP = "popup"
+MENU_ROLE_ITEM = "item"
+
+
+def window_menu_style(theme, text_color, accent):
+    """
+    Rules for every tagged QMenu under the launcher window. Set once on the
+    window, so opening a menu only sets a property instead of parsing CSS.
+    """
+    def _build():
+        popup = f'QMenu[{MENU_ROLE_PROPERTY}="{MENU_ROLE_POPUP}"]'
+        item = f'QMenu[{MENU_ROLE_PROPERTY}="{MENU_ROLE_ITEM}"]'
+        return _popup_rules(popup, theme, text_color, accent) + _item_rules(item, theme, text_color, accent)
+    return cached_style("window_menu", (theme, text_color, accent), _build)
+
+
+def menu_style(role, theme, text_color, accent):
+    """Per-menu variant of window_menu_style, for menus restyled on the fly (rainbow text)."""
+    rules = _popup_rules if role == MENU_ROLE_POPUP else _item_rules
+    return cached_style("menu", (role, theme, text_color, accent), lambda: rules("QMenu", theme, text_color, accent))
+
+
+def mini_menu_style(background, text_color, accent, border):
+    """Tray/mini menu sheet; `background` is a ready CSS background value."""
+    def _build():
+        return f"""
+            QMenu {{
+                background: {background};
+                border: 1px solid {border};
+                border-radius: 8px;
+                padding: 4px;
+                color: {text_color};
+            }}
+            QMenu::item {{
+                color: {text_color};
+                padding: 6px 20px;
+            }}
+            QMenu::item:selected {{
+                background-color: {accent};
+                color: #ffffff;
+            }}
+        """
+    return cached_style("mini_menu", (background, text_color, accent, border), _build)
@@ -0,0 +1,159 @@
+import weakref
+from PySide6.QtCore import Qt, QObject, QEvent, QTimer, Signal
+from PySide6.QtGui import QGuiApplication, QPainter, QPalette
+from PySide6.QtWidgets import QApplication, QLabel
+from config import *
+import ui_styles
+import ui_chrome
+
+# Text roles a ThemeLabel can paint with; resolved against the live config colours.
+TEXT_MAIN = "main"
+TEXT_SUB = "sub"
+TEXT_ACCENT = "accent"
+
+_ROLE_COLORS = {
+    TEXT_MAIN: COLOR_TEXT_MAIN,
+    TEXT_SUB: COLOR_TEXT_SUB,
+    TEXT_ACCENT: COLOR_ACCENT,
+}
+
+# ThemeLabels that are currently shown; hidden ones pick colours up when next painted.
+_shown_labels = weakref.WeakSet()
+# widget -> fn() returning its stylesheet, re-run when the theme changes.
+_bound_styles = weakref.WeakKeyDictionary()
+
+
+def repaint_labels():
+    """Schedule a repaint of every shown ThemeLabel (Qt merges them into one pass)."""
+    for label in list(_shown_labels):
+        try:
+            label.update()
+        except RuntimeError:
+            _shown_labels.discard(label)
+
+
+def bind_style(widget, build):
+    """
+    Set widget's stylesheet from build() and re-run it whenever the theme
+    changes, so the widget is restyled in place instead of rebuilt. build
+    must read the config colours when called and must not reference widget.
+    """
+    _bound_styles[widget] = build
+    widget.setStyleSheet(build())
+
+
+def restyle_bound():
+    for widget, build in list(_bound_styles.items()):
+        try:
+            style = build()
+            if widget.styleSheet() != style:
+                widget.setStyleSheet(style)
+        except RuntimeError:
+            _bound_styles.pop(widget, None)
+
+
+def system_theme_mode():
+    window_color = QApplication.palette().color(QPalette.Window)
+    return "dark" if window_color.lightness() < 128 else "light"
+
+
+class ThemeLabel(QLabel):
+    """
+    QLabel whose text colour is a theme role rather than a stylesheet value.
+    The colour is read from config at paint time, so theme, accent and
+    rainbow changes only need update() on the labels that are on screen.
+    """
+
+    def __init__(self, text="", parent=None, role=TEXT_MAIN):
+        super().__init__(text, parent)
+        self._role = role
+        self.setStyleSheet("background: transparent;")
+
+    def text_role(self):
+        return self._role
+
+    def set_text_role(self, role):
+        if role != self._role:
+            self._role = role
+            self.update()
+
+    def showEvent(self, event):
+        _shown_labels.add(self)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        _shown_labels.discard(self)
+        super().hideEvent(event)
+
+    def paintEvent(self, event):
+        if not self.text() or not self.isEnabled() or self.textFormat() == Qt.RichText:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.setPen(_ROLE_COLORS.get(self._role, COLOR_TEXT_MAIN))
+        rect = self.contentsRect()
+        margin = self.margin()
+        rect.adjust(margin, margin, -margin, -margin)
+        flags = self.alignment().value
+        if self.wordWrap():
+            flags |= Qt.TextWordWrap.value
+        painter.drawText(rect, flags, self.text())
+
+
+class ThemeManager(QObject):
+    """
+    Applies theme, accent and text colour changes to the live widget tree:
+    config colours are updated in place, cached stylesheets and chrome
+    layers are dropped, bound stylesheets are re-run and the window is
+    repainted once. Also follows the OS light/dark setting while the mode
+    is "system".
+    """
+
+    theme_changed = Signal(str)
+    system_theme_changed = Signal(str)
+
+    # OS theme switches arrive as a burst of palette/theme events.
+    SYSTEM_CHANGE_DELAY_MS = 150
+
+    def __init__(self, window):
+        super().__init__(window)
+        self._window = window
+        self.effective = None
+        self._system_mode = system_theme_mode()
+        self._system_timer = QTimer(self)
+        self._system_timer.setSingleShot(True)
+        self._system_timer.setInterval(self.SYSTEM_CHANGE_DELAY_MS)
+        self._system_timer.timeout.connect(self._check_system_mode)
+        window.installEventFilter(self)
+        try:
+            QGuiApplication.styleHints().colorSchemeChanged.connect(lambda _scheme: self._system_timer.start())
+        except AttributeError:
+            pass
+
+    def apply(self, mode, accent_color="", text_color=""):
+        """Make mode/accent/text colour current and push it to existing widgets; returns the effective theme."""
+        effective = system_theme_mode() if mode == "system" else mode
+        apply_theme(effective)
+        if accent_color:
+            apply_accent_color(accent_color)
+        if text_color and text_color != "__rainbow__":
+            apply_text_color(text_color)
+        self.effective = effective
+        ui_styles.invalidate()
+        ui_chrome.invalidate()
+        restyle_bound()
+        self.theme_changed.emit(effective)
+        self._window.update()
+        repaint_labels()
+        return effective
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.ApplicationPaletteChange, QEvent.ThemeChange):
+            self._system_timer.start()
+        return False
+
+    def _check_system_mode(self):
+        mode = system_theme_mode()
+        if mode != self._system_mode:
+            self._system_mode = mode
+            self.system_theme_changed.emit(mode)